@@ -0,0 +1,111 @@
+"""Keyword pre-router for the chat orchestrator.
+
+Most chat queries name their topic outright ("alerts in Texas", "shelters near
+Miami"), so the orchestrator's LLM routing turn is skipped when one workflow
+clearly wins on keyword hits. Ties and queries with no hits still go to the LLM.
+Queries that may end up at the alerts workflow and name a state also start
+that state's alerts fetch right away, so it overlaps the routing turn.
+"""
+
+import re
+import logging
+from typing import Optional
+
+from google.genai import types
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmResponse, LlmRequest
+
+from .tools.tools import find_states, prefetch_nws_alerts
+from .sub_agents.alerts_snapshot_agent.agent import alerts_snapshot_workflow
+from .sub_agents.forecast_agent.agent import forecast_workflow
+from .sub_agents.risk_analysis_agent.agent import risk_analysis_workflow
+from .sub_agents.emergency_resources_agent.agent import emergency_resources_workflow
+from .sub_agents.hurricane_simulation_agent.agent import hurricane_analysis_workflow
+
+logger = logging.getLogger(__name__)
+
+
+def _keyword_pattern(*keywords: str) -> re.Pattern:
+    """Compile keywords into one alternation (longest phrases first)"""
+    alternatives = sorted((re.escape(k).replace(r"\ ", r"\s+") for k in keywords), key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")(?:s|es)?\b", re.I)
+
+
+# Keyword tables follow the workflow descriptions in the orchestrator prompt
+ROUTES = (
+    (alerts_snapshot_workflow.name, _keyword_pattern(
+        "alert", "warning", "watch", "advisory", "active alert", "emergency alert")),
+    (forecast_workflow.name, _keyword_pattern(
+        "forecast", "weather", "temperature", "conditions", "rain", "snow", "7-day", "hourly")),
+    (risk_analysis_workflow.name, _keyword_pattern(
+        "risk", "danger", "safety", "threat", "vulnerable", "impact", "population at risk")),
+    (emergency_resources_workflow.name, _keyword_pattern(
+        "shelter", "hospital", "evacuation route", "emergency facility", "find resources", "cooling center")),
+    (hurricane_analysis_workflow.name, _keyword_pattern(
+        "hurricane", "satellite", "image", "evacuation priority", "hurricane category", "tropical storm")),
+)
+
+# State key recording which workflow the router dispatched, so its result can
+# be returned without a summarization turn
+ROUTED_WORKFLOW_KEY = "routed_workflow"
+
+
+def route(user_msg: str) -> Optional[str]:
+    """Return the workflow a query clearly maps to, or None if it is ambiguous"""
+    scores = sorted(
+        ((len({m.group(0).casefold() for m in pattern.finditer(user_msg)}), name) for name, pattern in ROUTES),
+        reverse=True
+    )
+    (best, workflow), (runner_up, _) = scores[0], scores[1]
+    if best == 0 or best == runner_up:
+        return None
+    return workflow
+
+
+def route_to_workflow(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: call the matching workflow without an LLM routing turn.
+
+    When the routed workflow's result comes back, it is returned as the
+    orchestrator's answer directly instead of asking the model to restate it.
+    """
+    if not llm_request.contents:
+        return None
+    last = llm_request.contents[-1]
+    if not last.parts:
+        return None
+
+    routed = callback_context.state.get(ROUTED_WORKFLOW_KEY)
+    if routed:
+        callback_context.state[ROUTED_WORKFLOW_KEY] = None
+        responses = [part.function_response for part in last.parts if part.function_response]
+        if len(responses) == 1 and responses[0].name == routed:
+            result = (responses[0].response or {}).get("result")
+            if isinstance(result, str) and result:
+                return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=result)]))
+            return None
+
+    # Only route fresh user text; images and tool results go to the LLM
+    if last.role != "user" or any(part.function_response or part.inline_data for part in last.parts):
+        return None
+
+    user_msg = " ".join(part.text for part in last.parts if part.text).strip()
+    workflow = route(user_msg) if user_msg else None
+    
+    # Alerts are likely unless another workflow clearly won; one wasted
+    # (cached) request on a misroute is cheaper than waiting for the fetch later
+    if workflow in (None, alerts_snapshot_workflow.name):
+        states = find_states(user_msg)
+        if states:
+            prefetch_nws_alerts(states)
+    
+    if not workflow:
+        return None
+
+    logger.info(f"🧭 ROUTED: {callback_context.agent_name} → {workflow}")
+    callback_context.state[ROUTED_WORKFLOW_KEY] = workflow
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[types.Part(function_call=types.FunctionCall(name=workflow, args={"request": user_msg}))]
+        )
+    )
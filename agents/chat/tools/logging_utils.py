@@ -1,4 +1,7 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Configure logging
 logging.basicConfig(
@@ -7,20 +10,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 80
+
+
+def _log_in_background():
+    """Hand root log records to a queue drained by a listener thread.
+    
+    Agent callbacks only enqueue records; writing to stdout / Cloud Logging
+    happens off the request path. Safe to call from every copy of this module.
+    """
+    root = logging.getLogger()
+    if not root.handlers or any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_log_in_background()
+
 # Callback functions for agent lifecycle logging
 def log_agent_entry(callback_context, llm_request):
     """Logs when an agent is about to be executed."""
-    logger.info("="*80)
-    logger.info(f"🔄 AGENT ENTRY / TRANSFER: {callback_context.agent_name}")
-    logger.info("="*80)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_SEP)
+    logger.info("🔄 AGENT ENTRY / TRANSFER: %s", callback_context.agent_name)
+    logger.info(_SEP)
 
 def log_agent_exit(callback_context, llm_response):
     """Logs when an agent has finished execution."""
-    logger.info("="*80)
-    logger.info(f"✅ AGENT EXIT: {callback_context.agent_name}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_SEP)
+    logger.info("✅ AGENT EXIT: %s", callback_context.agent_name)
     # Optionally log the type of response (e.g., function call)
     if llm_response.content and llm_response.content.parts:
         for part in llm_response.content.parts:
             if part.function_call:
-                logger.info(f"   ↪️ Suggested Action: Call tool '{part.function_call.name}'")
-    logger.info("="*80)
+                logger.info("   ↪️ Suggested Action: Call tool '%s'", part.function_call.name)
+    logger.info(_SEP)
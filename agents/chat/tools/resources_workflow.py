@@ -0,0 +1,239 @@
+"""Emergency resources workflow, shared by the standalone resources agent and the chat sub-agent.
+
+Each deployable agent directory gets a copy of shared_tools as tools/, so
+both call build_emergency_resources_workflow() instead of keeping their own
+agent.py copy.
+"""
+
+import math
+import logging
+import functools
+from typing import Any, AsyncGenerator, List, Dict
+
+from google.genai import types
+from google.adk.agents import BaseAgent, LlmAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from .schemas import Coordinates, Facility, EvacuationRoute, EmergencyResourcesSummary
+from .tools import geocode_address, search_nearby_places, search_nearby_places_multi, get_directions, get_directions_batch, run_in_thread
+from .logging_utils import log_agent_entry, log_agent_exit
+from .llm import gemini
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-2.5-flash-lite"
+
+
+# Phase 1: Resource Finder - geocodes the location and searches in one agent turn
+RESOURCE_FINDER_INSTRUCTION = """
+    You are a dynamic emergency resource locator.
+
+    **CONTEXT:**
+    The user has provided a `location`, a `resourceType` (e.g., 'shelters', 'hospitals', 'pharmacies'), and a `radius`.
+
+    **YOUR TASK:**
+    1.  Call `geocode_address` with the user's location to get its coordinates.
+    2.  Identify the `resourceType` and `radius` from the user input (radius is in miles; the tools take meters, 1 mile = 1609 m).
+    3.  Map the `resourceType` to the correct `place_type` for the tool:
+        - 'shelters' -> 'emergency shelter'
+        - 'hospitals' -> 'hospital'
+        - 'pharmacies' -> 'pharmacy'
+    4.  Call the `search_nearby_places` tool with the geocoded coordinates as "lat,lng", the radius, and the correct `place_type`.
+        - If the user asked for more than one resource type (e.g. shelters AND hospitals), make ONE call to
+          `search_nearby_places_multi` with all the `place_types` instead - the searches run concurrently.
+    5.  Store the results for the next agent.
+    """
+
+# Phase 2: Route Calculator
+ROUTE_CALCULATOR_INSTRUCTION = """
+    You are an evacuation route specialist.
+    
+    **Your Task:**
+    Calculate evacuation routes from the user's location to the nearest safe facilities.
+    
+    **Process:**
+    1. Extract origin location from state["geocode_result"]["formatted_address"]
+    2. Identify safe destinations (use nearest shelters from state["facilities"])
+    3. For the top 3 nearest shelters, make ONE get_directions_batch call (the routes are fetched concurrently):
+       - origin: from state["geocode_result"]["formatted_address"]
+       - destinations: the 3 shelter addresses
+       - alternatives: true (to get multiple route options)
+       For a single destination named by the user, call get_directions instead.
+    4. Extract route details from each direction:
+       - Distance (miles)
+       - estimated travel time
+       - Route description
+       - Key waypoints
+    5. Prioritize routes by distance and time
+    6. Store route data for formatter
+    
+    Pass the route data to the resource formatter.
+    """
+
+# Phase 3: Final Synthesizer - Assembles the summary in Python (no model call)
+EARTH_RADIUS_MILES = 3958.8
+
+# search_nearby_places place_type → EmergencyResourcesSummary list; other
+# place types (gas_station, police, ...) have no list and are left out
+FACILITY_LISTS = {
+    "hospital": "hospitals",
+    "pharmacy": "pharmacies",
+    "emergency shelter": "shelters",
+    "shelter": "shelters",
+}
+
+
+def _distance_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in miles"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+class ResourcesSummaryAssembler(BaseAgent):
+    """Builds EmergencyResourcesSummary from the tool results saved during this run"""
+    
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        # Session state keeps geocodes and searches from earlier requests, so
+        # only this run's function responses are used
+        origin = {}
+        searches = {}
+        directions = []
+        for event in ctx.session.events:
+            if event.invocation_id != ctx.invocation_id:
+                continue
+            for response in event.get_function_responses():
+                result = response.response or {}
+                if result.get("status") != "success":
+                    continue
+                if response.name == "geocode_address":
+                    origin = result.get("result") or {}
+                elif response.name == "search_nearby_places":
+                    search = result.get("result") or {}
+                    searches[search.get("place_type")] = search
+                elif response.name == "search_nearby_places_multi":
+                    searches.update(result.get("results") or {})
+                elif response.name == "get_directions":
+                    directions.append(result.get("result") or {})
+                elif response.name == "get_directions_batch":
+                    directions.extend(result.get("results") or [])
+        
+        lists = {"hospitals": [], "shelters": [], "pharmacies": []}
+        for place_type, search in searches.items():
+            facility_list = FACILITY_LISTS.get((place_type or "").lower())
+            if facility_list is None:
+                logger.info(f"Leaving out '{place_type}' places: no facility list for that type")
+                continue
+            lists[facility_list].extend(self._facilities(origin, search))
+        for facilities in lists.values():
+            facilities.sort(key=lambda facility: facility.distance)
+        
+        routes = []
+        for result in directions:
+            if result.get("routes"):
+                best = result["routes"][0]
+                routes.append((best.get("duration_seconds") or 0, EvacuationRoute.model_construct(
+                    destination=result.get("destination") or best.get("end_address", ""),
+                    distance=best.get("distance", ""),
+                    duration=best.get("duration", ""),
+                    summary=best.get("summary", ""),
+                )))
+        routes = [route for _, route in sorted(routes, key=lambda item: item[0])]
+        
+        summary = EmergencyResourcesSummary.model_construct(
+            **lists,
+            evacuation_routes=routes,
+            insights=self._insights(origin, lists, routes),
+        )
+        counts = ", ".join(f"{len(facilities)} {name}" for name, facilities in lists.items())
+        logger.info(f"✅ Assembled resources summary: {counts}, {len(routes)} routes")
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=summary.model_dump_json())]),
+            actions=EventActions(state_delta={"final_summary": summary.model_dump()}),
+        )
+    
+    @staticmethod
+    def _facilities(origin: Dict[str, Any], search: Dict[str, Any]) -> List[Facility]:
+        facilities = []
+        for place in search.get("places", []):
+            location = place.get("location") or {}
+            if "lat" not in location or "lng" not in location:
+                continue
+            distance = _distance_miles(origin["latitude"], origin["longitude"], location["lat"], location["lng"]) \
+                if "latitude" in origin else 0.0
+            facilities.append(Facility.model_construct(
+                name=place.get("name") or "Unknown",
+                address=place.get("address") or "",
+                distance=round(distance, 1),
+                phone=None,
+                coordinates=Coordinates.model_construct(lat=location["lat"], lng=location["lng"]),
+            ))
+        return facilities
+    
+    @staticmethod
+    def _insights(origin: Dict[str, Any], lists: Dict[str, List[Facility]], routes: List[EvacuationRoute]) -> str:
+        place = origin.get("formatted_address") or "the requested location"
+        if not any(lists.values()) and not routes:
+            return f"No emergency resources or evacuation routes were found near {place}. Call 911 in an emergency."
+        parts = []
+        for resource_type, facilities in lists.items():
+            if facilities:
+                nearest = facilities[0]
+                parts.append(
+                    f"Found {len(facilities)} {resource_type} near {place}; the nearest is {nearest.name} "
+                    f"({nearest.distance} mi, {nearest.address})."
+                )
+        if routes:
+            fastest = routes[0]
+            parts.append(
+                f"{len(routes)} evacuation route(s) calculated; to {fastest.destination}: "
+                f"{fastest.distance}, about {fastest.duration} via {fastest.summary}."
+            )
+        parts.append("Call ahead to confirm availability, and follow local emergency officials' instructions.")
+        return " ".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def build_emergency_resources_workflow(model: str = DEFAULT_MODEL) -> SequentialAgent:
+    """Build the emergency resources pipeline (cached - repeated calls return the same agent).
+    
+    Resource Finder → Route Calculator → Final Synthesizer; the synthesizer
+    assembles the summary without a model call.
+    """
+    resource_finder = LlmAgent(
+        model=gemini(model),
+        name="resource_finder",
+        description="Finds emergency resources (shelters, hospitals, pharmacies) near a location based on user-specified type and radius.",
+        instruction=RESOURCE_FINDER_INSTRUCTION,
+        tools=[run_in_thread(geocode_address), run_in_thread(search_nearby_places), search_nearby_places_multi],
+        output_key="facilities",
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit,
+    )
+    
+    route_calculator = LlmAgent(
+        model=gemini(model),
+        name="route_calculator",
+        description="Calculates evacuation routes from the location",
+        instruction=ROUTE_CALCULATOR_INSTRUCTION,
+        tools=[run_in_thread(get_directions), get_directions_batch],
+        output_key="routes",
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit,
+    )
+    
+    final_synthesizer = ResourcesSummaryAssembler(
+        name="final_synthesizer",
+        description="Synthesizes all collected data into the final structured output.",
+    )
+    
+    return SequentialAgent(
+        name="emergency_resources_pipeline",
+        description="Finds emergency shelters, hospitals, and evacuation routes near a location with distance-sorted recommendations",
+        sub_agents=[resource_finder, route_calculator, final_synthesizer],
+    )
@@ -0,0 +1,91 @@
+"""Structured output schemas shared by the alerts, forecast and emergency resources workflows"""
+
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class FrozenModel(BaseModel):
+    """Immutable schema base: values are validated once on construction and never reassigned"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class AlertDetail(FrozenModel):
+    """Individual weather alert details"""
+    event: str = Field(description="Alert event type (e.g., Tornado Warning)")
+    severity: str = Field(description="Alert severity level")
+    headline: str = Field(description="Alert headline")
+    description: str = Field(description="Full detailed alert description")
+    description_short: str = Field(description="Shortened description for card display (max 150 chars)")
+    affected_zones: list[str] = Field(description="List of affected zones")
+    start_time: str = Field(description="Alert start time")
+    end_time: str = Field(description="Alert end time")
+
+
+class AlertsFormatterOutput(FrozenModel):
+    """Intermediate output from alerts formatter (without map data)"""
+    alerts: list[AlertDetail] = Field(description="List of active weather alerts")
+    total_count: int = Field(description="Total number of alerts")
+    severe_count: int = Field(description="Number of severe/extreme alerts")
+    locations: list[str] = Field(description="List of affected locations")
+    insights: str = Field(description="Summary and safety recommendations")
+
+
+class AlertsSummary(FrozenModel):
+    """Final structured output for weather alerts analysis with map data"""
+    alerts: list[AlertDetail] = Field(description="List of active weather alerts")
+    total_count: int = Field(description="Total number of alerts")
+    severe_count: int = Field(description="Number of severe/extreme alerts")
+    locations: list[str] = Field(description="List of affected locations")
+    insights: str = Field(description="Summary and safety recommendations")
+    map_data: Optional[dict[str, Any]] = Field(description="Data for generating a map of alert locations")
+
+
+class Coordinates(BaseModel):
+    """Geographic coordinates"""
+    lat: float = Field(description="Latitude")
+    lng: float = Field(description="Longitude")
+
+
+class Facility(BaseModel):
+    """Emergency facility details"""
+    name: str = Field(description="Facility name")
+    address: str = Field(description="Full address")
+    distance: float = Field(description="Distance in miles")
+    phone: Optional[str] = Field(description="Phone number")
+    coordinates: Coordinates = Field(description="Geographic coordinates")
+
+
+class EvacuationRoute(BaseModel):
+    """Evacuation route details"""
+    destination: str = Field(description="Destination address")
+    distance: str = Field(description="Total distance")
+    duration: str = Field(description="Estimated travel time")
+    summary: str = Field(description="Route summary (e.g., I-10 E and I-75 S)")
+
+
+class EmergencyResourcesSummary(BaseModel):
+    """Structured output for emergency resources"""
+    hospitals: list[Facility] = Field(description="List of nearby hospitals")
+    shelters: list[Facility] = Field(description="List of nearby emergency shelters")
+    pharmacies: list[Facility] = Field(description="List of nearby pharmacies")
+    evacuation_routes: list[EvacuationRoute] = Field(description="Recommended evacuation routes")
+    insights: str = Field(description="Summary and safety recommendations")
+
+
+class DailyForecast(BaseModel):
+    """Individual day forecast"""
+    date: str = Field(description="Date in YYYY-MM-DD format")
+    day: str = Field(description="Day of the week")
+    high_temp: int = Field(description="High temperature in Fahrenheit")
+    low_temp: int = Field(description="Low temperature in Fahrenheit")
+    conditions: str = Field(description="Main weather conditions (e.g., Sunny, Partly Cloudy)")
+    precipitation_chance: int = Field(description="Chance of precipitation as a percentage")
+
+
+class ForecastSummary(BaseModel):
+    """Structured output for weather forecast analysis"""
+    location: str = Field(description="The city and state of the forecast (e.g., San Francisco, CA)")
+    coordinates: dict[str, float] = Field(description="Latitude and longitude of the location")
+    current_conditions: str = Field(description="Current weather conditions")
+    daily_forecasts: list[DailyForecast] = Field(description="List of daily forecast details for the next 7 days")
+    insights: str = Field(description="Summary of the forecast and any planning advice or notable weather patterns")
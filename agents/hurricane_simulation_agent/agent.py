@@ -7,13 +7,18 @@ load_dotenv()
 import logging
 from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from google.genai import types
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
 from .tools.tools import (
-    get_flood_risk_data,
-    calculate_evacuation_priority
+    get_flood_risk_data_multi,
+    calculate_evacuation_priority,
+    prefetch_flood_risk_data,
+    run_in_thread
 )
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.llm import gemini, use_cached_output_schema
 
 # Configure logging
 logging.basicConfig(
@@ -51,7 +56,7 @@ class EvacuationPlan(BaseModel):
 # Hurricane Image Analysis Agent
 hurricane_image_analysis_agent = LlmAgent(
     name="hurricane_image_analysis_agent",
-    model="gemini-2.5-flash",
+    model=gemini("gemini-2.5-flash"),
     description="Analyzes hurricane images to extract key data.",
     instruction="""
     Analyze the provided hurricane image to extract its category, affected states, and geographic bounding box.
@@ -64,19 +69,27 @@ hurricane_image_analysis_agent = LlmAgent(
     """,
     output_schema=HurricaneData,
     output_key="hurricane_data",
-    before_model_callback=log_agent_entry,
+    before_model_callback=[log_agent_entry, use_cached_output_schema],
     after_model_callback=log_agent_exit
 )
 
+def prefetch_hurricane_flood_data(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: start the affected states' flood queries while the model writes its tool calls"""
+    hurricane_data = callback_context.state.get("hurricane_data")
+    if isinstance(hurricane_data, dict):
+        prefetch_flood_risk_data(hurricane_data.get("states") or [])
+    return None
+
+
 # Evacuation Coordinator Agent (Simplified for this workflow)
 evacuation_coordinator_agent = LlmAgent(
     name="evacuation_coordinator_agent",
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     description="Orchestrates hurricane evacuation priority analysis.",
     instruction="""Coordinate evacuation priority analysis using hurricane and flood risk data.
 
 Your Workflow:
-1. Use the hurricane_data from the state to call get_flood_risk_data for each affected state.
+1. Use the hurricane_data from the state to call get_flood_risk_data_multi once with all affected states (the states are fetched concurrently).
 2. Once the flood data is available, call calculate_evacuation_priority with the hurricane intensity.
 3. CRITICAL: Synthesize the tool responses into the EvacuationPlan output schema format.
 
@@ -94,18 +107,18 @@ Do NOT return raw tool responses. Transform the tool data into the final schema.
 
 The insights should include geographic_distribution, risk_patterns, evacuation_recommendations, and resource_allocation as string fields.""",
     tools=[
-        get_flood_risk_data,
-        calculate_evacuation_priority
+        get_flood_risk_data_multi,
+        run_in_thread(calculate_evacuation_priority)
     ],
     output_key="evacuation_plan",
-    before_model_callback=log_agent_entry,
+    before_model_callback=[log_agent_entry, prefetch_hurricane_flood_data],
     after_model_callback=log_agent_exit
 )
 
 # Evacuation Plan Formatter Agent
 evacuation_plan_formatter = LlmAgent(
     name="evacuation_plan_formatter",
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     description="Formats the evacuation data into the final EvacuationPlan schema.",
     instruction="""
     You are a data formatting specialist. Your task is to convert the state data into the final EvacuationPlan schema.
@@ -137,7 +150,7 @@ evacuation_plan_formatter = LlmAgent(
     """,
     output_schema=EvacuationPlan,
     output_key="final_evacuation_plan",
-    before_model_callback=log_agent_entry,
+    before_model_callback=[log_agent_entry, use_cached_output_schema],
     after_model_callback=log_agent_exit
 )
 
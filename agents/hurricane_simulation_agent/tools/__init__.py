@@ -3,13 +3,17 @@ from .tools import (
     get_weather_statistics,
     get_nws_forecast,
     get_nws_alerts,
+    get_nws_alerts_multi,
     get_current_conditions,
     get_hourly_forecast,
     get_hurricane_track,
     geocode_address,
     get_directions,
+    get_directions_batch,
     search_nearby_places,
-    generate_map
+    search_nearby_places_multi,
+    generate_map,
+    run_in_thread
 )
 
 __all__ = [
@@ -17,11 +21,15 @@ __all__ = [
     "get_weather_statistics",
     "get_nws_forecast",
     "get_nws_alerts",
+    "get_nws_alerts_multi",
     "get_current_conditions",
     "get_hourly_forecast",
     "get_hurricane_track",
     "geocode_address",
     "get_directions",
+    "get_directions_batch",
     "search_nearby_places",
-    "generate_map"
+    "search_nearby_places_multi",
+    "generate_map",
+    "run_in_thread"
 ]
@@ -0,0 +1,301 @@
+"""Forecast workflow, shared by the standalone forecast agent and the chat sub-agent.
+
+Geocoding and the NWS forecast are fetched in Python and the 7-day table is
+built from the NWS periods; the only model call writes the planning insights.
+Results are replayed for the same location within the hour (NWS updates hourly).
+"""
+
+import re
+import json
+import asyncio
+import logging
+import functools
+from datetime import date
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from google.genai import types
+from google.adk.agents import BaseAgent, LlmAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.events import Event, EventActions
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.tools.tool_context import ToolContext
+
+from .schemas import DailyForecast, ForecastSummary
+from .cached_workflow import CachedWorkflow, normalize_request
+from .tools import geocode_address, get_nws_forecast, run_in_thread
+from .logging_utils import log_agent_entry, log_agent_exit
+from .llm import gemini
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-2.5-flash-lite"
+
+
+# Phase 1: Geocoder - LLM fallback for requests whose location is not spelled out
+GEOCODER_INSTRUCTION = """
+    You are a geocoding specialist. Your task is to convert a location name (e.g., "San Francisco, CA") into geographic coordinates.
+
+    **CRITICAL**: You MUST use the `geocode_address` tool to get the coordinates.
+
+    The tool saves the result for the next agents; reply with one short line
+    naming the location you geocoded.
+    """
+
+# "forecast for Miami, FL", "weather in Denver this weekend" - the trailing time
+# phrase is not part of the place name
+LOCATION_PATTERN = re.compile(
+    r"\b(?:forecast|weather|conditions|temperatures?)\s+(?:for|in|at|near|around)\s+(?P<location>[^?!\n]+)", re.I
+)
+TIME_SUFFIX_PATTERN = re.compile(
+    r"\s+(?:today|tonight|tomorrow|this\s+week(?:end)?|next\s+\w+|over\s+the\s+next\b.*|for\s+the\s+(?:next|coming)\b.*)$", re.I
+)
+# Where a compound request moves on from the place: "Miami and any alerts in
+# Florida", "Denver, and should I evacuate". Lowercase only, so state codes
+# such as "Portland, OR" stay part of the place
+CLAUSE_BOUNDARY_PATTERN = re.compile(
+    r"\s+(?:and|but|or|with|so|then|plus)\b|\s*;|,\s*(?:and|but|or|so|then|also|plus|please|should|will|would"
+    r"|could|can|do|does|did|is|are|was|were|what|when|where|which|who|how|why|any|tell|show|give|find|check)\b"
+)
+# Captures that are not places: "weather in general", "forecast for my area"
+NOT_A_PLACE_PATTERN = re.compile(
+    r"^(?:(?:the|my|this|our|your)\s+)?(?:general|here|there|area|location|region|city|town|neighbou?rhood"
+    r"|future|meantime|moment|past|world|day|week|weekend|month|year)$", re.I
+)
+
+
+def find_location(text: str) -> Optional[str]:
+    """Location named after "forecast for" / "weather in" etc., or None"""
+    match = LOCATION_PATTERN.search(text)
+    if not match:
+        return None
+    location = CLAUSE_BOUNDARY_PATTERN.split(match.group("location"), maxsplit=1)[0]
+    location = TIME_SUFFIX_PATTERN.sub("", location.strip(" .,")).strip(" .,")
+    if not location or NOT_A_PLACE_PATTERN.match(location):
+        return None
+    return location
+
+
+class ForecastFetcher(BaseAgent):
+    """Geocodes the requested location and fetches its NWS forecast without an LLM turn.
+
+    When no location can be read from the request (or it fails to geocode),
+    the LLM geocoder works it out instead. The tools save state["geocode_result"]
+    and state["forecast_data"].
+    """
+    geocoder: LlmAgent
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        request = " ".join(part.text for part in (ctx.user_content.parts or []) if part.text) \
+            if ctx.user_content else ""
+        location = find_location(request)
+        # Cleared first so a failed geocode or forecast does not fall back to an
+        # earlier request's location and forecast in the session
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"geocode_result": None, "forecast_data": None, "forecast_insights": None}),
+        )
+        tool_context = ToolContext(ctx)
+
+        geocode = None
+        if location:
+            logger.info(f"⚡ Geocoding {location} without an LLM turn")
+            result = await asyncio.to_thread(geocode_address, tool_context, location)
+            geocode = result.get("result") if result.get("status") == "success" else None
+        if geocode is None:
+            async for event in self.geocoder.run_async(ctx):
+                yield event
+            geocode = ctx.session.state.get("geocode_result")
+
+        if isinstance(geocode, dict) and "latitude" in geocode:
+            await asyncio.to_thread(get_nws_forecast, tool_context, geocode["latitude"], geocode["longitude"])
+        else:
+            logger.warning(f"No coordinates for forecast request: {request[:100]}")
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=tool_context.actions,
+        )
+
+
+# Phase 2: Daily table - NWS 7-day periods alternate day and night; a night
+# period starts on the evening of the day it belongs to
+FORECAST_DAYS = 7
+
+
+def daily_forecasts(periods: List[Dict[str, Any]]) -> List[DailyForecast]:
+    """Fold the NWS day/night periods into one entry per date"""
+    days: Dict[str, Dict[str, Any]] = {}
+    for period in periods:
+        day_key = (period.get("start_time") or "")[:10]
+        if not day_key or period.get("temperature") is None:
+            continue
+        day = days.setdefault(day_key, {"high": None, "low": None, "conditions": None, "precipitation": 0})
+        if period.get("is_daytime"):
+            day["high"] = period["temperature"]
+            day["conditions"] = period.get("short_forecast")
+        else:
+            day["low"] = period["temperature"]
+            day["conditions"] = day["conditions"] or period.get("short_forecast")
+        day["precipitation"] = max(day["precipitation"], period.get("precipitation_probability") or 0)
+
+    return [
+        DailyForecast.model_construct(
+            date=day_key,
+            day=date.fromisoformat(day_key).strftime("%A"),
+            high_temp=int(day["high"] if day["high"] is not None else day["low"]),
+            low_temp=int(day["low"] if day["low"] is not None else day["high"]),
+            conditions=day["conditions"] or "Unknown",
+            precipitation_chance=int(day["precipitation"]),
+        )
+        for day_key, day in list(days.items())[:FORECAST_DAYS]
+    ]
+
+
+def current_conditions(periods: List[Dict[str, Any]]) -> str:
+    """The current forecast period as a one-line description"""
+    if not periods:
+        return "Unavailable"
+    period = periods[0]
+    wind = f", wind {period['wind_speed']} {period.get('wind_direction') or ''}".rstrip() if period.get("wind_speed") else ""
+    return f"{period.get('name')}: {period.get('short_forecast')}, {period.get('temperature')}°{period.get('temperature_unit') or 'F'}{wind}"
+
+
+def place_name(geocode: Any, fallback: str = "Unknown location") -> str:
+    if not isinstance(geocode, dict):
+        return fallback
+    return (geocode.get("formatted_address") or geocode.get("address") or fallback).removesuffix(", USA")
+
+
+# Phase 3: Insights - the only model call, given just the compact daily table
+def insights_instruction(context: ReadonlyContext) -> str:
+    """Prompt with the daily table, not the full NWS period text"""
+    forecast = context.state.get("forecast_data") or {}
+    periods = forecast.get("periods", [])
+    table = "\n".join(
+        f"- {day.day} {day.date}: high {day.high_temp}°F, low {day.low_temp}°F, {day.conditions}, "
+        f"{day.precipitation_chance}% chance of precipitation"
+        for day in daily_forecasts(periods)
+    )
+    return f"""
+    You are a weather forecaster. Write 2-4 sentences summarizing this 7-day forecast
+    with planning advice and any notable weather patterns. Plain text only.
+
+    Location: {place_name(context.state.get("geocode_result"))}
+    Now: {current_conditions(periods)}
+    Daily forecast:
+{table or "- none"}
+    """
+
+
+NO_FORECAST_INSIGHTS = "Forecast data is unavailable for this location right now. Please check the location and try again."
+
+
+def skip_insights_without_forecast(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: nothing to summarize when no forecast was retrieved"""
+    forecast = callback_context.state.get("forecast_data") or {}
+    if forecast.get("periods"):
+        return None
+    logger.info("⚡ No forecast periods - skipping the insights model call")
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=NO_FORECAST_INSIGHTS)]))
+
+
+# Phase 4: Formatter - Builds the ForecastSummary in Python (no model call)
+class ForecastSummaryAssembler(BaseAgent):
+    """Combines geocode, forecast periods and insights into the final ForecastSummary"""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        geocode = state.get("geocode_result")
+        periods = (state.get("forecast_data") or {}).get("periods", [])
+        coordinates = {"latitude": geocode["latitude"], "longitude": geocode["longitude"]} \
+            if isinstance(geocode, dict) and "latitude" in geocode else {}
+        summary = ForecastSummary.model_construct(
+            location=place_name(geocode),
+            coordinates=coordinates,
+            current_conditions=current_conditions(periods),
+            daily_forecasts=daily_forecasts(periods),
+            insights=state.get("forecast_insights") or "",
+        )
+        logger.info(f"✅ Assembled forecast summary: {summary.location}, {len(summary.daily_forecasts)} days")
+        # The final event's text is the ForecastSummary JSON, as the LLM formatter produced
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=summary.model_dump_json())]),
+            actions=EventActions(state_delta={"final_response": summary.model_dump()}),
+        )
+
+
+# Replay cache: the same location within the hour gets the same forecast
+def forecast_location_key(request: str) -> Optional[str]:
+    """Cache key part for a forecast request; None (not cached) when no location is named"""
+    location = find_location(request)
+    return normalize_request(location) if location else None
+
+
+def has_daily_forecasts(text: str) -> bool:
+    """Only cache summaries that actually contain a forecast"""
+    return bool(json.loads(text).get("daily_forecasts"))
+
+
+@functools.lru_cache(maxsize=None)
+def build_forecast_workflow(model: str = DEFAULT_MODEL) -> CachedWorkflow:
+    """Build the forecast pipeline (cached - repeated calls return the same agent).
+
+    Fetcher → Insights → Formatter; only the insights step (and the geocoder
+    fallback) calls the model. Wrapped in a CachedWorkflow keyed by location.
+    """
+    geocoder = LlmAgent(
+        name="geocoder",
+        model=gemini(model),
+        description="Geocodes a location name into latitude and longitude coordinates",
+        instruction=GEOCODER_INSTRUCTION,
+        tools=[run_in_thread(geocode_address)],
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit,
+    )
+
+    forecast_fetcher = ForecastFetcher(
+        name="forecast_retriever",
+        description="Geocodes the location and retrieves its 7-day forecast, using the LLM geocoder only when needed",
+        geocoder=geocoder,
+        sub_agents=[geocoder],
+    )
+
+    insights_agent = LlmAgent(
+        name="forecast_insights",
+        model=gemini(model),
+        description="Writes the summary and planning insights for the 7-day forecast",
+        instruction=insights_instruction,
+        output_key="forecast_insights",
+        include_contents="none",
+        before_model_callback=[log_agent_entry, skip_insights_without_forecast],
+        after_model_callback=log_agent_exit,
+    )
+
+    formatter = ForecastSummaryAssembler(
+        name="forecast_formatter",
+        description="Formats the forecast data and insights into a structured summary",
+    )
+
+    pipeline = SequentialAgent(
+        name="forecast_pipeline_steps",
+        description="Runs the forecast fetcher, insights and formatter in order",
+        sub_agents=[forecast_fetcher, insights_agent, formatter],
+    )
+
+    return CachedWorkflow(
+        name="forecast_pipeline",
+        description="Geocodes location, retrieves weather forecast, and generates structured analysis with planning insights",
+        workflow=pipeline,
+        sub_agents=[pipeline],
+        request_key=forecast_location_key,
+        cacheable=has_daily_forecasts,
+    )
@@ -20,6 +20,12 @@ for agent in "${AGENTS_TO_SYNC[@]}"; do
         cp "${SHARED_TOOLS_SOURCE}/__init__.py" "${AGENT_TOOLS_DEST}/"
         cp "${SHARED_TOOLS_SOURCE}/logging_utils.py" "${AGENT_TOOLS_DEST}/"
         cp "${SHARED_TOOLS_SOURCE}/tools.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/schemas.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/alerts_workflow.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/forecast_workflow.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/llm.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/cached_workflow.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/resources_workflow.py" "${AGENT_TOOLS_DEST}/"
     else
         echo "  -> Warning: ${AGENT_TOOLS_DEST} not found. Skipping sync."
     fi
@@ -5,12 +5,15 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+import re
 import json
 import logging
 from typing import List, Dict, Any
-from pydantic import BaseModel, Field
-from google.adk.agents import LlmAgent, SequentialAgent
+from pydantic import BaseModel, Field, ValidationError
+from google.adk.agents import LlmAgent, ParallelAgent, SequentialAgent
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.llm import gemini, use_cached_output_schema
+from .tools.cached_workflow import CachedWorkflow
 from google.adk.tools import google_search
 
 # Configure logging
@@ -30,7 +33,7 @@ class RiskAnalysisSummary(BaseModel):
 # This agent ensures the input is clean and structured for the next phases.
 # Phase 1: Alert Parser
 alert_parser = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     name="alert_parser",
     description="Parses a single weather alert to extract key information for risk analysis",
     instruction="""
@@ -44,7 +47,7 @@ alert_parser = LlmAgent(
         *   The severity level (e.g., "Severe").
         *   Affected Zones and areas.
         *   The full alert text for context.
-    3.  **Store for Next Agent**: Store these extracted fields in a structured way for the `census_data_retriever`.
+    3.  **Store for Next Agent**: Store these extracted fields in a structured way for the `risk_synthesizer`.
     """,
     output_key="parsed_alert",
     before_model_callback=log_agent_entry,
@@ -55,14 +58,14 @@ alert_parser = LlmAgent(
 # This agent uses the google_search tool to gather real-time information.
 risk_researcher = LlmAgent(
     name="risk_researcher",
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     description="Researches the weather alert using Google Search to find real-world impacts and advice.",
     tools=[google_search],
     instruction="""
     You are a professional risk researcher. Your goal is to gather real-time, relevant information about a weather alert using Google Search.
     
     **Your Task:**
-    Based on the alert summary provided, perform targeted Google searches to find:
+    Based on the weather alert in the user's input, perform targeted Google searches to find:
     1.  **Potential Impacts**: What are the potential impacts in affected areas? (e.g., road closures, power outages, infrastructure damage).
     2.  **Safety Recommendations**: What are the official safety recommendations from authorities (like FEMA, NWS, or local government)?
 
@@ -76,7 +79,7 @@ risk_researcher = LlmAgent(
 # Phase 3: Risk Synthesizer
 # This agent synthesizes the alert data and search findings into a final summary.
 risk_synthesizer = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     name="risk_synthesizer",
     description="Synthesizes alert data and search results into a final risk analysis summary.",
     instruction="""
@@ -84,20 +87,54 @@ risk_synthesizer = LlmAgent(
     """,
     output_schema=RiskAnalysisSummary,
     output_key="risk_analysis_summary",
-    before_model_callback=log_agent_entry,
+    before_model_callback=[log_agent_entry, use_cached_output_schema],
     after_model_callback=log_agent_exit,
 )
 
 # --- Agent Workflow Definition ---
 
-risk_analysis_workflow = SequentialAgent(
-    name="search_based_risk_analysis_workflow",
-    description="Analyzes weather alert risks using real-time Google Search results.",
+# The researcher searches from the alert in the user's input, not the parsed
+# fields, so parsing and research run concurrently
+parse_and_research = ParallelAgent(
+    name="parse_and_research",
+    description="Parses the alert and researches its impacts concurrently",
     sub_agents=[
         alert_parser,
         risk_researcher,
+    ],
+)
+
+# The analysis of an alert is replayed for the same alert text within the hour,
+# unless the synthesizer could not actually analyze it
+ANALYSIS_FAILED_PATTERN = re.compile(r"\b(?:could\s+not|couldn't|unable\s+to|failed\s+to|error)\b", re.I)
+
+
+def is_complete_analysis(text: str) -> bool:
+    """Only cache analyses with impacts and recommendations (not errors or empty results)"""
+    try:
+        analysis = RiskAnalysisSummary.model_validate_json(text)
+    except ValidationError:
+        return False
+    if not analysis.alert_summary or not analysis.potential_impacts or not analysis.safety_recommendations:
+        return False
+    return not ANALYSIS_FAILED_PATTERN.search(analysis.alert_summary)
+
+
+risk_analysis_pipeline = SequentialAgent(
+    name="search_based_risk_analysis_steps",
+    description="Parses and researches the alert, then synthesizes the risk analysis",
+    sub_agents=[
+        parse_and_research,
         risk_synthesizer,
     ],
 )
 
+risk_analysis_workflow = CachedWorkflow(
+    name="search_based_risk_analysis_workflow",
+    description="Analyzes weather alert risks using real-time Google Search results.",
+    workflow=risk_analysis_pipeline,
+    sub_agents=[risk_analysis_pipeline],
+    cacheable=is_complete_analysis,
+)
+
 root_agent = risk_analysis_workflow
@@ -1,15 +1,48 @@
 import os
+import re
 import json
+import time
+import asyncio
+import hashlib
 import logging
+from types import SimpleNamespace
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import httpx
 import requests
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from functools import wraps
 from google.adk.tools.tool_context import ToolContext
 from google.cloud import bigquery
 import google.auth
 from dotenv import load_dotenv
 
+try:
+    import redis
+except ImportError:  # Optional - responses are cached in-process without it
+    redis = None
+
+try:
+    import h2
+except ImportError:  # Optional - the async client speaks HTTP/1.1 without it
+    h2 = None
+
+try:
+    import orjson
+except ImportError:  # Optional - stdlib json is used without it
+    orjson = None
+
+# NWS alert GeoJSON for large states runs to several MB; decode with orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(value: Any):
+    """Encode a cache entry (orjson when available; unknown types such as Decimal become strings)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str)
+
 # Configure detailed logging for tools
 logging.basicConfig(
     level=logging.INFO,
@@ -19,51 +52,82 @@ logger = logging.getLogger(__name__)
 
 # Tool call tracking decorator
 def track_tool_call(tool_name):
-    """Decorator to track tool calls with detailed logging"""
+    """Decorator to track tool calls with detailed logging (sync and async tools)"""
+    def log_call(func, args, kwargs):
+        logger.info(f"{'='*80}")
+        logger.info(f"🔧 TOOL CALL: {tool_name}")
+        logger.info(f"   Function: {func.__name__}")
+        
+        # Log parameters (skip tool_context)
+        params = {}
+        if len(args) > 1:
+            params['args'] = str(args[1:])[:200]  # Truncate long args
+        if kwargs:
+            params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
+        
+        if params:
+            logger.info(f"   Parameters: {params}")
+        
+        logger.info(f"{'='*80}")
+    
+    def log_success(result):
+        logger.info(f"{'='*80}")
+        logger.info(f"✅ TOOL SUCCESS: {tool_name}")
+        if isinstance(result, dict):
+            if 'status' in result:
+                logger.info(f"   Status: {result.get('status')}")
+            if 'count' in result:
+                logger.info(f"   Count: {result.get('count')}")
+            if 'alerts' in result:
+                logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
+        logger.info(f"{'='*80}")
+    
+    def log_error(e):
+        logger.error(f"{'='*80}")
+        logger.error(f"❌ TOOL ERROR: {tool_name}")
+        logger.error(f"   Error: {str(e)}")
+        logger.error(f"{'='*80}")
+    
     def decorator(func):
+        # Async tools must stay coroutine functions so ADK awaits them
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                log_call(func, args, kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+                    log_success(result)
+                    return result
+                except Exception as e:
+                    log_error(e)
+                    raise
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info(f"{'='*80}")
-            logger.info(f"🔧 TOOL CALL: {tool_name}")
-            logger.info(f"   Function: {func.__name__}")
-            
-            # Log parameters (skip tool_context)
-            params = {}
-            if len(args) > 1:
-                params['args'] = str(args[1:])[:200]  # Truncate long args
-            if kwargs:
-                params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
-            
-            if params:
-                logger.info(f"   Parameters: {params}")
-            
-            logger.info(f"{'='*80}")
-            
+            log_call(func, args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                
-                # Log result summary
-                logger.info(f"{'='*80}")
-                logger.info(f"✅ TOOL SUCCESS: {tool_name}")
-                if isinstance(result, dict):
-                    if 'status' in result:
-                        logger.info(f"   Status: {result.get('status')}")
-                    if 'count' in result:
-                        logger.info(f"   Count: {result.get('count')}")
-                    if 'alerts' in result:
-                        logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
-                logger.info(f"{'='*80}")
-                
+                log_success(result)
                 return result
             except Exception as e:
-                logger.error(f"{'='*80}")
-                logger.error(f"❌ TOOL ERROR: {tool_name}")
-                logger.error(f"   Error: {str(e)}")
-                logger.error(f"{'='*80}")
+                log_error(e)
                 raise
         return wrapper
     return decorator
 
+
+def run_in_thread(func):
+    """Expose a blocking tool to ADK as a coroutine that runs in a worker thread.
+    
+    ADK gathers the function calls of one model response concurrently, but calls
+    sync tools inline on the event loop, so they would still run one at a time.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
 # Load environment variables
 load_dotenv()
 
@@ -87,7 +151,397 @@ NWS_HEADERS = {
 }
 
 
+# State/territory names → USPS codes, so tools accept names as well as codes
+STATE_CODE_MAP = {
+    "Alabama": "AL", "Alaska": "AK", "Arizona": "AZ", "Arkansas": "AR", "California": "CA",
+    "Colorado": "CO", "Connecticut": "CT", "Delaware": "DE", "District Of Columbia": "DC",
+    "Washington Dc": "DC", "Washington D.C.": "DC", "Florida": "FL", "Georgia": "GA", "Hawaii": "HI",
+    "Idaho": "ID", "Illinois": "IL", "Indiana": "IN", "Iowa": "IA", "Kansas": "KS", "Kentucky": "KY",
+    "Louisiana": "LA", "Maine": "ME", "Maryland": "MD", "Massachusetts": "MA", "Michigan": "MI",
+    "Minnesota": "MN", "Mississippi": "MS", "Missouri": "MO", "Montana": "MT", "Nebraska": "NE",
+    "Nevada": "NV", "New Hampshire": "NH", "New Jersey": "NJ", "New Mexico": "NM", "New York": "NY",
+    "North Carolina": "NC", "North Dakota": "ND", "Ohio": "OH", "Oklahoma": "OK", "Oregon": "OR",
+    "Pennsylvania": "PA", "Rhode Island": "RI", "South Carolina": "SC", "South Dakota": "SD",
+    "Tennessee": "TN", "Texas": "TX", "Utah": "UT", "Vermont": "VT", "Virginia": "VA",
+    "Washington": "WA", "West Virginia": "WV", "Wisconsin": "WI", "Wyoming": "WY",
+    "American Samoa": "AS", "Guam": "GU", "Northern Mariana Islands": "MP", "Puerto Rico": "PR",
+    "U.S. Virgin Islands": "VI", "Virgin Islands": "VI",
+}
+
+
+def normalize_state_code(state: str) -> str:
+    """Map a state name or code ("florida", "FL", " fl ") to its two-letter code"""
+    state = " ".join(state.split())
+    return STATE_CODE_MAP.get(state.title(), state.upper()[:2])
+
+
+# State names match case-insensitively; two-letter codes only in capitals
+# ("IN", "OR"), so ordinary words are not mistaken for states
+STATE_PATTERN = re.compile(
+    r"\b(?:(?i:" + "|".join(
+        re.escape(name).replace(r"\ ", r"\s+") for name in sorted(STATE_CODE_MAP, key=len, reverse=True)
+    ) + r")|" + "|".join(sorted(set(STATE_CODE_MAP.values()))) + r")\b"
+)
+
+
+def find_states(text: str) -> List[str]:
+    """Return the state names/codes mentioned in a query, in order"""
+    return [m.group(0) for m in STATE_PATTERN.finditer(text)]
+
+
+# Response cache TTLs (seconds), by how quickly each upstream source changes
+ALERTS_TTL = 30
+CURRENT_CONDITIONS_TTL = 300
+FORECAST_TTL = 3600
+HURRICANE_TTL = 600
+GEOCODE_TTL = 30 * 24 * 3600
+NWS_POINTS_TTL = 30 * 24 * 3600
+
+# Shared Redis cache when REDIS_URL is set, so all agent services reuse each
+# other's responses; otherwise a per-process cache
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_KEY_PREFIX = "weather:"
+CACHE_LOCK_TIMEOUT = 10
+LOCAL_CACHE_SIZE = 1024
+
+_redis_client = None
+# Least recently used entries are evicted first
+_local_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+# One pooled session for all sync HTTP calls, so NWS/NHC/Maps connections
+# (and their TLS handshakes) are reused across tool calls and workflows
+_http = requests.Session()
+_http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Likewise one async client (keep-alive pool, HTTP/2 when h2 is installed) for
+# every concurrent request - NWS alerts and zones, Places and Directions batches
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 20
+_async_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_http() -> httpx.AsyncClient:
+    """Return the shared async client, recreating it if it was closed"""
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = httpx.AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            http2=h2 is not None,
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE)
+        )
+    return _async_http
+
+
+def _get_redis():
+    """Return the shared Redis client (connection pooled), or None if not configured"""
+    global _redis_client
+    if _redis_client is None and REDIS_URL and redis is not None:
+        _redis_client = redis.Redis.from_url(REDIS_URL, socket_timeout=1)
+    return _redis_client
+
+
+def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Hash the request into a cache key (API keys are excluded)"""
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "key")
+    digest = hashlib.sha1(json.dumps([url, items]).encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}{digest}"
+
+
+def _cache_get(key: str) -> Optional[Any]:
+    client = _get_redis()
+    if client is not None:
+        try:
+            cached = client.get(key)
+            return _json_loads(cached) if cached is not None else None
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache unavailable: {str(e)}")
+            return None
+    
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    expires, value = entry
+    if expires <= time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    try:
+        _local_cache.move_to_end(key)
+    except KeyError:
+        # Evicted by another thread since the lookup
+        pass
+    return value
+
+
+def _cache_set(key: str, value: Any, ttl: int) -> None:
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.set(key, _json_dumps(value), ex=ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache unavailable: {str(e)}")
+        return
+    
+    _local_cache[key] = (time.monotonic() + ttl, value)
+    _local_cache.move_to_end(key)
+    while len(_local_cache) > LOCAL_CACHE_SIZE:
+        _local_cache.popitem(last=False)
+
+
+def invalidate_cache() -> int:
+    """Drop all cached API responses (e.g. after an upstream correction); returns the count"""
+    client = _get_redis()
+    if client is not None:
+        keys = list(client.scan_iter(f"{CACHE_KEY_PREFIX}*"))
+        return client.delete(*keys) if keys else 0
+    count = len(_local_cache)
+    _local_cache.clear()
+    return count
+
+
+def _cached_get_json(
+    url: str,
+    ttl: int,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 10,
+    cacheable: Optional[Callable[[Any], bool]] = None,
+    transform: Optional[Callable[[Any], Any]] = None
+) -> Any:
+    """GET a JSON document through the response cache (cache-aside).
+    
+    With Redis, the first worker to miss takes a short SETNX lock and fetches;
+    others wait briefly for its result instead of all hitting the API at once.
+    Responses rejected by cacheable (e.g. error payloads) are not stored;
+    transform trims a fresh response before it is cached and returned.
+    """
+    key = _cache_key(url, params)
+    cached = _cache_get(key)
+    if cached is not None:
+        logger.info(f"⚡ Cache hit: {url}")
+        return cached
+    
+    client = _get_redis()
+    lock_key = f"{key}:lock"
+    locked = False
+    if client is not None:
+        try:
+            locked = bool(client.set(lock_key, 1, nx=True, ex=CACHE_LOCK_TIMEOUT))
+            if not locked:
+                # Another worker is fetching the same document
+                for _ in range(20):
+                    time.sleep(0.05)
+                    cached = _cache_get(key)
+                    if cached is not None:
+                        return cached
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache unavailable: {str(e)}")
+    
+    try:
+        response = _http.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        if transform is not None:
+            data = transform(data)
+        if cacheable is None or cacheable(data):
+            _cache_set(key, data, ttl)
+        return data
+    finally:
+        if locked:
+            try:
+                client.delete(lock_key)
+            except redis.RedisError:
+                pass
+
+
 # BigQuery Helper Functions for Historical Weather Data and Census Demographics
+
+# Parameterized query templates - values are bound as query parameters, so the
+# SQL text is identical across calls and BigQuery's result cache applies
+CENSUS_DEMOGRAPHICS_SQL = """
+SELECT 
+    geo_id,
+    total_pop,
+    median_age,
+    median_income,
+    housing_units,
+    households,
+    male_pop,
+    female_pop,
+    white_pop,
+    black_pop,
+    asian_pop,
+    hispanic_pop,
+    bachelors_degree,
+    median_rent,
+    owner_occupied_housing_units,
+    housing_units_renter_occupied
+FROM `bigquery-public-data.census_bureau_acs.censustract_2018_5yr` 
+WHERE SUBSTR(geo_id, 1, 2) = @state_fips
+LIMIT 100
+"""
+
+NEAREST_STATIONS_SQL = """
+SELECT
+    usaf,
+    wban,
+    name,
+    state,
+    lat,
+    lon,
+    SQRT(POW((lat - @latitude), 2) + POW((lon - (@longitude)), 2)) as distance
+FROM
+    `bigquery-public-data.noaa_gsod.stations`
+WHERE
+    state = @state
+    AND lat IS NOT NULL
+    AND lon IS NOT NULL
+ORDER BY
+    distance
+LIMIT 3
+"""
+
+HISTORICAL_WEATHER_SQL = """
+SELECT 
+    CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') as date,
+    temp,
+    max,
+    min,
+    prcp,
+    sndp,
+    wdsp,
+    mxpsd
+FROM `bigquery-public-data.noaa_gsod.gsod*`
+WHERE stn = @usaf_id
+    AND CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') 
+        BETWEEN @start_date AND @end_date
+ORDER BY year DESC, mo DESC, da DESC
+LIMIT 100
+"""
+
+# Table names cannot be parameters; {year} is filled with a validated int
+WEATHER_STATISTICS_SQL = """
+SELECT 
+    AVG(temp) as avg_temp,
+    MAX(max) as highest_temp,
+    MIN(min) as lowest_temp,
+    AVG(prcp) as avg_precipitation,
+    SUM(prcp) as total_precipitation,
+    AVG(wdsp) as avg_wind_speed,
+    MAX(mxspd) as max_wind_speed,
+    COUNT(*) as days_recorded
+FROM `bigquery-public-data.noaa_gsod.gsod{year}`
+WHERE stn = @station_id
+    AND (@month IS NULL OR EXTRACT(MONTH FROM date) = @month)
+"""
+
+# Public census/GSOD data changes at most daily
+BIGQUERY_TTL = 24 * 3600
+
+
+def _cached_query(
+    query: str,
+    query_params: List[bigquery.ScalarQueryParameter],
+    ttl: int = BIGQUERY_TTL
+) -> List[SimpleNamespace]:
+    """Run a parameterized query through the response cache.
+    
+    Rows come back as namespaces, so callers keep using row.column access
+    whether the rows were fetched or cached.
+    """
+    key = _cache_key(query, {param.name: param.value for param in query_params})
+    rows = _cache_get(key)
+    if rows is None:
+        job_config = bigquery.QueryJobConfig(query_parameters=query_params, use_query_cache=True)
+        rows = [dict(row.items()) for row in bq_client.query(query, job_config=job_config).result()]
+        _cache_set(key, rows, ttl)
+    else:
+        logger.info(f"⚡ Cache hit: BigQuery ({len(rows)} rows)")
+    return [SimpleNamespace(**row) for row in rows]
+
+
+def _census_summary(city: str, state: str) -> Dict[str, Any]:
+    """Census tract demographics for a city's state (ValueError for an unknown state)"""
+    # Query BigQuery census_bureau_acs dataset for city demographics
+    # Map state abbreviations to FIPS codes
+    state_fips = {
+        'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
+        'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
+        'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
+        'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
+        'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
+        'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
+        'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
+        'WI': '55', 'WY': '56'
+    }
+    
+    state_code = state_fips.get(normalize_state_code(state))
+    if not state_code:
+        raise ValueError(f"Invalid state abbreviation: {state}. Please use 2-letter state code (e.g., CA, TX, NY)")
+    
+    logger.info(f"Querying census demographics for {city}, {state}")
+    results = _cached_query(CENSUS_DEMOGRAPHICS_SQL, [
+        bigquery.ScalarQueryParameter("state_fips", "STRING", state_code)
+    ])
+    
+    demographics = []
+    total_population = 0
+    total_households = 0
+    
+    for row in results:
+        demographics.append({
+            "geo_id": row.geo_id,
+            "population": row.total_pop,
+            "median_age": row.median_age,
+            "median_income": row.median_income,
+            "housing_units": row.housing_units,
+            "households": row.households,
+            "demographics": {
+                "male": row.male_pop,
+                "female": row.female_pop,
+                "white": row.white_pop,
+                "black": row.black_pop,
+                "asian": row.asian_pop,
+                "hispanic": row.hispanic_pop
+            },
+            "education": {
+                "bachelors_degree": row.bachelors_degree
+            },
+            "housing": {
+                "median_rent": row.median_rent,
+                "owner_occupied": row.owner_occupied_housing_units,
+                "renter_occupied": row.housing_units_renter_occupied
+            }
+        })
+        total_population += row.total_pop or 0
+        total_households += row.households or 0
+    
+    # Calculate aggregates
+    if demographics:
+        avg_median_age = sum(d["median_age"] or 0 for d in demographics) / len(demographics)
+        avg_median_income = sum(d["median_income"] or 0 for d in demographics) / len(demographics)
+        
+        summary = {
+            "city": city,
+            "state": state,
+            "total_population": total_population,
+            "total_households": total_households,
+            "avg_median_age": round(avg_median_age, 1),
+            "avg_median_income": round(avg_median_income, 2),
+            "census_tracts": len(demographics),
+            "tracts": demographics
+        }
+    else:
+        summary = {
+            "city": city,
+            "state": state,
+            "message": f"No census data found for {city}, {state}. Try searching by county name instead."
+        }
+    
+    logger.info(f"Retrieved demographics for {len(summary.get('tracts', []))} census tracts")
+    return summary
+
+
 @track_tool_call("get_census_demographics")
 def get_census_demographics(
     tool_context: ToolContext,
@@ -104,117 +558,21 @@ def get_census_demographics(
         dict: Census demographics including population, age, income, housing
     """
     try:
-        # Query BigQuery census_bureau_acs dataset for city demographics
-        # Map state abbreviations to FIPS codes
-        state_fips = {
-            'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
-            'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
-            'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
-            'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
-            'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
-            'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
-            'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
-            'WI': '55', 'WY': '56'
-        }
-        
-        state_code = state_fips.get(state.upper())
-        if not state_code:
-            return {
-                "status": "error",
-                "message": f"Invalid state abbreviation: {state}. Please use 2-letter state code (e.g., CA, TX, NY)"
-            }
-        
-        query = f"""
-        SELECT 
-            geo_id,
-            total_pop,
-            median_age,
-            median_income,
-            housing_units,
-            households,
-            male_pop,
-            female_pop,
-            white_pop,
-            black_pop,
-            asian_pop,
-            hispanic_pop,
-            bachelors_degree,
-            median_rent,
-            owner_occupied_housing_units,
-            housing_units_renter_occupied
-        FROM `bigquery-public-data.census_bureau_acs.censustract_2018_5yr` 
-        WHERE SUBSTR(geo_id, 1, 2) = '{state_code}'
-        LIMIT 100
-        """
-        
-        logger.info(f"Querying census demographics for {city}, {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
-        
-        demographics = []
-        total_population = 0
-        total_households = 0
-        
-        for row in results:
-            demographics.append({
-                "geo_id": row.geo_id,
-                "population": row.total_pop,
-                "median_age": row.median_age,
-                "median_income": row.median_income,
-                "housing_units": row.housing_units,
-                "households": row.households,
-                "demographics": {
-                    "male": row.male_pop,
-                    "female": row.female_pop,
-                    "white": row.white_pop,
-                    "black": row.black_pop,
-                    "asian": row.asian_pop,
-                    "hispanic": row.hispanic_pop
-                },
-                "education": {
-                    "bachelors_degree": row.bachelors_degree
-                },
-                "housing": {
-                    "median_rent": row.median_rent,
-                    "owner_occupied": row.owner_occupied_housing_units,
-                    "renter_occupied": row.housing_units_renter_occupied
-                }
-            })
-            total_population += row.total_pop or 0
-            total_households += row.households or 0
-        
-        # Calculate aggregates
-        if demographics:
-            avg_median_age = sum(d["median_age"] or 0 for d in demographics) / len(demographics)
-            avg_median_income = sum(d["median_income"] or 0 for d in demographics) / len(demographics)
-            
-            summary = {
-                "city": city,
-                "state": state,
-                "total_population": total_population,
-                "total_households": total_households,
-                "avg_median_age": round(avg_median_age, 1),
-                "avg_median_income": round(avg_median_income, 2),
-                "census_tracts": len(demographics),
-                "tracts": demographics
-            }
-        else:
-            summary = {
-                "city": city,
-                "state": state,
-                "message": f"No census data found for {city}, {state}. Try searching by county name instead."
-            }
+        summary = _census_summary(city, state)
         
         # Save to state
         tool_context.state["census_demographics"] = summary
         
-        logger.info(f"Retrieved demographics for {len(demographics)} census tracts")
-        
         return {
             "status": "success",
             "data": summary
         }
     
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
     except Exception as e:
         logger.error(f"Error querying census demographics: {str(e)}")
         return {
@@ -223,6 +581,73 @@ def get_census_demographics(
         }
 
 
+# Caps concurrent BigQuery jobs started by one multi-location tool call
+BIGQUERY_MAX_CONCURRENCY = 10
+
+
+async def _gather_in_threads(func: Callable[..., Any], args: List[tuple]) -> List[Any]:
+    """Run a blocking function for each argument tuple concurrently (exceptions are returned)"""
+    semaphore = asyncio.Semaphore(BIGQUERY_MAX_CONCURRENCY)
+    
+    async def run(call_args: tuple) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(func, *call_args)
+    
+    return await asyncio.gather(*(run(call_args) for call_args in args), return_exceptions=True)
+
+
+@track_tool_call("get_census_demographics_multi")
+async def get_census_demographics_multi(
+    tool_context: ToolContext,
+    locations: List[str]
+) -> Dict[str, Any]:
+    """Get census demographics for several cities in one call (queried concurrently).
+    
+    Args:
+        locations (list): Cities as "City, ST" (e.g., ["Miami, FL", "Savannah, GA"])
+        
+    Returns:
+        dict: Census demographics for each location
+    """
+    locations = list(dict.fromkeys(location.strip() for location in locations if location.strip()))
+    if not locations:
+        return {
+            "status": "error",
+            "message": "No locations provided"
+        }
+    
+    # "City, ST" → (city, state); a bare state is queried as itself
+    pairs = [tuple(part.strip() for part in location.rsplit(",", 1)) if "," in location else (location, location)
+             for location in locations]
+    results = await _gather_in_threads(_census_summary, pairs)
+    
+    summaries = {}
+    failed = []
+    for location, result in zip(locations, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error querying census demographics for {location}: {str(result)}")
+            failed.append(location)
+        else:
+            summaries[location] = result
+    
+    if not summaries:
+        return {
+            "status": "error",
+            "message": f"Failed to query census data: {', '.join(failed)}"
+        }
+    
+    # Save to state
+    tool_context.state["census_demographics_by_location"] = summaries
+    
+    result = {
+        "status": "success",
+        "results": summaries
+    }
+    if failed:
+        result["failed_locations"] = failed
+    return result
+
+
 @track_tool_call("find_nearest_weather_station")
 def find_nearest_weather_station(
     tool_context: ToolContext,
@@ -242,29 +667,12 @@ def find_nearest_weather_station(
     """
     try:
         # Query to find top 3 nearest stations using Euclidean distance
-        query = f"""
-        SELECT
-            usaf,
-            wban,
-            name,
-            state,
-            lat,
-            lon,
-            SQRT(POW((lat - {latitude}), 2) + POW((lon - ({longitude})), 2)) as distance
-        FROM
-            `bigquery-public-data.noaa_gsod.stations`
-        WHERE
-            state = '{state}'
-            AND lat IS NOT NULL
-            AND lon IS NOT NULL
-        ORDER BY
-            distance
-        LIMIT 3
-        """
-        
         logger.info(f"Finding top 3 nearest weather stations for coordinates ({latitude}, {longitude}) in {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        results = _cached_query(NEAREST_STATIONS_SQL, [
+            bigquery.ScalarQueryParameter("latitude", "FLOAT64", latitude),
+            bigquery.ScalarQueryParameter("longitude", "FLOAT64", longitude),
+            bigquery.ScalarQueryParameter("state", "STRING", normalize_state_code(state))
+        ])
         
         stations = []
         for row in results:
@@ -320,37 +728,16 @@ def query_historical_weather(
     Returns:
         dict: Historical weather observations from the first station with data
     """
-    # Extract year from start_date for table suffix
-    start_year = start_date.split('-')[0]
-    end_year = end_date.split('-')[0]
-    table_suffix = "*"  # Use wildcard to cover multiple years
-    
     # Try each station in order until we get data
     for idx, usaf_id in enumerate(usaf_ids):
         try:
             logger.info(f"Attempting to query station #{idx+1}: {usaf_id}")
             
-            # Build query using USAF as stn field
-            query = f"""
-            SELECT 
-                CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') as date,
-                temp,
-                max,
-                min,
-                prcp,
-                sndp,
-                wdsp,
-                mxpsd
-            FROM `bigquery-public-data.noaa_gsod.gsod{table_suffix}`
-            WHERE stn = '{usaf_id}'
-                AND CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') 
-                    BETWEEN '{start_date}' AND '{end_date}'
-            ORDER BY year DESC, mo DESC, da DESC
-            LIMIT 100
-            """
-            
-            query_job = bq_client.query(query)
-            results = query_job.result()
+            results = _cached_query(HISTORICAL_WEATHER_SQL, [
+                bigquery.ScalarQueryParameter("usaf_id", "STRING", usaf_id),
+                bigquery.ScalarQueryParameter("start_date", "STRING", start_date),
+                bigquery.ScalarQueryParameter("end_date", "STRING", end_date)
+            ])
             
             records = []
             for row in results:
@@ -416,32 +803,14 @@ def get_weather_statistics(
         dict: Weather statistics including averages and extremes
     """
     try:
-        if month:
-            date_filter = f"AND EXTRACT(MONTH FROM date) = {month}"
-            period = f"{year}-{month:02d}"
-        else:
-            date_filter = ""
-            period = str(year)
-        
-        query = f"""
-        SELECT 
-            AVG(temp) as avg_temp,
-            MAX(max) as highest_temp,
-            MIN(min) as lowest_temp,
-            AVG(prcp) as avg_precipitation,
-            SUM(prcp) as total_precipitation,
-            AVG(wdsp) as avg_wind_speed,
-            MAX(mxspd) as max_wind_speed,
-            COUNT(*) as days_recorded
-        FROM `bigquery-public-data.noaa_gsod.gsod{year}`
-        WHERE stn = '{station_id}'
-            {date_filter}
-        """
+        period = f"{year}-{month:02d}" if month else str(year)
         
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        results = _cached_query(WEATHER_STATISTICS_SQL.format(year=int(year)), [
+            bigquery.ScalarQueryParameter("station_id", "STRING", station_id),
+            bigquery.ScalarQueryParameter("month", "INT64", month)
+        ])
         
-        row = next(results)
+        row = results[0]
         stats = {
             "station_id": station_id,
             "period": period,
@@ -492,9 +861,7 @@ def get_nws_forecast(
     try:
         # Step 1: Get grid points for the location
         points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-        points_response = requests.get(points_url, headers=NWS_HEADERS, timeout=10)
-        points_response.raise_for_status()
-        points_data = points_response.json()
+        points_data = _cached_get_json(points_url, NWS_POINTS_TTL, headers=NWS_HEADERS)
         
         # Extract forecast URL
         if period == "hourly":
@@ -503,15 +870,15 @@ def get_nws_forecast(
             forecast_url = points_data["properties"]["forecast"]
         
         # Step 2: Get forecast data
-        forecast_response = requests.get(forecast_url, headers=NWS_HEADERS, timeout=10)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
+        forecast_data = _cached_get_json(forecast_url, FORECAST_TTL, headers=NWS_HEADERS)
         
         # Extract and format forecast periods
         periods = []
         for period_data in forecast_data["properties"]["periods"]:
             periods.append({
                 "name": period_data.get("name"),
+                "start_time": period_data.get("startTime"),
+                "is_daytime": period_data.get("isDaytime"),
                 "temperature": period_data.get("temperature"),
                 "temperature_unit": period_data.get("temperatureUnit"),
                 "wind_speed": period_data.get("windSpeed"),
@@ -577,7 +944,7 @@ def get_nws_alerts(
     """Get active weather alerts from NWS API (real-time).
     
     Args:
-        state (str): Two-letter state code (e.g., "FL")
+        state (str): State name or two-letter code (e.g., "FL" or "Florida")
         latitude (float): Latitude for point-based alerts
         longitude (float): Longitude for point-based alerts
         severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
@@ -590,81 +957,228 @@ def get_nws_alerts(
         if latitude and longitude:
             alerts_url = f"{NWS_API_BASE}/alerts/active?point={latitude},{longitude}"
         elif state:
-            alerts_url = f"{NWS_API_BASE}/alerts/active?area={state}"
+            alerts_url = f"{NWS_API_BASE}/alerts/active?area={normalize_state_code(state)}"
         else:
             alerts_url = f"{NWS_API_BASE}/alerts/active"
         
-        # Get alerts
-        alerts_response = requests.get(alerts_url, headers=NWS_HEADERS, timeout=10)
-        alerts_response.raise_for_status()
-        alerts_data = alerts_response.json()
+        # Get alerts (waiting on a speculative prefetch of the same URL if one is running)
+        pending = _alerts_prefetch.pop(alerts_url, None)
+        if pending is not None:
+            wait([pending], timeout=PREFETCH_WAIT_TIMEOUT)
+        alerts_data = _cached_get_json(alerts_url, ALERTS_TTL, headers=NWS_HEADERS, transform=_slim_alerts)
         
-        # Extract and format alerts
-        alerts = []
-        severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
+        national = not state and not latitude and not longitude
+        return _summarize_alerts(tool_context, alerts_data.get("features", []), severity, national)
+    
+    except Exception as e:
+        logger.error(f"Error getting NWS alerts: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get alerts: {str(e)}"
+        }
+
+
+# Alert properties _summarize_alerts reads; the rest of each feature (notably
+# its geometry) is dropped before caching
+ALERT_PROPERTIES = (
+    "event", "severity", "urgency", "certainty", "headline", "description", "instruction",
+    "onset", "expires", "affectedZones", "areaDesc", "senderName"
+)
+
+
+def _slim_alerts(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the alert fields the tools use, so cached payloads stay small"""
+    return {
+        "features": [
+            {
+                "id": feature.get("id"),
+                "properties": {key: props[key] for key in ALERT_PROPERTIES if key in props}
+            }
+            for feature in data.get("features", [])
+            for props in [feature.get("properties") or {}]
+        ]
+    }
+
+
+def _summarize_alerts(
+    tool_context: ToolContext,
+    features: List[Dict[str, Any]],
+    severity: Optional[str],
+    national: bool
+) -> Dict[str, Any]:
+    """Extract, count and (for large sets) limit NWS alert features; saves state["alerts"]"""
+    # Extract and format alerts
+    alerts = []
+    severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
+    
+    for feature in features:
+        props = feature.get("properties", {})
         
-        for feature in alerts_data.get("features", []):
-            props = feature.get("properties", {})
-            
-            # Filter by severity if specified
-            if severity and props.get("severity") != severity:
-                continue
-            
-            alert_severity = props.get("severity", "Unknown")
-            severity_counts[alert_severity] = severity_counts.get(alert_severity, 0) + 1
-            
-            alerts.append({
-                "event": props.get("event"),
-                "severity": alert_severity,
-                "urgency": props.get("urgency"),
-                "certainty": props.get("certainty"),
-                "headline": props.get("headline"),
-                "description": props.get("description"),
-                "instruction": props.get("instruction"),
-                "onset": props.get("onset"),
-                "expires": props.get("expires"),
-                "affected_zones": props.get("affectedZones", []),
-                "sender_name": props.get("senderName")
-            })
+        # Filter by severity if specified
+        if severity and props.get("severity") != severity:
+            continue
         
-        # For large alert sets, only return top critical alerts to prevent timeout
-        total_count = len(alerts)
-        if total_count > 10:
-            # Sort by severity priority: Extreme > Severe > Moderate > Minor
-            severity_priority = {"Extreme": 0, "Severe": 1, "Moderate": 2, "Minor": 3, "Unknown": 4}
-            alerts.sort(key=lambda x: severity_priority.get(x["severity"], 4))
-            
-            # More aggressive limiting for national queries (no state/coords specified)
-            if not state and not latitude and not longitude:
-                # National query - limit to top 5 most critical alerts
-                alerts = alerts[:5]
-                logger.info(f"National query: Limiting to top 5 critical alerts out of {total_count} total")
-            else:
-                # Regional query - limit to top 10 alerts
-                alerts = alerts[:10]
-                logger.info(f"Regional query: Limiting to top 10 alerts out of {total_count} total")
+        alert_severity = props.get("severity", "Unknown")
+        severity_counts[alert_severity] = severity_counts.get(alert_severity, 0) + 1
+        
+        alerts.append({
+            "event": props.get("event"),
+            "severity": alert_severity,
+            "urgency": props.get("urgency"),
+            "certainty": props.get("certainty"),
+            "headline": props.get("headline"),
+            "description": props.get("description"),
+            "instruction": props.get("instruction"),
+            "onset": props.get("onset"),
+            "expires": props.get("expires"),
+            "affected_zones": props.get("affectedZones", []),
+            "area_desc": props.get("areaDesc"),
+            "sender_name": props.get("senderName")
+        })
+    
+    # For large alert sets, only return top critical alerts to prevent timeout
+    total_count = len(alerts)
+    if total_count > 10:
+        # Sort by severity priority: Extreme > Severe > Moderate > Minor
+        severity_priority = {"Extreme": 0, "Severe": 1, "Moderate": 2, "Minor": 3, "Unknown": 4}
+        alerts.sort(key=lambda x: severity_priority.get(x["severity"], 4))
+        
+        # More aggressive limiting for national queries (no state/coords specified)
+        if national:
+            # National query - limit to top 5 most critical alerts
+            alerts = alerts[:5]
+            logger.info(f"National query: Limiting to top 5 critical alerts out of {total_count} total")
+        else:
+            # Regional query - limit to top 10 alerts
+            alerts = alerts[:10]
+            logger.info(f"Regional query: Limiting to top 10 alerts out of {total_count} total")
+    
+    # Save to state
+    tool_context.state["alerts"] = {
+        "alerts": alerts,
+        "count": total_count,
+        "severity_breakdown": severity_counts,
+        "timestamp": datetime.now().isoformat(),
+        "limited": total_count > 20
+    }
+    
+    logger.info(f"Retrieved {total_count} active alerts, returning {len(alerts)}")
+    
+    return {
+        "status": "success",
+        "alerts": alerts,
+        "total_count": total_count,
+        "returned_count": len(alerts),
+        "severity_breakdown": severity_counts,
+        "timestamp": datetime.now().isoformat(),
+        "limited": total_count > 10,
+        "note": f"Showing top {len(alerts)} critical alerts out of {total_count} total" if total_count > 10 else None
+    }
+
+
+# Concurrent NWS requests per tool call
+NWS_MAX_CONCURRENCY = 8
+
+
+# Speculative alert fetches started while the chat orchestrator is still routing,
+# keyed by alerts URL. Results land in the response cache; the alert tools only
+# wait on a fetch that is still in flight instead of starting a duplicate one.
+PREFETCH_MAX_STATES = 3
+PREFETCH_WAIT_TIMEOUT = 10
+_prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_MAX_STATES, thread_name_prefix="prefetch")
+_alerts_prefetch: Dict[str, Future] = {}
+
+
+def prefetch_nws_alerts(states: List[str]) -> List[str]:
+    """Start background fetches of the active alerts for states likely to be asked about.
+    
+    Returns the state codes a fetch was started for (already cached or in-flight
+    states are skipped). A misrouted query costs one unused, cached request.
+    """
+    for url in [url for url, future in _alerts_prefetch.items() if future.done()]:
+        _alerts_prefetch.pop(url, None)
+    
+    started = []
+    for code in list(dict.fromkeys(normalize_state_code(state) for state in states))[:PREFETCH_MAX_STATES]:
+        url = f"{NWS_API_BASE}/alerts/active?area={code}"
+        if url in _alerts_prefetch or _cache_get(_cache_key(url, None)) is not None:
+            continue
+        _alerts_prefetch[url] = _prefetch_pool.submit(
+            _cached_get_json, url, ALERTS_TTL, headers=NWS_HEADERS, transform=_slim_alerts
+        )
+        started.append(code)
+    if started:
+        logger.info(f"🔮 Prefetching NWS alerts for {', '.join(started)}")
+    return started
+
+
+@track_tool_call("get_nws_alerts_multi")
+async def get_nws_alerts_multi(
+    tool_context: ToolContext,
+    states: List[str],
+    severity: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get active weather alerts for several states in one call (fetched concurrently).
+    
+    Args:
+        states (list): State names or two-letter codes (e.g., ["CA", "Oregon", "WA"])
+        severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
         
-        # Save to state
-        tool_context.state["alerts"] = {
-            "alerts": alerts,
-            "count": total_count,
-            "severity_breakdown": severity_counts,
-            "timestamp": datetime.now().isoformat(),
-            "limited": total_count > 20
-        }
+    Returns:
+        dict: Active weather alerts across all requested states
+    """
+    try:
+        codes = list(dict.fromkeys(normalize_state_code(state) for state in states if state.strip()))
+        if not codes:
+            return {
+                "status": "error",
+                "message": "No state codes provided"
+            }
         
-        logger.info(f"Retrieved {total_count} active alerts, returning {len(alerts)}")
+        semaphore = asyncio.Semaphore(NWS_MAX_CONCURRENCY)
+        
+        async def fetch(code: str) -> List[Dict[str, Any]]:
+            # Same cache entries as get_nws_alerts(state=code)
+            url = f"{NWS_API_BASE}/alerts/active?area={code}"
+            pending = _alerts_prefetch.pop(url, None)
+            if pending is not None:
+                await asyncio.wait([asyncio.wrap_future(pending)], timeout=PREFETCH_WAIT_TIMEOUT)
+            key = _cache_key(url, None)
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached.get("features", [])
+            async with semaphore:
+                response = await _get_async_http().get(url, headers=NWS_HEADERS)
+                response.raise_for_status()
+            # Decode and trim multi-MB payloads off the event loop
+            data = await asyncio.to_thread(lambda: _slim_alerts(_json_loads(response.content)))
+            _cache_set(key, data, ALERTS_TTL)
+            return data.get("features", [])
+        
+        results = await asyncio.gather(*(fetch(code) for code in codes), return_exceptions=True)
+        
+        # Alerts covering zones in several states are returned once per state
+        features = {}
+        failed = []
+        for code, result in zip(codes, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting NWS alerts for {code}: {str(result)}")
+                failed.append(code)
+                continue
+            for feature in result:
+                features.setdefault(feature.get("id") or id(feature), feature)
         
-        return {
-            "status": "success",
-            "alerts": alerts,
-            "total_count": total_count,
-            "returned_count": len(alerts),
-            "severity_breakdown": severity_counts,
-            "timestamp": datetime.now().isoformat(),
-            "limited": total_count > 10,
-            "note": f"Showing top {len(alerts)} critical alerts out of {total_count} total" if total_count > 10 else None
-        }
+        if len(failed) == len(codes):
+            return {
+                "status": "error",
+                "message": f"Failed to get alerts for {', '.join(failed)}"
+            }
+        
+        result = _summarize_alerts(tool_context, list(features.values()), severity, national=False)
+        result["states"] = codes
+        if failed:
+            result["failed_states"] = failed
+        return result
     
     except Exception as e:
         logger.error(f"Error getting NWS alerts: {str(e)}")
@@ -690,9 +1204,7 @@ def get_current_conditions(
     try:
         # Get latest observation
         obs_url = f"{NWS_API_BASE}/stations/{station_id}/observations/latest"
-        obs_response = requests.get(obs_url, headers=NWS_HEADERS, timeout=10)
-        obs_response.raise_for_status()
-        obs_data = obs_response.json()
+        obs_data = _cached_get_json(obs_url, CURRENT_CONDITIONS_TTL, headers=NWS_HEADERS)
         
         props = obs_data.get("properties", {})
         
@@ -748,9 +1260,7 @@ def get_hurricane_track(
         # Get active tropical cyclones
         active_storms_url = "https://www.nhc.noaa.gov/CurrentStorms.json"
         
-        response = requests.get(active_storms_url, timeout=15)
-        response.raise_for_status()
-        storms_data = response.json()
+        storms_data = _cached_get_json(active_storms_url, HURRICANE_TTL, timeout=15)
         
         active_storms = []
         
@@ -858,6 +1368,8 @@ def get_hurricane_track(
 # Google Maps API Configuration
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 GOOGLE_MAPS_BASE = "https://maps.googleapis.com/maps/api"
+DIRECTIONS_URL = f"{GOOGLE_MAPS_BASE}/directions/json"
+PLACES_URL = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
 
 
 @track_tool_call("geocode_address")
@@ -880,16 +1392,18 @@ def geocode_address(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Call Google Maps Geocoding API
+        # Call Google Maps Geocoding API (the address is normalized so "Miami,  FL"
+        # and "miami, fl" share a cache entry; geocoding ignores case)
         geocode_url = f"{GOOGLE_MAPS_BASE}/geocode/json"
         params = {
-            "address": address,
+            "address": " ".join(address.split()).lower(),
             "key": GOOGLE_MAPS_API_KEY
         }
         
-        response = requests.get(geocode_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _cached_get_json(
+            geocode_url, GEOCODE_TTL, params=params,
+            cacheable=lambda payload: payload.get("status") == "OK"
+        )
         
         if data["status"] != "OK":
             return {
@@ -928,6 +1442,71 @@ def geocode_address(
         }
 
 
+def _directions_params(origin: str, destination: str, mode: str, alternatives: bool) -> Dict[str, Any]:
+    return {
+        "origin": origin,
+        "destination": destination,
+        "mode": mode,
+        "alternatives": str(alternatives).lower(),
+        "key": GOOGLE_MAPS_API_KEY
+    }
+
+
+def _fetch_directions(origin: str, destination: str, mode: str, alternatives: bool) -> Dict[str, Any]:
+    """One Directions API request; raises ValueError on a failed API status"""
+    # Call Google Maps Directions API
+    response = _http.get(
+        DIRECTIONS_URL, params=_directions_params(origin, destination, mode, alternatives), timeout=10
+    )
+    response.raise_for_status()
+    return _parse_directions(_json_loads(response.content), origin, destination, mode)
+
+
+async def _fetch_directions_async(origin: str, destination: str, mode: str, alternatives: bool) -> Dict[str, Any]:
+    """_fetch_directions on the shared async client"""
+    response = await _get_async_http().get(
+        DIRECTIONS_URL, params=_directions_params(origin, destination, mode, alternatives)
+    )
+    response.raise_for_status()
+    return _parse_directions(_json_loads(response.content), origin, destination, mode)
+
+
+def _parse_directions(data: Dict[str, Any], origin: str, destination: str, mode: str) -> Dict[str, Any]:
+    if data["status"] != "OK":
+        raise ValueError(f"Directions failed: {data.get('status')}")
+    
+    # Extract routes
+    routes = []
+    for route in data["routes"]:
+        leg = route["legs"][0]  # First leg
+        routes.append({
+            "summary": route.get("summary", "Route"),
+            "distance": leg["distance"]["text"],
+            "distance_meters": leg["distance"]["value"],
+            "duration": leg["duration"]["text"],
+            "duration_seconds": leg["duration"]["value"],
+            "start_address": leg["start_address"],
+            "end_address": leg["end_address"],
+            "steps": [
+                {
+                    "instruction": step["html_instructions"],
+                    "distance": step["distance"]["text"],
+                    "duration": step["duration"]["text"]
+                }
+                for step in leg["steps"][:5]  # First 5 steps only
+            ]
+        })
+    
+    logger.info(f"Got directions: {origin} -> {destination}, {len(routes)} routes")
+    
+    return {
+        "origin": origin,
+        "destination": destination,
+        "mode": mode,
+        "routes": routes
+    }
+
+
 @track_tool_call("get_directions")
 def get_directions(
     tool_context: ToolContext,
@@ -954,64 +1533,86 @@ def get_directions(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Call Google Maps Directions API
-        directions_url = f"{GOOGLE_MAPS_BASE}/directions/json"
-        params = {
-            "origin": origin,
-            "destination": destination,
-            "mode": mode,
-            "alternatives": alternatives,
-            "key": GOOGLE_MAPS_API_KEY
-        }
+        directions_result = _fetch_directions(origin, destination, mode, alternatives)
         
-        response = requests.get(directions_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        # Save to state
+        tool_context.state["directions"] = directions_result
         
-        if data["status"] != "OK":
+        return {
+            "status": "success",
+            "result": directions_result
+        }
+    
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+    except Exception as e:
+        logger.error(f"Error getting directions: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get directions: {str(e)}"
+        }
+
+
+@track_tool_call("get_directions_batch")
+async def get_directions_batch(
+    tool_context: ToolContext,
+    origin: str,
+    destinations: List[str],
+    mode: str = "driving",
+    alternatives: bool = True
+) -> Dict[str, Any]:
+    """Get directions from one origin to several destinations in one call (fetched concurrently).
+    
+    Args:
+        origin (str): Starting location (address or "lat,lng")
+        destinations (list): Ending locations (addresses or "lat,lng")
+        mode (str): Travel mode - "driving", "walking", "bicycling", "transit"
+        alternatives (bool): Whether to return alternative routes
+        
+    Returns:
+        dict: Directions for each destination, in the order given
+    """
+    try:
+        if not GOOGLE_MAPS_API_KEY:
             return {
                 "status": "error",
-                "message": f"Directions failed: {data.get('status')}"
+                "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Extract routes
-        routes = []
-        for route in data["routes"]:
-            leg = route["legs"][0]  # First leg
-            routes.append({
-                "summary": route.get("summary", "Route"),
-                "distance": leg["distance"]["text"],
-                "distance_meters": leg["distance"]["value"],
-                "duration": leg["duration"]["text"],
-                "duration_seconds": leg["duration"]["value"],
-                "start_address": leg["start_address"],
-                "end_address": leg["end_address"],
-                "steps": [
-                    {
-                        "instruction": step["html_instructions"],
-                        "distance": step["distance"]["text"],
-                        "duration": step["duration"]["text"]
-                    }
-                    for step in leg["steps"][:5]  # First 5 steps only
-                ]
-            })
+        destinations = list(dict.fromkeys(destination for destination in destinations if destination))
+        results = await asyncio.gather(
+            *(_fetch_directions_async(origin, destination, mode, alternatives) for destination in destinations),
+            return_exceptions=True
+        )
+        
+        directions = []
+        failed = []
+        for destination, result in zip(destinations, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting directions to {destination}: {str(result)}")
+                failed.append(destination)
+            else:
+                directions.append(result)
         
-        directions_result = {
-            "origin": origin,
-            "destination": destination,
-            "mode": mode,
-            "routes": routes
-        }
+        if not directions:
+            return {
+                "status": "error",
+                "message": f"Failed to get directions to {', '.join(failed)}"
+            }
         
         # Save to state
-        tool_context.state["directions"] = directions_result
-        
-        logger.info(f"Got directions: {origin} -> {destination}, {len(routes)} routes")
+        tool_context.state["directions_batch"] = directions
         
-        return {
+        result = {
             "status": "success",
-            "result": directions_result
+            "results": directions
         }
+        if failed:
+            result["failed_destinations"] = failed
+        return result
     
     except Exception as e:
         logger.error(f"Error getting directions: {str(e)}")
@@ -1021,6 +1622,68 @@ def get_directions(
         }
 
 
+def _places_params(location: str, place_type: str, radius: int, keyword: Optional[str]) -> Dict[str, Any]:
+    params = {
+        "location": location,
+        "radius": radius,
+        "type": place_type,
+        "key": GOOGLE_MAPS_API_KEY
+    }
+    if keyword:
+        params["keyword"] = keyword
+    return params
+
+
+def _search_places(location: str, place_type: str, radius: int, keyword: Optional[str]) -> Dict[str, Any]:
+    """One Places Nearby Search request; raises ValueError on a failed API status"""
+    # Call Google Maps Places Nearby Search API
+    response = _http.get(PLACES_URL, params=_places_params(location, place_type, radius, keyword), timeout=10)
+    response.raise_for_status()
+    return _parse_places(_json_loads(response.content), location, place_type, radius, keyword)
+
+
+async def _search_places_async(location: str, place_type: str, radius: int, keyword: Optional[str]) -> Dict[str, Any]:
+    """_search_places on the shared async client"""
+    response = await _get_async_http().get(PLACES_URL, params=_places_params(location, place_type, radius, keyword))
+    response.raise_for_status()
+    return _parse_places(_json_loads(response.content), location, place_type, radius, keyword)
+
+
+def _parse_places(
+    data: Dict[str, Any],
+    location: str,
+    place_type: str,
+    radius: int,
+    keyword: Optional[str]
+) -> Dict[str, Any]:
+    if data["status"] not in ["OK", "ZERO_RESULTS"]:
+        raise ValueError(f"Places search failed: {data.get('status')}")
+    
+    # Extract places
+    places = []
+    for place in data.get("results", [])[:10]:  # Limit to 10 results
+        places.append({
+            "name": place.get("name"),
+            "address": place.get("vicinity"),
+            "location": place["geometry"]["location"],
+            "place_id": place.get("place_id"),
+            "types": place.get("types", []),
+            "rating": place.get("rating"),
+            "open_now": place.get("opening_hours", {}).get("open_now")
+        })
+    
+    logger.info(f"Found {len(places)} places of type '{place_type}' near {location}")
+    
+    return {
+        "location": location,
+        "place_type": place_type,
+        "radius_meters": radius,
+        "keyword": keyword,
+        "places": places,
+        "count": len(places)
+    }
+
+
 @track_tool_call("search_nearby_places")
 def search_nearby_places(
     tool_context: ToolContext,
@@ -1047,59 +1710,86 @@ def search_nearby_places(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Call Google Maps Places Nearby Search API
-        places_url = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
-        params = {
-            "location": location,
-            "radius": radius,
-            "type": place_type,
-            "key": GOOGLE_MAPS_API_KEY
-        }
+        search_result = _search_places(location, place_type, radius, keyword)
         
-        if keyword:
-            params["keyword"] = keyword
+        # Save to state
+        tool_context.state["nearby_places"] = search_result
         
-        response = requests.get(places_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        return {
+            "status": "success",
+            "result": search_result
+        }
+    
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+    except Exception as e:
+        logger.error(f"Error searching nearby places: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to search places: {str(e)}"
+        }
+
+
+@track_tool_call("search_nearby_places_multi")
+async def search_nearby_places_multi(
+    tool_context: ToolContext,
+    location: str,
+    place_types: List[str],
+    radius: int = 5000,
+    keyword: Optional[str] = None
+) -> Dict[str, Any]:
+    """Search for several types of nearby places in one call (searched concurrently).
+    
+    Args:
+        location (str): Center point as "lat,lng"
+        place_types (list): Types of place (e.g., ["hospital", "emergency shelter", "pharmacy"])
+        radius (int): Search radius in meters (default 5000m = 5km)
+        keyword (str): Optional keyword to refine search (e.g., "emergency")
         
-        if data["status"] not in ["OK", "ZERO_RESULTS"]:
+    Returns:
+        dict: Nearby places for each place type
+    """
+    try:
+        if not GOOGLE_MAPS_API_KEY:
             return {
                 "status": "error",
-                "message": f"Places search failed: {data.get('status')}"
+                "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Extract places
-        places = []
-        for place in data.get("results", [])[:10]:  # Limit to 10 results
-            places.append({
-                "name": place.get("name"),
-                "address": place.get("vicinity"),
-                "location": place["geometry"]["location"],
-                "place_id": place.get("place_id"),
-                "types": place.get("types", []),
-                "rating": place.get("rating"),
-                "open_now": place.get("opening_hours", {}).get("open_now")
-            })
+        place_types = list(dict.fromkeys(place_type for place_type in place_types if place_type))
+        results = await asyncio.gather(
+            *(_search_places_async(location, place_type, radius, keyword) for place_type in place_types),
+            return_exceptions=True
+        )
+        
+        searches = {}
+        failed = []
+        for place_type, result in zip(place_types, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error searching nearby {place_type}: {str(result)}")
+                failed.append(place_type)
+            else:
+                searches[place_type] = result
         
-        search_result = {
-            "location": location,
-            "place_type": place_type,
-            "radius_meters": radius,
-            "keyword": keyword,
-            "places": places,
-            "count": len(places)
-        }
+        if not searches:
+            return {
+                "status": "error",
+                "message": f"Failed to search places: {', '.join(failed)}"
+            }
         
         # Save to state
-        tool_context.state["nearby_places"] = search_result
-        
-        logger.info(f"Found {len(places)} places of type '{place_type}' near {location}")
+        tool_context.state["nearby_places_by_type"] = searches
         
-        return {
+        result = {
             "status": "success",
-            "result": search_result
+            "results": searches
         }
+        if failed:
+            result["failed_types"] = failed
+        return result
     
     except Exception as e:
         logger.error(f"Error searching nearby places: {str(e)}")
@@ -1261,9 +1951,7 @@ def get_census_tracts_in_area(
         
         query += " AND total_pop > 0 ORDER BY elderly_percentage DESC LIMIT 100"
         
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = bq_client.query(query, job_config=job_config)
-        results = query_job.result()
+        results = _cached_query(query, query_params)
         
         census_tracts = []
         for row in results:
@@ -1320,6 +2008,111 @@ def get_census_tracts_in_area(
         }
 
 
+def _flood_rows(state: str) -> List[SimpleNamespace]:
+    """Historical heavy-precipitation days (2015-2024) at a state's weather stations"""
+    # Query NOAA historical weather data for flooding events
+    # Join with stations table to filter by state
+    query = """
+    SELECT 
+        w.date,
+        w.stn AS station_id,
+        s.name AS station_name,
+        s.lat AS latitude,
+        s.lon AS longitude,
+        w.prcp AS precipitation,
+        w.temp AS temperature
+    FROM `bigquery-public-data.noaa_gsod.gsod*` w
+    JOIN `bigquery-public-data.noaa_gsod.stations` s
+    ON w.stn = s.usaf AND w.wban = s.wban
+    WHERE s.state = @state
+    AND w.prcp IS NOT NULL
+    AND w.prcp > 5.0  -- Heavy precipitation (> 5 inches) indicating potential flooding
+    AND _TABLE_SUFFIX BETWEEN '2015' AND '2024'
+    ORDER BY w.date DESC, w.prcp DESC
+    LIMIT 100
+    """
+    
+    query_params = [
+        bigquery.ScalarQueryParameter("state", "STRING", state)
+    ]
+    
+    return _cached_query(query, query_params)
+
+
+def _flood_events(state: str) -> List[Dict[str, Any]]:
+    """A state's historical heavy-precipitation days as flood event dicts"""
+    state = normalize_state_code(state)
+    # Wait on a prefetch of the same state if one is still running (keyed by code)
+    pending = _flood_prefetch.pop(state, None)
+    if pending is not None:
+        wait([pending], timeout=PREFETCH_WAIT_TIMEOUT)
+    results = _flood_rows(state)
+    
+    flood_events = []
+    for row in results:
+        flood_events.append({
+            "date": str(row.date),
+            "station_id": row.station_id,
+            "station_name": row.station_name,
+            "latitude": row.latitude,
+            "longitude": row.longitude,
+            "precipitation_inches": round(row.precipitation, 2) if row.precipitation else 0,
+            "temperature_f": round(row.temperature, 1) if row.temperature else None,
+            "severity": "Major" if row.precipitation and row.precipitation > 10 else "Moderate",
+            "state": state  # Add state to each event for tracking
+        })
+    return flood_events
+
+
+# Flood queries started before the model asks for them (see prefetch_flood_risk_data),
+# keyed by state code
+_flood_prefetch: Dict[str, Future] = {}
+
+
+def prefetch_flood_risk_data(states: List[str]) -> List[str]:
+    """Start background flood-history queries for states an agent is about to look up.
+    
+    Lets the BigQuery query run while the model is still writing the tool call.
+    Returns the state codes a query was started for (in-flight states are
+    skipped; a finished query is a cache hit).
+    """
+    for code in [code for code, future in _flood_prefetch.items() if future.done()]:
+        _flood_prefetch.pop(code, None)
+    
+    started = []
+    for code in list(dict.fromkeys(normalize_state_code(state) for state in states if state.strip()))[:PREFETCH_MAX_STATES]:
+        if code in _flood_prefetch:
+            continue
+        _flood_prefetch[code] = _prefetch_pool.submit(_flood_rows, code)
+        started.append(code)
+    if started:
+        logger.info(f"🔮 Prefetching flood risk data for {', '.join(started)}")
+    return started
+
+
+def _remember_flood_events(tool_context: ToolContext, states: List[str], events: List[Dict[str, Any]], county: Optional[str]) -> None:
+    """Add events to the flood_risk_data accumulated in state across calls"""
+    # ACCUMULATE data across multiple states instead of overwriting
+    existing_data = tool_context.state.get("flood_risk_data", {})
+    all_events = existing_data.get("historical_events", []) + events
+    
+    # Track which states have been processed
+    processed_states = existing_data.get("processed_states", [])
+    processed_states += [state for state in states if state not in processed_states]
+    
+    # Save accumulated data to state
+    tool_context.state["flood_risk_data"] = {
+        "historical_events": all_events,
+        "count": len(all_events),
+        "processed_states": processed_states,
+        "latest_state": states[-1],
+        "county": county,
+        "timestamp": datetime.now().isoformat(),
+        "note": "Based on historical precipitation data. For detailed FEMA flood zones, integrate with National Flood Hazard Layer API."
+    }
+    logger.info(f"Total accumulated: {len(all_events)} flood events across {len(processed_states)} state(s)")
+
+
 @track_tool_call("get_flood_risk_data")
 def get_flood_risk_data(
     tool_context: ToolContext,
@@ -1331,81 +2124,17 @@ def get_flood_risk_data(
     Note: This uses available public datasets. For production, integrate with FEMA National Flood Hazard Layer.
     
     Args:
-        state (str): Two-letter state code
+        state (str): Two-letter state code (state names are also accepted)
         county (str, optional): County name or code
         
     Returns:
         dict: Flood risk information and historical flooding events
     """
     try:
-        # Query NOAA historical weather data for flooding events
-        # Join with stations table to filter by state
-        query = """
-        SELECT 
-            w.date,
-            w.stn AS station_id,
-            s.name AS station_name,
-            s.lat AS latitude,
-            s.lon AS longitude,
-            w.prcp AS precipitation,
-            w.temp AS temperature
-        FROM `bigquery-public-data.noaa_gsod.gsod*` w
-        JOIN `bigquery-public-data.noaa_gsod.stations` s
-        ON w.stn = s.usaf AND w.wban = s.wban
-        WHERE s.state = @state
-        AND w.prcp IS NOT NULL
-        AND w.prcp > 5.0  -- Heavy precipitation (> 5 inches) indicating potential flooding
-        AND _TABLE_SUFFIX BETWEEN '2015' AND '2024'
-        ORDER BY w.date DESC, w.prcp DESC
-        LIMIT 100
-        """
-        
-        query_params = [
-            bigquery.ScalarQueryParameter("state", "STRING", state)
-        ]
-        
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = bq_client.query(query, job_config=job_config)
-        results = query_job.result()
-        
-        flood_events = []
-        for row in results:
-            flood_events.append({
-                "date": str(row.date),
-                "station_id": row.station_id,
-                "station_name": row.station_name,
-                "latitude": row.latitude,
-                "longitude": row.longitude,
-                "precipitation_inches": round(row.precipitation, 2) if row.precipitation else 0,
-                "temperature_f": round(row.temperature, 1) if row.temperature else None,
-                "severity": "Major" if row.precipitation and row.precipitation > 10 else "Moderate",
-                "state": state  # Add state to each event for tracking
-            })
-        
-        # ACCUMULATE data across multiple states instead of overwriting
-        existing_data = tool_context.state.get("flood_risk_data", {})
-        existing_events = existing_data.get("historical_events", [])
-        
-        # Combine new events with existing events
-        all_events = existing_events + flood_events
-        
-        # Track which states have been processed
-        processed_states = existing_data.get("processed_states", [])
-        if state not in processed_states:
-            processed_states.append(state)
-        
-        # Save accumulated data to state
-        tool_context.state["flood_risk_data"] = {
-            "historical_events": all_events,
-            "count": len(all_events),
-            "processed_states": processed_states,
-            "latest_state": state,
-            "county": county,
-            "timestamp": datetime.now().isoformat(),
-            "note": "Based on historical precipitation data. For detailed FEMA flood zones, integrate with National Flood Hazard Layer API."
-        }
-        
-        logger.info(f"Retrieved {len(flood_events)} historical flood events for {state}. Total accumulated: {len(all_events)} events across {len(processed_states)} state(s)")
+        state = normalize_state_code(state)
+        flood_events = _flood_events(state)
+        logger.info(f"Retrieved {len(flood_events)} historical flood events for {state}")
+        _remember_flood_events(tool_context, [state], flood_events, county)
         
         return {
             "status": "success",
@@ -1425,12 +2154,179 @@ def get_flood_risk_data(
         }
 
 
+@track_tool_call("get_flood_risk_data_multi")
+async def get_flood_risk_data_multi(
+    tool_context: ToolContext,
+    states: List[str]
+) -> Dict[str, Any]:
+    """Get historical flood risk data for several states in one call (queried concurrently).
+    
+    Args:
+        states (list): State names or two-letter codes (e.g., ["FL", "GA", "SC"])
+        
+    Returns:
+        dict: Historical flooding events across all requested states
+    """
+    codes = list(dict.fromkeys(normalize_state_code(state) for state in states if state.strip()))
+    if not codes:
+        return {
+            "status": "error",
+            "message": "No state codes provided"
+        }
+    
+    results = await _gather_in_threads(_flood_events, [(code,) for code in codes])
+    
+    flood_events = []
+    found = []
+    failed = []
+    for code, result in zip(codes, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error getting flood risk data for {code}: {str(result)}")
+            failed.append(code)
+        else:
+            flood_events.extend(result)
+            found.append(code)
+    
+    if not found:
+        return {
+            "status": "error",
+            "message": f"Failed to get flood risk data: {', '.join(failed)}"
+        }
+    
+    _remember_flood_events(tool_context, found, flood_events, None)
+    
+    result = {
+        "status": "success",
+        "data": {
+            "historical_flood_events": flood_events,
+            "count": len(flood_events),
+            "summary": f"Found {len(flood_events)} historical high-precipitation events in {', '.join(found)} (2015-2024)",
+            "note": "Events with >5 inches precipitation indicating potential flooding"
+        }
+    }
+    if failed:
+        result["failed_states"] = failed
+    return result
+
+
+def _zone_type(zone_id: str) -> str:
+    """Determine the zone type from the third character of the zone ID"""
+    if len(zone_id) < 3:
+        return "forecast"  # Default
+    
+    type_char = zone_id[2].upper()
+    if type_char == 'Z':
+        return "forecast"
+    elif type_char == 'C':
+        return "county"
+    elif type_char == 'F':
+        return "fire"
+    else:
+        return "forecast"  # Default fallback
+
+
+def _geometry_centroid(geometry: Optional[Dict[str, Any]]) -> Optional[Dict[str, float]]:
+    """Extract centroid from geometry object"""
+    if not geometry:
+        return None
+        
+    geom_type = geometry.get("type")
+    
+    if geom_type == "Polygon":
+        coords = geometry.get("coordinates", [[]])[0]
+    elif geom_type == "MultiPolygon":
+        # Use first polygon
+        coords = geometry.get("coordinates", [[[]]])[0][0]
+    else:
+        coords = None
+    
+    if not coords:
+        return None
+    lons = [c[0] for c in coords]
+    lats = [c[1] for c in coords]
+    return {
+        "lon": sum(lons) / len(lons),
+        "lat": sum(lats) / len(lats)
+    }
+
+
+# Zone centroids are effectively static: an in-process LRU in front of the
+# shared Redis cache (when configured), so restarts and other workers reuse them
+ZONE_CACHE_SIZE = 4096
+ZONE_TTL = 30 * 24 * 3600
+_zone_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _remember_zone(zone_id: str, marker: Dict[str, Any]) -> None:
+    if len(_zone_cache) >= ZONE_CACHE_SIZE:
+        _zone_cache.pop(next(iter(_zone_cache)))
+    _zone_cache[zone_id] = marker
+
+
+async def _resolve_zone(zone_id: str, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+    """Fetch a zone's geometry (trying fallback endpoints) and return its centroid marker"""
+    cached = _zone_cache.pop(zone_id, None)
+    if cached is not None:
+        _zone_cache[zone_id] = cached  # Most recently used
+        return cached
+    
+    shared_key = f"{CACHE_KEY_PREFIX}zone:{zone_id}"
+    if _get_redis() is not None:
+        cached = _cache_get(shared_key)
+        if cached is not None:
+            _remember_zone(zone_id, cached)
+            return cached
+    
+    zone_type = _zone_type(zone_id)
+    
+    # Try different endpoints based on zone type
+    endpoints = [
+        f"{NWS_API_BASE}/zones/{zone_type}/{zone_id}",
+        f"{NWS_API_BASE}/zones/forecast/{zone_id}",  # Fallback
+        f"{NWS_API_BASE}/zones/county/{zone_id}",    # Fallback
+    ]
+    
+    data = None
+    async with semaphore:
+        for url in dict.fromkeys(endpoints):
+            try:
+                response = await _get_async_http().get(url, headers=NWS_HEADERS)
+                if response.status_code == 200:
+                    data = _json_loads(response.content)
+                    break
+            except Exception:
+                continue
+    
+    if not data:
+        logger.warning(f"Failed to get coordinates for zone {zone_id} from all endpoints")
+        return None
+    
+    centroid = _geometry_centroid(data.get("geometry"))
+    if not centroid:
+        logger.warning(f"No geometry found for zone {zone_id}")
+        return None
+    
+    marker = {
+        "zone_id": zone_id,
+        "latitude": round(centroid["lat"], 4),
+        "longitude": round(centroid["lon"], 4),
+        "name": data.get("properties", {}).get("name", zone_id),
+        "type": zone_type
+    }
+    logger.info(f"Got coordinates for {zone_type} zone {zone_id}: ({centroid['lat']}, {centroid['lon']})")
+    
+    _remember_zone(zone_id, marker)
+    if _get_redis() is not None:
+        _cache_set(shared_key, marker, ZONE_TTL)
+    return marker
+
+
 @track_tool_call("get_zone_coordinates")
-def get_zone_coordinates(
+async def get_zone_coordinates(
     tool_context: ToolContext,
     zone_ids: list[str]
 ) -> Dict[str, Any]:
-    """Get geographic coordinates for NWS zone IDs.
+    """Get geographic coordinates for NWS zone IDs (all zones in one call).
     
     Supports multiple zone types:
     - Forecast zones (e.g., FLZ069, TXZ123)
@@ -1438,101 +2334,30 @@ def get_zone_coordinates(
     - Fire weather zones (e.g., FLZ001)
     
     Args:
-        zone_ids (list[str]): List of NWS zone IDs
+        zone_ids (list[str]): List of NWS zone IDs (zone URLs are also accepted)
         
     Returns:
         dict: Coordinates for each zone with status
     """
     try:
-        zone_coords = []
+        # Accept zone URLs as well as bare IDs; drop duplicates but keep order
+        zone_ids = list(dict.fromkeys(
+            zone_id.rstrip("/").rsplit("/", 1)[-1].upper() for zone_id in zone_ids if zone_id
+        ))
+        
+        # Zones are fetched concurrently, bounded like get_nws_alerts_multi
+        semaphore = asyncio.Semaphore(NWS_MAX_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_resolve_zone(zone_id, semaphore) for zone_id in zone_ids),
+            return_exceptions=True
+        )
         
-        # Determine zone type based on the third character
-        def get_zone_type(zone_id):
-            """Determine the zone type from the zone ID."""
-            if len(zone_id) < 3:
-                return "forecast"  # Default
-            
-            type_char = zone_id[2].upper()
-            if type_char == 'Z':
-                return "forecast"
-            elif type_char == 'C':
-                return "county"
-            elif type_char == 'F':
-                return "fire"
-            else:
-                return "forecast"  # Default fallback
-        
-        def extract_geometry_centroid(geometry):
-            """Extract centroid from geometry object."""
-            if not geometry:
-                return None
-                
-            geom_type = geometry.get("type")
-            
-            if geom_type == "Polygon":
-                coords = geometry.get("coordinates", [[]])[0]
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return {
-                        "lon": sum(lons) / len(lons),
-                        "lat": sum(lats) / len(lats)
-                    }
-            elif geom_type == "MultiPolygon":
-                # Use first polygon
-                coords = geometry.get("coordinates", [[[]]])[0][0]
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return {
-                        "lon": sum(lons) / len(lons),
-                        "lat": sum(lats) / len(lats)
-                    }
-            
-            return None
-        
-        for zone_id in zone_ids:
-            try:
-                zone_type = get_zone_type(zone_id)
-                
-                # Try different endpoints based on zone type
-                endpoints = [
-                    f"{NWS_API_BASE}/zones/{zone_type}/{zone_id}",
-                    f"{NWS_API_BASE}/zones/forecast/{zone_id}",  # Fallback
-                    f"{NWS_API_BASE}/zones/county/{zone_id}",    # Fallback
-                ]
-                
-                data = None
-                for url in endpoints:
-                    try:
-                        response = requests.get(url, headers=NWS_HEADERS, timeout=10)
-                        if response.status_code == 200:
-                            data = response.json()
-                            break
-                    except:
-                        continue
-                
-                if data:
-                    geometry = data.get("geometry")
-                    centroid = extract_geometry_centroid(geometry)
-                    
-                    if centroid:
-                        zone_coords.append({
-                            "zone_id": zone_id,
-                            "latitude": round(centroid["lat"], 4),
-                            "longitude": round(centroid["lon"], 4),
-                            "name": data.get("properties", {}).get("name", zone_id),
-                            "type": zone_type
-                        })
-                        logger.info(f"Got coordinates for {zone_type} zone {zone_id}: ({centroid['lat']}, {centroid['lon']})")
-                    else:
-                        logger.warning(f"No geometry found for zone {zone_id}")
-                else:
-                    logger.warning(f"Failed to get coordinates for zone {zone_id} from all endpoints")
-                    
-            except Exception as e:
-                logger.error(f"Error getting coordinates for zone {zone_id}: {str(e)}")
-                continue
+        zone_coords = []
+        for zone_id, result in zip(zone_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting coordinates for zone {zone_id}: {str(result)}")
+            elif result:
+                zone_coords.append(result)
         
         if not zone_coords:
             return {
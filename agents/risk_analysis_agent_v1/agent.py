@@ -1,8 +1,19 @@
-from typing import List
-from google.adk.agents import LlmAgent, SequentialAgent
+import re
+import json
+import logging
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from google.genai import types
+from google.adk.agents import BaseAgent, LlmAgent, SequentialAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.models import LlmRequest, LlmResponse
 from pydantic import BaseModel, Field
-from .tools.tools import get_census_tracts_in_area, get_flood_risk_data, get_nws_alerts, get_census_demographics, geocode_address
+from .tools.tools import get_census_tracts_in_area, get_census_demographics_multi, get_flood_risk_data_multi, geocode_address, prefetch_flood_risk_data, run_in_thread
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.llm import gemini, use_cached_output_schema
+
+logger = logging.getLogger(__name__)
 
 class RiskAnalysisSummary(BaseModel):
     """Structured output for risk analysis"""
@@ -16,7 +27,7 @@ class RiskAnalysisSummary(BaseModel):
 
 # Phase 1: Alert Parser
 alert_parser = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     name="alert_parser",
     description="Parses a single weather alert to extract key information for risk analysis",
     instruction="""
@@ -39,8 +50,20 @@ alert_parser = LlmAgent(
 )
 
 # Phase 2: Census Data Retriever
+# County/zone URLs and codes start with the state: CAC073, FLZ063
+ZONE_STATE_PATTERN = re.compile(r"\b([A-Z]{2})[CZ]\d{3}\b")
+
+
+def prefetch_alert_flood_data(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: for flood alerts, start the affected states' flood queries while the model writes its tool calls"""
+    parsed = str(callback_context.state.get("parsed_alert_data") or "")
+    if "flood" in parsed.lower():
+        prefetch_flood_risk_data(ZONE_STATE_PATTERN.findall(parsed))
+    return None
+
+
 census_data_retriever = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     name="census_data_retriever",
     description="Retrieves population and flood zone data for affected areas",
     instruction="""
@@ -49,8 +72,8 @@ census_data_retriever = LlmAgent(
     **Your Task:**
     1.  **Get Parsed Data**: Access the structured data from `state['parsed_alert_data']`.
     2.  **Extract County Codes**: From the `affected_zones` list, extract the county FIPS code from each URL (e.g., extract `CAC073` from `https://api.weather.gov/zones/county/CAC073`).
-    3.  **Get Demographics**: Use the extracted county codes with the `get_census_demographics` tool to get population data.
-    4.  **Get Flood Risk**: If the alert `event` from the parsed data is flood-related, use the `get_flood_risk_data` tool.
+    3.  **Get Demographics**: Call `get_census_demographics_multi` exactly once with every affected location as "City, ST" (use the county or area names from `areaDesc` with the state code from the county codes) to get population data.
+    4.  **Get Flood Risk**: If the alert `event` from the parsed data is flood-related, call `get_flood_risk_data_multi` exactly once with all affected state codes. Issue it in the same response as the demographics call so both run concurrently.
     5.  **Calculate Total Population**: Sum the populations from all affected census tracts to get a total `population_at_risk`.
     6.  **Store Data**: Store the combined census and flood risk data for the next agent.
 
@@ -58,46 +81,107 @@ census_data_retriever = LlmAgent(
 
     Pass the aggregated census and risk data to the risk calculator.
     """,
-    tools=[get_census_demographics, get_census_tracts_in_area, get_flood_risk_data, geocode_address],
+    tools=[get_census_demographics_multi, run_in_thread(get_census_tracts_in_area), get_flood_risk_data_multi, run_in_thread(geocode_address)],
     output_key="census_data",
-    before_model_callback=log_agent_entry,
+    before_model_callback=[log_agent_entry, prefetch_alert_flood_data],
     after_model_callback=log_agent_exit,
 )
 
-# Phase 3: Risk Calculator
-risk_calculator = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="risk_calculator",
-    description="Calculates risk scores based on alert severity and population data",
-    instruction="""
-    You are a risk assessment specialist.
-    
-    **Your Task:**
-    1. Get alert severity from `state['alert_data']`.
-    2. Get population data from `state['census_data']`.
-    3. Get flood risk if available from `state['census_data']`.
-    4. Calculate a risk score (0-100) based on:
-       - Severity (Minor=10, Moderate=40, Severe=70, Extreme=90)
-       - Population density (higher density = higher score)
-       - Flood risk (if present, adds to score)
-       - Assign a risk level based on the score:
-       - 0-25: Low
-       - 26-50: Medium
-       - 51-75: High
-       - 76-100: Severe
+# Phase 3: Risk Calculator - Fixed scoring table, computed in Python (no model call)
+SEVERITY_SCORES = {"Minor": 10, "Moderate": 40, "Severe": 70, "Extreme": 90}
+# Points added for the affected population: (minimum population, points)
+POPULATION_POINTS = ((1_000_000, 10), (250_000, 7), (50_000, 4), (0, 0))
+MAJOR_FLOOD_POINTS = 10
+FLOOD_POINTS = 5
+RISK_LEVELS = ((76, "Severe"), (51, "High"), (26, "Medium"), (0, "Low"))
+VULNERABLE_AREAS = 5
+# Census tool → key of its tract list in the tool result
+TRACT_LISTS = {"get_census_demographics": "tracts", "get_census_tracts_in_area": "census_tracts"}
+FLOOD_TOOLS = ("get_flood_risk_data", "get_flood_risk_data_multi")
+
+# "severity": "Severe", Severity: Severe, **Severity**: Severe
+SEVERITY_PATTERN = re.compile(r"severity\W+(extreme|severe|moderate|minor)\b", re.I)
+
+
+def compute_risk(severity: str, tracts: List[Dict[str, Any]], flood_events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Score an alert from its severity, the affected census tracts and historical flooding"""
+    population = sum(tract["population"] for tract in tracts)
+    # Unknown severity is scored as Moderate rather than understating the risk
+    severity_points = SEVERITY_SCORES.get(severity, SEVERITY_SCORES["Moderate"])
+    population_points = next(points for minimum, points in POPULATION_POINTS if population >= minimum)
+    flood_points = MAJOR_FLOOD_POINTS if any(event.get("severity") == "Major" for event in flood_events) \
+        else FLOOD_POINTS if flood_events else 0
+    score = min(100, severity_points + population_points + flood_points)
     
-    5. Identify vulnerable areas (high population + high severity)
+    # Most populous tracts, when the alert itself is severe
+    vulnerable = sorted(tracts, key=lambda tract: tract["population"], reverse=True)[:VULNERABLE_AREAS] \
+        if severity in ("Severe", "Extreme") else []
+    return {
+        "severity": severity or "Unknown",
+        "population_at_risk": population,
+        "census_tracts": len(tracts),
+        "historical_flood_events": len(flood_events),
+        "risk_score": score,
+        "risk_level": next(level for minimum, level in RISK_LEVELS if score >= minimum),
+        "score_breakdown": {"severity": severity_points, "population": population_points, "flood": flood_points},
+        "vulnerable_areas": [tract["name"] for tract in vulnerable],
+    }
+
+
+class RiskCalculator(BaseAgent):
+    """Scores the alert from the parsed alert and this run's census and flood tool results"""
     
-    Store risk scores for the recommendation generator.
-    """,
-    output_key="risk_scores",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        request = " ".join(part.text for part in (ctx.user_content.parts or []) if part.text) \
+            if ctx.user_content else ""
+        match = SEVERITY_PATTERN.search(str(ctx.session.state.get("parsed_alert_data") or "")) or \
+            SEVERITY_PATTERN.search(request)
+        severity = match.group(1).capitalize() if match else ""
+        
+        # State keeps only the latest census lookup, so collect every tool
+        # result of this run from the function responses
+        tracts: Dict[str, Dict[str, Any]] = {}
+        flood_events = []
+        for event in ctx.session.events:
+            if event.invocation_id != ctx.invocation_id:
+                continue
+            for response in event.get_function_responses():
+                result = response.response or {}
+                if response.name in FLOOD_TOOLS:
+                    flood_events.extend((result.get("data") or {}).get("historical_flood_events") or [])
+                    continue
+                if response.name == "get_census_demographics_multi":
+                    found = [tract for summary in (result.get("results") or {}).values() for tract in summary.get("tracts") or []]
+                elif response.name in TRACT_LISTS:
+                    found = (result.get("data") or {}).get(TRACT_LISTS[response.name]) or []
+                else:
+                    continue
+                for tract in found:
+                    tracts.setdefault(tract.get("geo_id") or str(len(tracts)), {
+                        "name": tract.get("geo_id") or "Unknown tract",
+                        "population": tract.get("population") or tract.get("total_population") or 0,
+                    })
+        
+        scores = compute_risk(severity, list(tracts.values()), flood_events)
+        logger.info(f"✅ Risk score {scores['risk_score']} ({scores['risk_level']}) for {scores['population_at_risk']:,} people")
+        # The scores are also the event text, so the recommendations generator sees them
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=json.dumps(scores))]),
+            actions=EventActions(state_delta={"risk_scores": scores}),
+        )
+
+
+risk_calculator = RiskCalculator(
+    name="risk_calculator",
+    description="Calculates risk scores based on alert severity and population data",
 )
 
 # Phase 4: Risk Recommendations Generator
 recommendations_generator = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=gemini("gemini-2.5-flash-lite"),
     name="recommendations_generator",
     description="Generates risk analysis summary with recommendations",
     instruction="""
@@ -110,9 +194,9 @@ recommendations_generator = LlmAgent(
     1. Extract alert summary from state["alert_data"]
     2. Extract population data from state["census_data"]
     3. Extract risk assessment from state["risk_scores"]
-    4. Calculate overall risk score (0-100)
-    5. Determine risk level (low/Medium/High/Severe)
-    6. Identify vulnerable areas
+    4. Use its risk_score (0-100) and population_at_risk as-is
+    5. Use its risk_level (Low/Medium/High/Severe) as-is
+    6. Use its vulnerable_areas, adding any areas named in the alert
     7. Generate specific recommendations:
        - Immediate actions
        - Preparation steps
@@ -126,7 +210,7 @@ recommendations_generator = LlmAgent(
     """,
     output_schema=RiskAnalysisSummary,
     output_key="risk_analysis_summary",
-    before_model_callback=log_agent_entry,
+    before_model_callback=[log_agent_entry, use_cached_output_schema],
     after_model_callback=log_agent_exit,
 )
 
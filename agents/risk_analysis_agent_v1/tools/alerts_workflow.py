@@ -0,0 +1,375 @@
+"""Alerts snapshot workflow, shared by the standalone alerts agent and the chat sub-agent.
+
+Each deployable agent directory gets a copy of shared_tools as tools/, so
+both call build_alerts_workflow() instead of keeping their own agent.py copy.
+"""
+
+import re
+import asyncio
+import hashlib
+import logging
+import functools
+from typing import Any, AsyncGenerator, Dict, Optional
+
+from google.genai import types
+from google.adk.agents import BaseAgent, LlmAgent, ParallelAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.events import Event, EventActions
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.tools.tool_context import ToolContext
+
+from .schemas import AlertDetail, AlertsFormatterOutput, AlertsSummary
+from .tools import CACHE_KEY_PREFIX, _cache_get, _cache_set
+from .tools import find_states, get_nws_alerts, get_nws_alerts_multi, generate_map, get_zone_coordinates, run_in_thread
+from .logging_utils import log_agent_entry, log_agent_exit
+from .llm import gemini
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-2.5-flash-lite"
+
+
+# Phase 1: Retriever - Fetches alert data (LLM fallback for queries that name no state)
+RETRIEVER_INSTRUCTION = """
+    You are a weather alerts data retrieval specialist.
+    
+    **Your Task:**
+    Retrieve active weather alerts for the requested location using the get_nws_alerts tool.
+    
+    **Tool Usage Guidelines:**
+    
+    1. **For NATIONAL/ALL alerts** (e.g., "United States", "nationwide", "all states"):
+       - Call: get_nws_alerts() with NO parameters
+       - This retrieves ALL active alerts across the entire United States
+    
+    2. **For SPECIFIC STATE** (e.g., "California", "FL", "Texas"):
+       - Call: get_nws_alerts(state="California") - pass the state as given; the tools normalize names to codes
+    
+    3. **For SPECIFIC COORDINATES** (if lat/lng provided):
+       - Call: get_nws_alerts(latitude=37.7749, longitude=-122.4194)
+    
+    4. **For MULTIPLE STATES** (e.g., "CA,TX,FL"):
+       - Make ONE call: get_nws_alerts_multi(states=["CA", "TX", "FL"])
+       - The tool fetches all states concurrently and returns the combined alerts
+    
+    **Important:**
+    - DO NOT pass state parameter for national queries
+    - DO NOT filter by severity - get ALL alerts
+    - The tool automatically handles the NWS API endpoints
+    
+    **Examples:**
+    - "Get alerts for United States" → get_nws_alerts()
+    - "Get alerts for California" → get_nws_alerts(state="CA")  
+    - "Get alerts for Miami coordinates" → get_nws_alerts(latitude=25.7617, longitude=-80.1918)
+    - "Get alerts for CA, OR and WA" → get_nws_alerts_multi(states=["CA", "OR", "WA"])
+    
+    The tools save the alerts for the next agents; reply with one short line
+    saying how many alerts were found.
+    """
+
+
+# Phase 2: Formatter - Structures alerts in Python; the LLM only writes insights
+SEVERE_LEVELS = {"Severe", "Extreme"}
+DESCRIPTION_SHORT_CHARS = 150
+
+
+def _shorten(text: str, limit: int = DESCRIPTION_SHORT_CHARS) -> str:
+    """Collapse whitespace and cut text at a word boundary within limit"""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rsplit(" ", 1)[0] + "…"
+
+
+def format_alerts(alerts_state: Dict[str, Any]) -> AlertsFormatterOutput:
+    """Build the formatter output from the alerts the NWS tools saved to state["alerts"].
+    
+    insights is left empty; the insights agent writes it. Every field is
+    defaulted to its schema type here, so the models are built without validation.
+    """
+    alerts = [
+        AlertDetail.model_construct(
+            event=alert.get("event") or "Unknown",
+            severity=alert.get("severity") or "Unknown",
+            headline=alert.get("headline") or "",
+            description=alert.get("description") or "",
+            description_short=_shorten(alert.get("description") or alert.get("headline") or ""),
+            # Zone URLs end in the zone ID (.../zones/forecast/FLZ069)
+            affected_zones=[zone.rstrip("/").rsplit("/", 1)[-1] for zone in alert.get("affected_zones") or []],
+            start_time=alert.get("onset") or "",
+            end_time=alert.get("expires") or "",
+        )
+        for alert in alerts_state.get("alerts", [])
+    ]
+    breakdown = alerts_state.get("severity_breakdown") or {}
+    severe_count = sum(breakdown.get(level, 0) for level in SEVERE_LEVELS) if breakdown else \
+        sum(1 for alert in alerts if alert.severity in SEVERE_LEVELS)
+    locations = dict.fromkeys(
+        area.strip()
+        for alert in alerts_state.get("alerts", [])
+        for area in (alert.get("area_desc") or "").split(";")
+        if area.strip()
+    )
+    return AlertsFormatterOutput.model_construct(
+        alerts=alerts,
+        total_count=alerts_state.get("count", len(alerts)),
+        severe_count=severe_count,
+        locations=list(locations),
+        insights="",
+    )
+
+
+# National requests; "US" only in capitals so "show us" does not match
+NATIONAL_PATTERN = re.compile(r"(?i:\b(?:nation(?:al(?:ly)?|wide)|united\s+states|all\s+states)\b)|\b(?:USA|US|U\.S\.)(?!\w)")
+
+
+class AlertsFetcher(BaseAgent):
+    """Fetches and formats alerts in Python when the request names its states.
+    
+    State-level and national requests call the NWS tools directly; anything
+    else (e.g. coordinates or a city) is handed to the LLM retriever. Either
+    way the structured alerts are saved to state["formatted_alerts"].
+    """
+    retriever: LlmAgent
+    
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        request = " ".join(part.text for part in (ctx.user_content.parts or []) if part.text) \
+            if ctx.user_content else ""
+        states = find_states(request)
+        # Cleared first so a failed fetch does not present an earlier request's alerts as current
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"alerts": None, "formatted_alerts": None, "alerts_insights": None}),
+        )
+        tool_context = ToolContext(ctx)
+        
+        if states:
+            logger.info(f"⚡ Fetching alerts for {', '.join(states)} without an LLM turn")
+            await get_nws_alerts_multi(tool_context, states=states)
+        elif NATIONAL_PATTERN.search(request):
+            logger.info("⚡ Fetching national alerts without an LLM turn")
+            await asyncio.to_thread(get_nws_alerts, tool_context)
+        else:
+            async for event in self.retriever.run_async(ctx):
+                yield event
+        
+        alerts_state = tool_context.state.get("alerts")
+        formatted = format_alerts(alerts_state or {})
+        if alerts_state is None:
+            logger.warning(f"No alerts could be fetched for: {request[:100]}")
+            formatted = formatted.model_copy(update={"insights": ALERTS_UNAVAILABLE_INSIGHTS})
+        tool_context.state["formatted_alerts"] = formatted.model_dump()
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=tool_context.actions,
+        )
+
+
+def insights_instruction(context: ReadonlyContext) -> str:
+    """Prompt with just the counts and top headlines - not the full alert JSON"""
+    formatted = context.state.get("formatted_alerts") or {}
+    headlines = "\n".join(
+        f"- {alert['event']} ({alert['severity']}): {alert['headline']}"
+        for alert in formatted.get("alerts", [])[:3]
+    )
+    return f"""
+    You are a weather alert safety specialist. Write 2-4 sentences summarizing the alert
+    situation with the most important safety recommendations. Plain text only.
+    
+    Active alerts: {formatted.get("total_count", 0)} ({formatted.get("severe_count", 0)} severe/extreme)
+    Affected locations: {", ".join(formatted.get("locations", [])[:10]) or "none listed"}
+    Top alerts:
+{headlines or "- none"}
+    """
+
+
+NO_ALERTS_INSIGHTS = "No active weather alerts for this area right now. Continue to monitor local forecasts for changes."
+ALERTS_UNAVAILABLE_INSIGHTS = "Weather alerts are unavailable right now. Please try again shortly, and follow local emergency officials in the meantime."
+
+
+def skip_insights_without_alerts(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: nothing to summarize when no alerts were found"""
+    formatted = callback_context.state.get("formatted_alerts") or {}
+    if formatted.get("alerts"):
+        return None
+    logger.info("⚡ No active alerts - skipping the insights model call")
+    # The fetcher sets the unavailable message when nothing could be fetched
+    text = formatted.get("insights") or NO_ALERTS_INSIGHTS
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=text)]))
+
+
+# Polling clients re-request the same alerts within seconds; the prompt is built
+# only from the formatted alerts, so identical prompts reuse the last insights
+INSIGHTS_TTL = 60
+
+
+def _insights_cache_key(context: ReadonlyContext) -> str:
+    digest = hashlib.blake2b(insights_instruction(context).encode(), digest_size=16).hexdigest()
+    return f"{CACHE_KEY_PREFIX}insights:{digest}"
+
+
+def reuse_cached_insights(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: answer from the insights cache when the alerts are unchanged"""
+    cached = _cache_get(_insights_cache_key(callback_context))
+    if not cached:
+        return None
+    logger.info("⚡ Reusing cached alert insights (alerts unchanged)")
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=cached)]))
+
+
+def cache_insights(callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+    """After-model callback: remember the insights written for these alerts"""
+    if llm_response.partial or not llm_response.content or not llm_response.content.parts:
+        return None
+    text = "".join(part.text for part in llm_response.content.parts if part.text and not part.thought)
+    if text:
+        _cache_set(_insights_cache_key(callback_context), text, INSIGHTS_TTL)
+    return None
+
+
+# Phase 3: Map Generator - Resolves zone centroids and builds the map in Python
+# Zoom levels by the larger of the markers' latitude/longitude spans (degrees):
+# multi-state spreads get 4-6, a single state 7-8, a few counties 9
+MAP_ZOOM_BY_SPAN = ((20, 4), (10, 5), (5, 6), (2, 7), (1, 8))
+MAP_DEFAULT_ZOOM = 9
+
+
+def map_zoom(markers: list) -> int:
+    """Pick a zoom level that fits all markers"""
+    span = max(
+        max(m["lat"] for m in markers) - min(m["lat"] for m in markers),
+        max(m["lng"] for m in markers) - min(m["lng"] for m in markers),
+    )
+    return next((zoom for limit, zoom in MAP_ZOOM_BY_SPAN if span > limit), MAP_DEFAULT_ZOOM)
+
+
+class AlertsMapBuilder(BaseAgent):
+    """Maps the affected zones: get_zone_coordinates, then generate_map centred on the markers"""
+    
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        formatted = ctx.session.state.get("formatted_alerts") or {}
+        zones = list(dict.fromkeys(zone for alert in formatted.get("alerts", []) for zone in alert["affected_zones"]))
+        tool_context = ToolContext(ctx)
+        # Cleared first so a map from an earlier request in the session is not reused
+        tool_context.state["map_data"] = None
+        
+        if zones:
+            result = await get_zone_coordinates(tool_context, zone_ids=zones)
+            coordinates = (result.get("data") or {}).get("coordinates", [])
+            markers = [
+                {"lat": zone["latitude"], "lng": zone["longitude"], "title": zone["name"]}
+                for zone in coordinates
+            ]
+            if markers:
+                generate_map(
+                    tool_context,
+                    center_lat=round(sum(m["lat"] for m in markers) / len(markers), 4),
+                    center_lng=round(sum(m["lng"] for m in markers) / len(markers), 4),
+                    zoom=map_zoom(markers),
+                    markers=markers,
+                    title="Active Weather Alerts",
+                )
+        
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=tool_context.actions,
+        )
+
+
+# Phase 4: Final Synthesizer - Merges the pieces in Python (no model call)
+class AlertsSummaryAssembler(BaseAgent):
+    """Combines formatted alerts, insights and map data into the final AlertsSummary"""
+    
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        formatted = state.get("formatted_alerts") or format_alerts({}).model_dump()
+        map_data = state.get("map_data")
+        # Every piece was built in Python from validated models, so skip re-validation
+        summary = AlertsSummary.model_construct(
+            **{
+                **formatted,
+                "alerts": [AlertDetail.model_construct(**alert) for alert in formatted.get("alerts", [])],
+                "insights": state.get("alerts_insights") or formatted.get("insights", ""),
+                # generate_map saves a dict; anything else means no map was generated
+                "map_data": map_data if isinstance(map_data, dict) else None,
+            }
+        )
+        logger.info(f"✅ Assembled alerts summary: {summary.total_count} alerts, map={'yes' if summary.map_data else 'no'}")
+        # The final event's text is the AlertsSummary JSON, as the LLM synthesizer produced
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=summary.model_dump_json())]),
+            actions=EventActions(state_delta={"final_summary": summary.model_dump()}),
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def build_alerts_workflow(model: str = DEFAULT_MODEL, enable_map: bool = True) -> SequentialAgent:
+    """Build the alerts snapshot pipeline (cached - repeated calls return the same agent).
+    
+    AlertsFetcher → (insights ‖ AlertsMapBuilder) → AlertsSummaryAssembler; with
+    enable_map=False the map builder is left out and map_data stays empty.
+    """
+    retriever_agent = LlmAgent(
+        model=gemini(model),
+        name="alerts_retriever",
+        description="Retrieves active weather alerts for specified locations",
+        instruction=RETRIEVER_INSTRUCTION,
+        tools=[run_in_thread(get_nws_alerts), get_nws_alerts_multi],
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit,
+    )
+    
+    alerts_fetcher = AlertsFetcher(
+        name="alerts_fetcher",
+        description="Fetches and formats alerts, using the LLM retriever only when no state is named",
+        retriever=retriever_agent,
+        sub_agents=[retriever_agent],
+    )
+    
+    insights_agent = LlmAgent(
+        model=gemini(model),
+        name="alerts_insights",
+        description="Writes the summary and safety recommendations for the formatted alerts",
+        instruction=insights_instruction,
+        output_key="alerts_insights",
+        include_contents="none",
+        before_model_callback=[log_agent_entry, skip_insights_without_alerts, reuse_cached_insights],
+        after_model_callback=[log_agent_exit, cache_insights],
+    )
+    
+    final_synthesizer = AlertsSummaryAssembler(
+        name="final_synthesizer",
+        description="Combines alert summary and map data into the final output",
+    )
+    
+    if not enable_map:
+        middle = insights_agent
+    else:
+        map_generator = AlertsMapBuilder(
+            name="map_generator",
+            description="Generates map data for alert locations using zone coordinates",
+        )
+        # Insights and MapGenerator both depend only on formatted_alerts, so they
+        # run concurrently
+        middle = ParallelAgent(
+            name="insights_and_map",
+            description="Writes alert insights and generates map data concurrently",
+            sub_agents=[insights_agent, map_generator],
+        )
+    
+    return SequentialAgent(
+        name="alerts_snapshot_pipeline",
+        description="Retrieves weather alerts, generates structured analysis with safety insights, and creates a map.",
+        sub_agents=[alerts_fetcher, middle, final_synthesizer],
+    )
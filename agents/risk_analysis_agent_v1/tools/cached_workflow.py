@@ -0,0 +1,109 @@
+"""Replay cache for whole workflow runs.
+
+Forecasts change at the NWS hourly update cadence and an alert's risk analysis
+only changes with the alert, so the same request within the hour gets the
+previous run's final response instead of rerunning every LLM and tool step.
+"""
+
+import time
+import asyncio
+import hashlib
+import logging
+from typing import AsyncGenerator, Callable, Optional
+
+from google.genai import types
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from .tools import CACHE_KEY_PREFIX, _cache_get, _cache_set
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_CACHE_BUCKET = 3600
+
+# In-flight live run per cache key, so concurrent misses for the same request
+# run the workflow once and the rest replay its result when it finishes
+_inflight: "dict[str, asyncio.Future]" = {}
+
+
+def normalize_request(text: str) -> str:
+    """Request text with case and whitespace differences removed"""
+    return " ".join(text.split()).casefold()
+
+
+def _final_text(event: Event) -> Optional[str]:
+    if event.partial or not event.content or not event.content.parts:
+        return None
+    text = "".join(part.text for part in event.content.parts if part.text and not part.thought)
+    return text or None
+
+
+class CachedWorkflow(BaseAgent):
+    """Runs a workflow once per request and time bucket, replaying its final response and state after that.
+
+    request_key maps the user's request to the part that determines the answer
+    (e.g. the forecast location), or None when the request should not be cached.
+    cacheable can reject final responses (e.g. error results) before they are stored.
+    """
+    workflow: BaseAgent
+    request_key: Callable[[str], Optional[str]] = normalize_request
+    cacheable: Optional[Callable[[str], bool]] = None
+    bucket_seconds: int = WORKFLOW_CACHE_BUCKET
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        request = " ".join(part.text for part in (ctx.user_content.parts or []) if part.text) \
+            if ctx.user_content else ""
+        subject = self.request_key(request) if request else None
+        if not subject:
+            async for event in self.workflow.run_async(ctx):
+                yield event
+            return
+
+        now = time.time()
+        bucket = int(now // self.bucket_seconds)
+        digest = hashlib.blake2b(f"{self.name}|{subject}|{bucket}".encode(), digest_size=16).hexdigest()
+        key = f"{CACHE_KEY_PREFIX}workflow:{digest}"
+
+        leader = _inflight.get(key)
+        cached = await asyncio.shield(leader) if leader is not None else await asyncio.to_thread(_cache_get, key)
+        if cached is None and leader is None:
+            # Another request may have started the live run while Redis was read
+            leader = _inflight.get(key)
+            if leader is not None:
+                cached = await asyncio.shield(leader)
+        if cached is not None:
+            logger.info(f"⚡ Replaying cached {self.name} result for: {subject[:80]}")
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                content=types.Content(role="model", parts=[types.Part(text=cached["text"])]),
+                actions=EventActions(state_delta=cached.get("state_delta") or {}),
+            )
+            return
+
+        # Followers of a failed or uncacheable run fall through to their own live run
+        result = None
+        owner = leader is None
+        if owner:
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+        try:
+            # Every step's state writes, so a replay restores the geocode, fetched
+            # data and intermediate results along with the final response
+            state_delta = {}
+            text = None
+            async for event in self.workflow.run_async(ctx):
+                state_delta.update(event.actions.state_delta)
+                text = _final_text(event) or text
+                yield event
+
+            if text and (self.cacheable is None or self.cacheable(text)):
+                result = {"text": text, "state_delta": state_delta}
+                ttl = max(1, int((bucket + 1) * self.bucket_seconds - now))
+                await asyncio.to_thread(_cache_set, key, result, ttl)
+        finally:
+            if owner:
+                _inflight.pop(key, None)
+                future.set_result(result)
@@ -0,0 +1,58 @@
+"""Shared Gemini model instances for the agents' LlmAgents"""
+
+import logging
+import functools
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+from google.genai import types
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.models.google_llm import Gemini
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def gemini(model_name: str) -> Gemini:
+    """One model instance per model name, shared by every agent that uses it.
+
+    A plain model string makes ADK build a new Gemini wrapper (and a new genai
+    client with its own connection pool) for each LLM call. The client is
+    created here, when the agent modules are imported, so the first request
+    does not pay for it either.
+    """
+    model = Gemini(model=model_name)
+    try:
+        model.api_client
+    except Exception as e:
+        # Missing credentials surface again on the first model call
+        logger.warning(f"Could not create the {model_name} client yet: {str(e)}")
+    return model
+
+
+
+# GenerateContentConfig.response_json_schema (public; older google-genai
+# releases lack it) is sent as-is, without google-genai's schema conversion
+_HAS_RESPONSE_JSON_SCHEMA = "response_json_schema" in types.GenerateContentConfig.model_fields
+
+
+@functools.cache
+def _response_json_schema(output_schema: type[BaseModel]) -> Dict[str, Any]:
+    return output_schema.model_json_schema()
+
+
+def use_cached_output_schema(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Before-model callback: send the output_schema as a JSON schema generated once.
+
+    ADK puts the Pydantic class itself in the request, and google-genai
+    regenerates and converts its schema on every call. The response is still
+    validated against the class by the agent. Without response_json_schema
+    support the class is left in place.
+    """
+    config = llm_request.config
+    schema = config.response_schema if config else None
+    if _HAS_RESPONSE_JSON_SCHEMA and isinstance(schema, type) and issubclass(schema, BaseModel):
+        config.response_schema = None
+        config.response_json_schema = _response_json_schema(schema)
+    return None
@@ -10,28 +10,35 @@ various queries to test the complete user experience.
 import asyncio
 import os
 from pathlib import Path
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
+from google.genai import types
 
 # Import the agent
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
-from agent import root_agent
+from weather_insights_agent import root_agent
 
 
 class WeatherAgentTester:
     """Test harness for Weather Insights agent use cases"""
     
     def __init__(self):
+        self.app_name = "weather_insights_agent"
+        self.user_id = "test_user"
         self.session_service = InMemorySessionService()
         self.runner = Runner(
+            app_name=self.app_name,
             agent=root_agent,
             session_service=self.session_service
         )
         self.session_id = "test_session_001"
+        # Stream partial model output so text shows up as soon as it is generated
+        self.run_config = RunConfig(streaming_mode=StreamingMode.SSE)
         
     async def invoke_agent(self, query: str, test_name: str):
-        """Invoke the agent with a query and print results"""
+        """Invoke the agent with a query and stream the response as it arrives"""
         print(f"\n{'='*80}")
         print(f"TEST: {test_name}")
         print(f"{'='*80}")
@@ -39,13 +46,36 @@ class WeatherAgentTester:
         print(f"{'-'*80}")
         
         try:
-            response = await self.runner.run_async(
-                user_content=query,
-                session_id=self.session_id
+            session = await self.session_service.get_session(
+                app_name=self.app_name, user_id=self.user_id, session_id=self.session_id
             )
+            if session is None:
+                await self.session_service.create_session(
+                    app_name=self.app_name, user_id=self.user_id, session_id=self.session_id
+                )
             
-            print(f"Response:\n{response.content}")
-            print(f"{'='*80}\n")
+            print("Response:")
+            response = ""
+            streamed = False
+            async for event in self.runner.run_async(
+                user_id=self.user_id,
+                session_id=self.session_id,
+                new_message=types.Content(role="user", parts=[types.Part(text=query)]),
+                run_config=self.run_config
+            ):
+                if not (event.content and event.content.parts):
+                    continue
+                text = "".join(part.text or "" for part in event.content.parts)
+                if event.partial:
+                    print(text, end="", flush=True)
+                    streamed = True
+                elif text and event.is_final_response():
+                    # The final event repeats the streamed chunks in full
+                    if not streamed:
+                        print(text, end="")
+                    response = text
+            
+            print(f"\n{'='*80}\n")
             return response
             
         except Exception as e:
@@ -184,6 +214,22 @@ class WeatherAgentTester:
             "UC15: Resource Allocation Recommendations"
         )
         
+        # ===================================================================
+        # USE CASE 16: Compound Forecast + Alerts Request
+        # ===================================================================
+        await self.invoke_agent(
+            "Give me the forecast for Miami and any alerts in Florida",
+            "UC16: Compound Forecast and Alerts Request"
+        )
+        
+        # ===================================================================
+        # USE CASE 17: Compound Forecast + Evacuation Question
+        # ===================================================================
+        await self.invoke_agent(
+            "What's the weather in Denver, and should I evacuate?",
+            "UC17: Compound Forecast and Evacuation Question"
+        )
+        
         print("\n" + "="*80)
         print("ALL USE CASE TESTS COMPLETED")
         print("="*80 + "\n")
@@ -200,5 +246,13 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
     
-    # Run the tests
-    asyncio.run(main())
+    # Run the tests (on uvloop when it is installed, unless USE_UVLOOP=0)
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop and os.getenv("USE_UVLOOP", "1") != "0":
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,5 +1,11 @@
 """Weather Insights & Forecast Advisor Agent"""
 
-from .agent import root_agent
-
 __all__ = ["root_agent"]
+
+
+def __getattr__(name: str):
+    # Defer building the agent tree until root_agent is first requested
+    if name == "root_agent":
+        from .agent import root_agent
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,22 @@
 import os
+import asyncio
+import re
 import logging
+import functools
+from importlib import resources
 
 from dotenv import load_dotenv
 from google.adk import Agent
 from google.genai import types
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.agents.callback_context import CallbackContext
-from google.adk.models import LlmResponse, LlmRequest
-
-from .weather_tools.tools import (
-    query_historical_weather,
-    get_weather_statistics,
-    get_census_demographics,
-    find_nearest_weather_station,
-    get_nws_forecast,
-    get_nws_alerts,
-    generate_map,
-    get_current_conditions,
-    get_hourly_forecast,
-    get_hurricane_track,
-    geocode_address,
-    get_directions,
-    search_nearby_places
-)
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models import Gemini, LlmResponse, LlmRequest
+from google.adk.runners import InMemoryRunner
+
+from .images import shrink_uploaded_images
+from .router import route_single_intent
+from .state import render_state_value
 
 load_dotenv()
 
@@ -33,908 +27,304 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Environment is read once, after load_dotenv(), and shared by every agent
+_MODEL = os.getenv("MODEL")
+_MODEL_SMALL = os.getenv("MODEL_SMALL") or _MODEL
+_BQ_WARM_CACHE = os.getenv("BQ_WARM_CACHE", "1") != "0"
+_VERBOSE_PROMPTS = os.getenv("VERBOSE_PROMPTS") == "1"
+_AGENT_CONCURRENCY = int(os.getenv("AGENT_CONCURRENCY", "4"))
+if not _MODEL:
+    raise ValueError("MODEL environment variable is required")
+
 # Get Google Maps API Key
 google_maps_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
 
-# Callback functions to log agent activity
+# Callback functions to log agent activity (they run on every model call, so
+# messages are only built when INFO is enabled)
+_SEP = "=" * 80
+
+
 def log_agent_entry(callback_context: CallbackContext, llm_request: LlmRequest):
     """Log when an agent is invoked"""
-    logger.info("="*80)
-    logger.info(f"🔄 AGENT TRANSFER: {callback_context.agent_name}")
-    logger.info("="*80)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_SEP)
+    logger.info("🔄 AGENT TRANSFER: %s", callback_context.agent_name)
+    logger.info(_SEP)
 
 def log_agent_exit(callback_context: CallbackContext, llm_response: LlmResponse):
     """Log when an agent completes execution"""
-    logger.info("="*80)
-    logger.info(f"✅ AGENT COMPLETE: {callback_context.agent_name}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_SEP)
+    logger.info("✅ AGENT COMPLETE: %s", callback_context.agent_name)
     # Log function calls if any
     if llm_response.content and llm_response.content.parts:
         for part in llm_response.content.parts:
             if part.function_call:
-                logger.info(f"   Function Call: {part.function_call.name}")
-    logger.info("="*80)
+                logger.info("   Function Call: %s", part.function_call.name)
+    logger.info(_SEP)
+
+# Shared sampling configs (ADK deep-copies these per request, so sharing is safe)
+DETERMINISTIC_CFG = types.GenerateContentConfig(temperature=0.2)
+CREATIVE_CFG = types.GenerateContentConfig(temperature=0.3)
+COORDINATOR_CFG = types.GenerateContentConfig(temperature=0.1, max_output_tokens=2048)
+
+# Models that cannot be used by tool-calling agents
+NON_TOOL_CALLING_MODEL_PATTERN = re.compile(r"(embedding|tts|image-generation|gemma)", re.I)
+
+
+@functools.cache
+def _gemini(model_name: str) -> Gemini:
+    """One model instance per model name, shared by every agent that uses it.
+    
+    A plain model string makes ADK build a new Gemini wrapper (and a new genai
+    client with its own connection pool) for each LLM call; a shared instance
+    keeps one cached client so concurrent agent calls reuse connections.
+    """
+    return Gemini(model=model_name)
+
+
+def _shared_model() -> Gemini:
+    """Default model (MODEL) for data and analysis agents"""
+    return _gemini(_MODEL)
+
+
+@functools.cache
+def _small_model() -> Gemini:
+    """Cheaper model for routing and location lookups (MODEL_SMALL, defaults to MODEL)"""
+    if NON_TOOL_CALLING_MODEL_PATTERN.search(_MODEL_SMALL):
+        raise ValueError(f"MODEL_SMALL={_MODEL_SMALL} does not support tool calling")
+    return _gemini(_MODEL_SMALL)
+
+
+# Caps sub-agents running at once per process; the coordinator issues independent
+# agent calls in a single turn and the runtime gathers them concurrently
+_agent_slots = asyncio.Semaphore(_AGENT_CONCURRENCY)
+
+
+class BoundedAgentTool(AgentTool):
+    """AgentTool that waits for a free slot (AGENT_CONCURRENCY) before running its agent.
+    
+    AgentTool deep-copies the whole session state into a throwaway sub-session
+    for every call. The weather tools only write state and sub-agents read it
+    through their instruction slots, so the sub-session is created with just
+    those keys; the sub-agent's writes are forwarded to the parent state as they
+    happen, as AgentTool does.
+    """
+    
+    async def run_async(self, *, args, tool_context):
+        async with _agent_slots:
+            instruction = getattr(self.agent, "instruction", None)
+            if not isinstance(instruction, PrecompiledTemplate) or self.agent.input_schema or self.agent.output_schema:
+                return await super().run_async(args=args, tool_context=tool_context)
+            
+            if self.skip_summarization:
+                tool_context.actions.skip_summarization = True
+            runner = InMemoryRunner(agent=self.agent, app_name=self.agent.name)
+            session = await runner.session_service.create_session(
+                app_name=self.agent.name,
+                user_id="tmp_user",
+                state={key: tool_context.state[key] for key in instruction.slot_names if key in tool_context.state},
+            )
+            
+            last_event = None
+            async for event in runner.run_async(
+                user_id=session.user_id,
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part.from_text(text=args["request"])]),
+            ):
+                if event.actions.state_delta:
+                    tool_context.state.update(event.actions.state_delta)
+                last_event = event
+            
+            if not last_event or not last_event.content or not last_event.content.parts:
+                return ""
+            return "\n".join(part.text for part in last_event.content.parts if part.text)
+
+
+@functools.cache
+def _shared_preamble() -> str:
+    """Mission and protocol text common to every agent (instructions/preamble.md)"""
+    return resources.files(__package__).joinpath("instructions", "preamble.md").read_text(encoding="utf-8")
+
+
+@functools.cache
+def _load_instruction(name: str) -> str:
+    """Read an agent instruction from instructions/<name>.md on first use.
+    
+    Every instruction starts with the same shared preamble, so all agents send
+    an identical system-prompt prefix that Gemini's implicit context cache can
+    reuse across agent calls. VERBOSE_PROMPTS=1 loads the full-length prompts
+    in instructions/verbose/ instead (for debugging).
+    """
+    directory = resources.files(__package__).joinpath("instructions")
+    if _VERBOSE_PROMPTS:
+        directory = directory.joinpath("verbose")
+    return _shared_preamble() + directory.joinpath(f"{name}.md").read_text(encoding="utf-8")
+
+
+class PrecompiledTemplate:
+    """Instruction provider whose `{ key? }` state slots are parsed once.
+    
+    ADK re-scans string instructions with a regex on every turn; this splits the
+    template into static segments and slot names up front and only joins them
+    with current state values per request.
+    """
+    SLOT_PATTERN = re.compile(r"\{\s*(\w+)\?\s*\}")
+    __slots__ = ("static_segments", "slot_names")
+    
+    def __init__(self, template: str):
+        parts = self.SLOT_PATTERN.split(template)
+        self.static_segments = tuple(parts[0::2])
+        self.slot_names = tuple(parts[1::2])
+    
+    def render(self, state) -> str:
+        """Fill the slots from state (missing keys render as empty strings).
+        
+        Typed state keys render as compact summaries rather than full payloads.
+        """
+        pieces = [self.static_segments[0]]
+        for name, segment in zip(self.slot_names, self.static_segments[1:]):
+            value = state.get(name)
+            pieces.append("" if value is None else render_state_value(name, value))
+            pieces.append(segment)
+        return "".join(pieces)
+    
+    def __call__(self, context: ReadonlyContext) -> str:
+        return self.render(context.state)
+
+
+# Agents are built lazily by these cached factories; each imports its tools on first
+# use so importing this module doesn't create the BigQuery/Maps/NWS clients.
 
 # Location Services Agent - Geocoding, directions, and emergency resource location via Google Maps API
-location_services_agent = Agent(
-    name="location_services_agent",
-    model=os.getenv("MODEL"),
-    description="Provides geocoding, directions, and emergency resource location using Google Maps API for weather emergency response.",
-    instruction="""
-        You are a Location Services specialist for the Weather Insights and Forecast Advisor system.
-        You help emergency managers with geocoding, navigation, and finding emergency resources during severe weather events.
-        
-        **CRITICAL - Execution Protocol:**
-        - When user provides clear origin and destination, execute the query immediately without asking for confirmation
-        - Use state to store results: geocode_result, directions, nearby_places
-        - If user asks for "risk analysis" or "emergency assessment", you are NOT the right agent - return control to coordinator
-        - Your role is ONLY location services (geocoding, directions, nearby places)
-        - After presenting location results, ASK: "Would you like me to find alternative routes or additional locations?"
-        - Present findings in clear, actionable format for emergency coordination
-        - Only ask for clarification if the request is ambiguous or missing required information
-        
-        Your capabilities and available tools:
-        
-        1. **geocode_address** - Convert addresses to coordinates
-           - Use this to find latitude/longitude for any address
-           - Example: "downtown Miami" → coordinates
-           - Returns: formatted address, lat/lng, place_id
-        
-        2. **get_directions** - Calculate routes between locations
-           - Get driving directions with travel time and distance
-           - Supports alternatives for evacuation planning
-           - Parameters: origin, destination, mode (driving/walking/transit)
-           - Returns: multiple route options with turn-by-turn directions
-        
-        3. **search_nearby_places** - Find emergency resources
-           - Search for shelters, hospitals, evacuation centers
-           - Example: Find hospitals within 10 miles of coordinates
-           - Returns: List of places with names, addresses, ratings
-        
-        4. **generate_map** - Create visual map with markers
-           - Generate embedded Google Map showing locations
-           - Add markers for affected areas, shelters, evacuation routes
-           - Example: Map with markers for flood warning locations
-           - Returns: HTML map that can be displayed to user
-        
-        When to use each tool:
-        - User asks "Where is X?" → geocode_address
-        - User asks "How do I get from A to B?" → get_directions
-        - User asks "Find shelters near X" → geocode_address + search_nearby_places
-        - User asks "Show me a map" or after geocoding multiple locations → generate_map
-        
-        Always store results in state for other agents to use.
-        
-        **Workflow for Common Tasks:**
-        
-        **Geocoding Locations:**
-        1. When coordinator requests geocoding, call geocode_address ONCE
-        2. Store result in state immediately
-        3. Return coordinates to coordinator - DO NOT make additional calls
-        4. If geocoding fails, return error to coordinator
-        
-        **Getting Directions (NO CONFIRMATION NEEDED):**
-        1. If user provides origin and destination, call get_directions immediately
-        2. Present route options with distances and travel times
-        3. Store results in state for reference
-        4. After presenting, ask if they want alternatives
-        
-        **Generating Maps:**
-        1. After geocoding locations, offer to generate a map
-        2. Call generate_map with center coordinates and list of markers
-        3. Each marker needs: lat, lng, title (color is optional)
-        4. Present the map_url as a clickable link for the user to open in their browser
-        5. Example: "View the map here: [map_url]"
-        6. The map will show all markers and can be opened in Google Maps
-        
-        **Finding Emergency Shelters (CRITICAL - MUST GENERATE MAP):**
-        1. Geocode the area if it's an address
-        2. Use search_nearby_places with place_type="shelter" or keyword="emergency shelter"
-        3. IMMEDIATELY after search_nearby_places returns results, you MUST call generate_map:
-           - Extract center coordinates from geocode_result in state
-           - Extract markers from nearby_places in state: for each place, create marker with:
-             {lat: place.lat, lng: place.lng, title: place.name}
-           - Call: generate_map(center_lat, center_lng, markers, zoom=12)
-        4. Present results with addresses AND COORDINATES in this EXACT format:
-           1. **Name** (lat, lng)
-              Address: street address
-           
-           CRITICAL FORMATTING RULES:
-           - The name MUST be in bold using **Name**
-           - Coordinates MUST be in parentheses immediately after the name
-           - Format: **Name** (lat, lng)
-           - Address must be on the next line with "Address:" prefix
-           
-           Example: 
-           1. **Sarah's House** (29.67371, -95.201762)
-              Address: 711 Perla Rd, Pasadena
-           
-           WRONG formats to AVOID:
-           - Name (lat, lng) Address: ... (missing bold and line break)
-           - **Name** Address: ... (lat, lng) (coordinates in wrong position)
-           
-        5. At the END of your response, include the map URL on its own line:
-           "View map: [paste_the_map_url_here]"
-        6. NEVER skip step 3 - the map is REQUIRED for every shelter search
-        7. CRITICAL: Always include (lat, lng) coordinates immediately after the bold name
-        
-        **Locating Medical Facilities (CRITICAL - MUST GENERATE MAP):**
-        1. Geocode the affected area if needed
-        2. Use search_nearby_places with place_type="hospital"
-        3. IMMEDIATELY after search_nearby_places returns results, you MUST call generate_map:
-           - Extract center coordinates from geocode_result in state
-           - Extract markers from nearby_places in state: for each place, create marker with:
-             {lat: place.lat, lng: place.lng, title: place.name}
-           - Call: generate_map(center_lat, center_lng, markers, zoom=12)
-        4. Present results with addresses AND COORDINATES in this EXACT format:
-           1. **Name** (lat, lng)
-              Address: street address
-           
-           CRITICAL FORMATTING RULES:
-           - The name MUST be in bold using **Name**
-           - Coordinates MUST be in parentheses immediately after the name
-           - Format: **Name** (lat, lng)
-           - Address must be on the next line with "Address:" prefix
-           
-           Example: 
-           1. **Memorial Hermann Hospital** (29.7372, -95.3985)
-              Address: 6411 Fannin St, Houston
-           
-           WRONG formats to AVOID:
-           - Name (lat, lng) Address: ... (missing bold and line break)
-           - **Name** Address: ... (lat, lng) (coordinates in wrong position)
-           
-        5. At the END of your response, include the map URL on its own line:
-           "View map: [paste_the_map_url_here]"
-        6. NEVER skip step 3 - the map is REQUIRED for every hospital search
-        7. CRITICAL: Always include (lat, lng) coordinates immediately after the bold name
-        
-        **Important Notes:**
-        - DO NOT ask for confirmation when user provides complete information
-        - Use state to pass results between tools and preserve context
-        - For nearby searches, location must be in "lat,lng" format
-        - Provide clear, actionable information for emergency response
-        - Include travel times and distances in all route recommendations
-        
-        Current state: { geocode_result? } { directions? } { nearby_places? }
-        """,
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.2,
-    ),
-    tools=[geocode_address, get_directions, search_nearby_places, generate_map],
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit
-)
+@functools.cache
+def _location_services_agent() -> Agent:
+    from .weather_tools.tools import geocode_address, get_directions, search_nearby_places, generate_map
+    return Agent(
+        name="location_services_agent",
+        model=_small_model(),
+        description="Provides geocoding, directions, and emergency resource location using Google Maps API for weather emergency response.",
+        instruction=PrecompiledTemplate(_load_instruction("location_services")),
+        generate_content_config=DETERMINISTIC_CFG,
+        tools=[geocode_address, get_directions, search_nearby_places, generate_map],
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit
+    )
 
 # BigQuery Data Agent - Queries historical weather, demographic, and geographic data
-bigquery_data_agent = Agent(
-    name="bigquery_data_agent",
-    model=os.getenv("MODEL"),
-    description="Queries BigQuery public datasets for census demographics (population, age, income, housing, race/ethnicity by census tract), historical weather events, flood zones, and geospatial data. Use this agent for ANY census, demographic, or census tract queries.",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-    instruction=f"""
-        You are a historical data specialist for the Weather Insights and Forecast Advisor system.
-        You help emergency managers access historical weather patterns, census demographics, and geospatial data.
-        
-        **CRITICAL - Execution Protocol:**
-        - For census demographics: Execute immediately when user provides city and state
-        - For historical weather: Execute automatically when user provides location and date range
-        - Parse natural language dates (e.g., "January 2024" → "2024-01-01" to "2024-01-31")
-        - NEVER ask user for date formats - convert them automatically
-        - Present findings in clear, actionable format for emergency managers
-        
-        **Available Tools:**
-        
-        1. **get_census_demographics(city, state)**
-           - Retrieves census demographics from BigQuery public datasets
-           - Parameters:
-             * city: City name (e.g., "San Ramon")
-             * state: State abbreviation (e.g., "CA")
-           - Returns: Population, age, income, housing, demographics by race/ethnicity
-           - Use for: Demographics, vulnerable populations, census tract data
-           - Example: get_census_demographics("San Ramon", "CA")
-        
-        2. **geocode_address(address)**
-           - Converts address to coordinates using Google Maps API
-           - Parameters:
-             * address: Full address or "City, State" (e.g., "San Ramon, CA")
-           - Returns: Latitude, longitude, formatted address
-           - **CRITICAL**: Use this BEFORE find_nearest_weather_station to get coordinates
-        
-        3. **find_nearest_weather_station(latitude, longitude, state)**
-           - Finds the top 3 nearest weather stations to coordinates using Euclidean distance
-           - Parameters:
-             * latitude: Latitude (e.g., 37.7798)
-             * longitude: Longitude (e.g., -121.9780)
-             * state: State abbreviation (e.g., "CA")
-           - Returns: List of 3 stations with usaf IDs, names, locations, distances
-           - **CRITICAL**: Must geocode city FIRST to get coordinates, then call this
-           - Stores stations list in state for use by query_historical_weather
-        
-        4. **query_historical_weather(usaf_ids, start_date, end_date)**
-           - Retrieves daily weather records from NOAA GSOD dataset with fallback
-           - Parameters:
-             * usaf_ids: List of USAF IDs from find_nearest_weather_station (e.g., ["724927", "724930"])
-             * start_date: Start date in YYYY-MM-DD format
-             * end_date: End date in YYYY-MM-DD format
-           - Returns: Daily temperature, precipitation, wind speed, snow data from first station with data
-           - **CRITICAL**: Tries each USAF station in order until data is found (USAF is used in stn field)
-           - Use for: Historical weather patterns, specific date ranges
-        
-        5. **get_weather_statistics(station_id, year, month)**
-           - Calculates weather statistics for a period
-           - Parameters:
-             * station_id: Weather station ID
-             * year: Year for statistics (e.g., 2024)
-             * month: Optional month (1-12) for monthly stats
-           - Returns: Average/min/max temperatures, precipitation totals, wind statistics
-           - Use for: Climate normals, comparing periods, trend analysis
-        
-        **Common Weather Station IDs:**
-        - Miami, FL: USW00012839
-        - New York, NY: USW00094728
-        - Los Angeles, CA: USW00023174
-        - Chicago, IL: USW00094846
-        - Houston, TX: USW00012960
-        
-        **Example Use Cases:**
-        
-        1. **Historical Weather for Emergency Planning:**
-           - User: "What was the weather like in Miami during Hurricane season last year?"
-           - You: Present plan to query_historical_weather for Miami station, June-November 2024
-           - Ask for confirmation, then execute and present findings
-        
-        2. **Climate Statistics for Risk Assessment:**
-           - User: "What are typical January temperatures in Chicago?"
-           - You: Present plan to get_weather_statistics for Chicago, January across multiple years
-           - Ask for confirmation, then execute and present averages
-        
-        3. **Comparing Weather Patterns:**
-           - User: "How does this year's rainfall compare to last year?"
-           - You: Present plan to query both years and calculate differences
-           - Ask for confirmation, then execute and present comparison
-        
-        **Example Use Cases:**
-        
-        1. **Census Demographics:**
-           - User: "Get me demographics of San Ramon, CA"
-           - You: Immediately call get_census_demographics("San Ramon", "CA")
-           - Present: Population, median age, median income, housing, demographics breakdown
-        
-        2. **Census Tracts:**
-           - User: "I want census track for San Ramon, CA"
-           - You: Call get_census_demographics("San Ramon", "CA")
-           - Present: Census tract IDs, population by tract, demographics by tract
-        
-        3. **Historical Weather with City Name:**
-           - User: "What was the weather like in San Ramon, CA last year?"
-           - You: Step 1 - Call geocode_address("San Ramon, CA") to get coordinates
-           - You: Step 2 - Extract latitude, longitude from geocode result
-           - You: Step 3 - Call find_nearest_weather_station(latitude, longitude, "CA")
-           - You: Step 4 - Extract usaf IDs list from result (top 3 stations)
-           - You: Step 5 - Call query_historical_weather([usaf1, usaf2, usaf3], "2024-01-01", "2024-12-31")
-           - Present: Weather data with station name that had data
-        
-        4. **Historical Weather with Natural Language Dates:**
-           - User: "Give me historical weather data for San Ramon, CA for January 2024"
-           - You: Step 1 - Parse "January 2024" → start: "2024-01-01", end: "2024-01-31"
-           - You: Step 2 - Call geocode_address("San Ramon, CA") to get coordinates
-           - You: Step 3 - Extract latitude, longitude from geocode result
-           - You: Step 4 - Call find_nearest_weather_station(latitude, longitude, "CA")
-           - You: Step 5 - Extract usaf IDs list from result (top 3 stations)
-           - You: Step 6 - Call query_historical_weather([usaf1, usaf2, usaf3], "2024-01-01", "2024-01-31")
-           - Present: Weather data with station name that had data
-        
-        **Date Parsing Examples:**
-        - "January 2024" → "2024-01-01" to "2024-01-31"
-        - "last year" → "2024-01-01" to "2024-12-31"
-        - "last month" → calculate based on current date
-        - "summer 2024" → "2024-06-01" to "2024-08-31"
-        
-        **Important Notes:**
-        - For census queries: Execute immediately without asking for confirmation
-        - For weather queries: ALWAYS geocode city first to get coordinates, then find nearest stations
-        - NEVER ask user for date formats, station IDs, or coordinates
-        - Workflow: geocode → find_nearest_weather_station (returns 3 stations) → query_historical_weather (tries all 3)
-        - query_historical_weather automatically tries each station until data is found
-        - Store results in state for other agents to reference
-        
-        **Data Presentation Guidelines:**
-        - **ALWAYS use properly formatted markdown tables** for daily weather records
-        - **CRITICAL**: Add blank lines before and after tables for proper markdown rendering
-        - Table format for daily records (note the blank line before table):
-          
-          | Date | Avg Temp (°F) | Max Temp (°F) | Min Temp (°F) | Precipitation (in) | Wind Speed (mph) | Max Wind Speed (mph) |
-          | :--- | :------------ | :------------ | :------------ | :----------------- | :--------------- | :------------------- |
-          | 2023-03-31 | 48.8 | 62.1 | 37.9 | 0.00 | 3.4 | 13.0 |
-          
-        - **IMPORTANT**: Ensure there is a blank line BEFORE the table header and AFTER the last row
-        - Use section headers with blank lines: "## Summary Statistics", "## Daily Weather Records", "## Key Observations"
-        - Include summary statistics section BEFORE the table (average, min, max, total precipitation)
-        - Highlight extreme weather events in a separate "Key Observations" section AFTER the table
-        - Omit technical details like null indicators (e.g., 999.9 for missing data)
-        - Format all numbers consistently: temperatures in °F, precipitation in inches, wind speed in mph
-        - Provide actionable insights for emergency managers in the Key Observations section
-        
-        Current state: {{ historical_weather? }} {{ weather_statistics? }} {{ census_demographics? }} {{ weather_stations? }}
-        """,
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.2,
-    ),
-    tools=[get_census_demographics, geocode_address, find_nearest_weather_station, query_historical_weather, get_weather_statistics]
-)
+@functools.cache
+def _bigquery_data_agent() -> Agent:
+    from .weather_tools.tools import (
+        get_census_demographics,
+        geocode_address,
+        find_nearest_weather_station,
+        query_historical_weather,
+        get_weather_statistics,
+        warm_bigquery_cache
+    )
+    # Common census lookups run while the first requests are being handled
+    if _BQ_WARM_CACHE:
+        warm_bigquery_cache()
+    return Agent(
+        name="bigquery_data_agent",
+        model=_shared_model(),
+        description="Queries BigQuery public datasets for census demographics (population, age, income, housing, race/ethnicity by census tract), historical weather events, flood zones, and geospatial data. Use this agent for ANY census, demographic, or census tract queries.",
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit,
+        instruction=PrecompiledTemplate(_load_instruction("bigquery_data")),
+        generate_content_config=DETERMINISTIC_CFG,
+        tools=[get_census_demographics, geocode_address, find_nearest_weather_station, query_historical_weather, get_weather_statistics]
+    )
 
 # NWS Forecast Agent - Retrieves live weather data from National Weather Service API
-nws_forecast_agent = Agent(
-    name="nws_forecast_agent",
-    model=os.getenv("MODEL"),
-    description="Retrieves real-time weather forecasts, alerts, and current conditions from the National Weather Service API.",
-    instruction="""
-        You are a National Weather Service (NWS) data specialist for the Weather Insights and Forecast Advisor system.
-        You retrieve live weather data including forecasts, alerts, current conditions, and hurricane tracking.
-        
-        **CRITICAL - Execution Protocol for ALERTS:**
-        When user asks for weather alerts, determine the location type and call get_nws_alerts accordingly:
-        
-        1. **National/Regional queries** (call with NO parameters):
-           - "all US states", "United States", "national", "entire US"
-           - "western US states", "eastern US", "midwest", "southern states", "northeast"
-           - Any phrase containing "US states" or "United States"
-           → Call: get_nws_alerts() with NO parameters
-           → This returns ALL active US alerts
-           → **IMPORTANT**: Summarize the alerts, don't list all of them!
-           → Present: Total count, breakdown by severity, top 5-10 most critical alerts with details
-        
-        2. **State queries** (call with state code):
-           - "California", "Texas", "Florida", "New York", etc.
-           - Single state names
-           → Extract two-letter code (CA, TX, FL, NY)
-           → Call: get_nws_alerts(state="CA")
-           → Present: Summary with count and top critical alerts
-        
-        3. **City queries** (call with NO parameters):
-           - "Miami", "Houston", "Los Angeles", etc.
-           → Call: get_nws_alerts() with NO parameters
-           → Present: Summary focusing on relevant alerts
-        
-        **NEVER say you need more specific location for alerts - just call the tool!**
-        
-        **Response Format for Large Alert Sets:**
-        The tool automatically limits results to top 15 critical alerts when >20 total.
-        Present the data you receive concisely:
-        - Total alerts: [total_count]
-        - Severity breakdown: [from severity_breakdown]
-        - Critical Alerts (list the alerts returned):
-          * [Event] - [Headline]
-        - Note: [include the 'note' field from tool response]
-        
-        For FORECASTS:
-        - Coordinates will be in state as geocode_result
-        - Extract lat/lng and call get_nws_forecast
-        
-        Present weather data in clear, actionable format for emergency managers.
-        
-        Your capabilities:
-        1. Get weather forecasts:
-           - 7-day forecasts for any location
-           - Hourly forecasts for next 48 hours
-           - Current weather conditions
-        
-        2. Retrieve severe weather alerts (LIVE):
-           - Hurricane warnings and watches
-           - Tornado warnings
-           - Flood watches and warnings
-           - Heat advisories
-           - Winter storm warnings
-        
-        3. Hurricane tracking (LIVE):
-           - Current storm position and intensity
-           - Projected path (cone of uncertainty)
-           - Landfall predictions
-           - Wind speed and category
-        
-        4. Data freshness:
-           - Alerts update in real-time (seconds)
-           - Current conditions update every 5-60 minutes
-           - Forecasts update every 1-3 hours
-           - Hurricane data updates every 3-6 hours
-        
-        When presenting weather data:
-        - NWS returns forecast "periods" (day/night segments), NOT full days
-        - Format each day/night period on a NEW LINE with clear structure
-        - Use markdown formatting for better readability:
-          * Use **bold** for day names (e.g., **Monday**)
-          * Use bullet points or line breaks between periods
-          * Group day and night together with clear separation
-        - Example format:
-          **Monday**
-          - Day: Sunny, high near 80°F. North wind 7 mph.
-          - Night: Clear, low around 54°F. North wind 2-6 mph.
-          
-          **Tuesday**
-          - Day: Sunny, high near 81°F. Northwest wind 3-7 mph.
-          - Night: Partly cloudy, low around 54°F. West wind 7-12 mph.
-        - Include timestamps for data freshness at the end
-        - Highlight severe weather alerts prominently
-        - Use clear, non-technical language
-        
-        Available tools:
-        - get_nws_forecast(latitude, longitude): Get 7-day forecast - coordinates from state.geocode_result
-        - get_hourly_forecast(latitude, longitude): Get hourly forecast - coordinates from state.geocode_result
-        - get_nws_alerts(state_code): Get active weather alerts (real-time)
-          * For national alerts: call with no parameters
-          * For state alerts: use two-letter state code (e.g., "CA", "TX", "FL")
-          * For regional queries (West, Midwest, South, Northeast): call with no parameters and filter results
-          * NEVER reject "United States" or regional queries - get all alerts and present them
-        - get_current_conditions(latitude, longitude): Get current weather - coordinates from state.geocode_result
-        - get_hurricane_track(storm_id): Get live hurricane tracking data with KMZ visualization files
-          * Returns current position, intensity, forecast track
-          * Provides KMZ file URLs for:
-            - Cone of uncertainty (forecast cone)
-            - Track (past and forecast path)
-            - Warnings (watches/warnings)
-            - Wind radii (current and forecast wind fields)
-          * Present KMZ links as clickable URLs for visualization in Google Earth
-        
-        When presenting hurricane data:
-        - Show storm name, classification, and current intensity
-        - Display current position and movement
-        - CRITICAL: Present the NHC graphics page and KMZ download links with clear instructions
-        - Format visualization options like this:
-          
-          **View Hurricane Path:**
-          - [NHC Graphics Page](nhc_graphics_url) - Interactive maps and forecasts
-          
-          **Download KMZ Files:**
-          - [Forecast Cone](kmz_cone_url)
-          - [Track Path](kmz_track_url)
-          - [Warnings](kmz_warnings_url)
-          
-          **How to View in Google Earth:**
-          1. Download the KMZ file above
-          2. Go to [Google Earth Web](google_earth_web_url)
-          3. Click the menu icon (☰) → "Import KML file"
-          4. Select your downloaded KMZ file
-          
-          The hurricane path and cone will then display in Google Earth.
-        
-        Workflow:
-        1. Extract coordinates from state.geocode_result (always present)
-        2. Call appropriate tool with those coordinates
-        3. Present the data with visualization links
-        
-        Current state: { geocode_result: {lat, lng, formatted_address} } { forecast_data? } { alerts? } { current_conditions? }
-        """,
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.2,
-    ),
-    tools=[get_nws_forecast, get_hourly_forecast, get_nws_alerts, get_current_conditions, get_hurricane_track],
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit
-)
+@functools.cache
+def _nws_forecast_agent() -> Agent:
+    from .weather_tools.tools import (
+        get_nws_forecast,
+        get_hourly_forecast,
+        get_forecasts_for_locations,
+        get_nws_alerts,
+        get_current_conditions,
+        get_hurricane_track
+    )
+    return Agent(
+        name="nws_forecast_agent",
+        model=_shared_model(),
+        description="Retrieves real-time weather forecasts, alerts, and current conditions from the National Weather Service API.",
+        instruction=PrecompiledTemplate(_load_instruction("nws_forecast")),
+        generate_content_config=DETERMINISTIC_CFG,
+        tools=[get_nws_forecast, get_hourly_forecast, get_forecasts_for_locations, get_nws_alerts, get_current_conditions, get_hurricane_track],
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit
+    )
 
 # Image Analysis Agent - Analyzes weather event images using vision capabilities
-image_analysis_agent = Agent(
-    name="image_analysis_agent",
-    model=os.getenv("MODEL"),
-    description="Analyzes uploaded images of weather events, damage assessments, and environmental conditions to provide emergency response recommendations.",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-    instruction="""
-        You are a Weather Event Image Analysis specialist for the Weather Insights and Forecast Advisor system.
-        You analyze images of weather events, storm damage, flooding, and environmental conditions to help emergency managers make informed decisions.
-        
-        **CRITICAL - Image Analysis Protocol:**
-        - When user uploads an image, analyze it immediately and provide detailed observations
-        - Identify weather-related hazards, damage severity, and safety concerns
-        - After analysis, ASK: "Would you like me to provide specific recommendations based on this assessment?"
-        - Present findings in clear, actionable format for emergency response
-        
-        Your capabilities:
-        1. Weather Event Identification:
-           - Storm damage assessment (wind, hail, tornado damage)
-           - Flood depth and extent analysis
-           - Snow/ice accumulation evaluation
-           - Fire/smoke conditions
-           - Cloud formations and severe weather indicators
-        
-        2. Damage Assessment:
-           - Structural damage severity (buildings, infrastructure)
-           - Road and transportation impacts
-           - Utility infrastructure damage (power lines, poles)
-           - Vegetation and debris hazards
-           - Estimate damage categories (minor, moderate, severe, catastrophic)
-        
-        3. Safety Hazard Identification:
-           - Immediate dangers (downed power lines, unstable structures)
-           - Flood water contamination risks
-           - Access and evacuation route obstacles
-           - Public safety concerns
-        
-        4. Emergency Response Recommendations:
-           - Immediate actions required
-           - Resource deployment priorities
-           - Evacuation necessity assessment
-           - Search and rescue considerations
-           - Recovery timeline estimates
-        
-        **Analysis Framework:**
-        When analyzing an image, provide:
-        1. **Event Type**: What weather event or condition is shown
-        2. **Severity Assessment**: Scale of 1-10 with justification
-        3. **Key Observations**: Specific details visible in the image
-        4. **Hazards Identified**: Safety concerns and risks
-        5. **Recommended Actions**: Immediate and short-term response steps
-        6. **Resource Needs**: Equipment, personnel, or supplies required
-        
-        **Example Analysis:**
-        "I can see significant flooding with water levels approximately 3-4 feet deep based on visible markers. 
-        Several vehicles are partially submerged, indicating rapid water rise. The brown color suggests 
-        contamination. Immediate concerns: potential swift water rescue needs, road closures required, 
-        contamination risks. Recommend: Deploy water rescue teams, establish perimeter, assess upstream 
-        dam/levee conditions, prepare emergency shelters for displaced residents."
-        
-        Present findings in emergency-response friendly language with specific, actionable recommendations.
-        
-        Current state: { image_analysis? } { identified_hazards? } { recommendations? }
-        """,
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.3,
-    ),
-    tools=[]  # Vision capabilities are built into the model
-)
+@functools.cache
+def _image_analysis_agent() -> Agent:
+    return Agent(
+        name="image_analysis_agent",
+        model=_shared_model(),
+        description="Analyzes uploaded images of weather events, damage assessments, and environmental conditions to provide emergency response recommendations.",
+        before_model_callback=[log_agent_entry, shrink_uploaded_images],
+        after_model_callback=log_agent_exit,
+        instruction=PrecompiledTemplate(_load_instruction("image_analysis")),
+        generate_content_config=CREATIVE_CFG,
+        tools=[]  # Vision capabilities are built into the model
+    )
 
 # Insights Agent - Correlates forecast data with historical/demographic data
-correlation_insights_agent = Agent(
-    name="correlation_insights_agent",
-    model=os.getenv("MODEL"),
-    description="Correlates weather forecast data with historical events and demographic data to generate actionable emergency response insights.",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-    instruction="""
-        You are a data correlation and insights specialist for the Weather Insights and Forecast Advisor system.
-        You combine weather forecasts with historical data and demographics to provide actionable emergency response recommendations.
-        
-        **CRITICAL - Execution Protocol:**
-        - When coordinator routes risk analysis requests to you, first assess event complexity
-        - For SIMPLE events (rip currents, beach hazards, minor flooding), provide immediate common-sense risk analysis
-        - For COMPLEX events (hurricanes, major floods, heat waves), gather demographic/historical data from BigQuery
-        
-        **Simple Events - Immediate Analysis (NO BigQuery needed):**
-        - Rip Current Statements
-        - Beach Hazards Statements  
-        - Minor Coastal Flooding
-        - Wind Advisories
-        - Small Craft Advisories
-        
-        For simple events:
-        1. Check state for alert details
-        2. Provide immediate risk assessment based on alert severity and common knowledge
-        3. Focus on: affected population type, immediate safety actions, resource needs
-        4. NO need to query demographics or historical data
-        
-        **Complex Events - Data-Driven Analysis (Requires BigQuery):**
-        - Hurricane warnings/watches
-        - Major flood warnings
-        - Extreme heat warnings
-        - Tornado warnings affecting large areas
-        - Multi-day severe weather events
-        
-        For complex events:
-        1. Check state for alerts and location data
-        2. Request bigquery_data_agent to query demographics and historical patterns
-        3. Perform correlation analysis with specific numbers
-        4. Present data-driven risk assessment
-        
-        - After presenting analysis, ASK: "Would you like me to provide more detailed recommendations?"
-        - Present insights in clear, actionable format for emergency managers
-        
-        Your capabilities:
-        1. Risk assessment and scoring:
-           - Calculate risk scores based on historical patterns + current conditions
-           - Identify vulnerable populations using census data
-           - Prioritize areas requiring immediate attention based on data
-        
-        2. Comparative analysis:
-           - Compare current forecast to historical worst-case scenarios
-           - Identify patterns from past events
-           - Predict impact based on historical data
-        
-        3. Resource allocation recommendations:
-           - Evacuation priority lists based on vulnerable populations
-           - Cooling center placement using demographic data
-           - Emergency shelter capacity planning
-           - Medical transport requirements
-        
-        **Example Risk Analysis Workflows:**
-        
-        SIMPLE EVENT - Rip Current Statement:
-        User: "Any risks associated with Rip Current Statement in Coastal Miami-Dade?"
-        
-        Step 1: Check state for alert details (severity: Moderate)
-        Step 2: Provide immediate common-sense analysis:
-          - "Moderate risk to beachgoers and swimmers"
-          - "Primary vulnerable groups: tourists unfamiliar with conditions, children, inexperienced swimmers"
-          - "Recommended actions: Increase lifeguard presence, post warning signs, public announcements"
-          - "No demographic data needed - standard coastal safety protocol"
-        
-        COMPLEX EVENT - Hurricane Warning:
-        User: "Risk analysis for Category 3 hurricane approaching Miami-Dade"
-        
-        Step 1: Check state for alert details
-        Step 2: Call bigquery_data_agent to query:
-          - "Get census data for elderly population in Miami-Dade County"
-          - "Find historical hurricane impacts in South Florida"
-          - "Query flood-prone census tracts in the projected path"
-        Step 3: Analyze correlation between hurricane path + vulnerable populations
-        Step 4: Present data-driven risk assessment with specific numbers and evacuation priorities
-        
-        4. Correlation workflows:
-           
-           **Hurricane Evacuation Priority:**
-           - Combine: hurricane path + flood history + elderly population
-           - Calculate: risk_score = elderly_% × 0.3 + flood_history × 0.4 + in_path × 0.3
-           - Output: Prioritized census tract list with evacuation recommendations
-           
-           **Heat Wave Impact Analysis:**
-           - Compare: current forecast vs. historical worst heat wave
-           - Identify: vulnerable populations (elderly, low-income, no AC)
-           - Predict: expected hospitalizations based on historical patterns
-           - Output: Cooling center locations and capacity recommendations
-        
-        When generating insights:
-        - Use data from both forecast_agent and data_agent
-        - Calculate quantitative risk scores
-        - Provide specific, actionable recommendations
-        - Include resource allocation details
-        - Reference historical context
-        
-        Output format:
-        - Analysis summary
-        - Risk assessment (overall risk level, affected population)
-        - Priority list (ranked by risk score)
-        - Specific recommendations with timelines
-        - Resource allocation requirements
-        
-        Current state: { forecast_data? } { query_results? } { demographic_data? } { historical_data? } { insights? }
-        """,
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.3,
-    ),
-    tools=[]  # Insights agent uses data from state, no external tools needed
-)
+@functools.cache
+def _correlation_insights_agent() -> Agent:
+    from .weather_tools.tools import score_tracts
+    return Agent(
+        name="correlation_insights_agent",
+        model=_shared_model(),
+        description="Correlates weather forecast data with historical events and demographic data to generate actionable emergency response insights.",
+        before_model_callback=log_agent_entry,
+        after_model_callback=log_agent_exit,
+        instruction=PrecompiledTemplate(_load_instruction("correlation_insights")),
+        generate_content_config=CREATIVE_CFG,
+        tools=[score_tracts]  # Scores tracts in bulk; all other inputs come from state
+    )
 
 # Root Agent - Orchestrates the weather insights workflow
-root_agent = Agent(
-    name="weather_advisor_coordinator",
-    model=os.getenv("MODEL"),
-    description="Weather Insights and Forecast Advisor that helps emergency managers make data-driven decisions during severe weather events.",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-    instruction="""
-        You are the Weather Insights and Forecast Advisor Coordinator - an intelligent assistant for emergency managers
-        and public safety officials during severe weather events.
-        
-        Your mission: Combine real-time weather forecasts with historical data and demographics to enable
-        proactive emergency response and resource allocation.
-        
-        **Your Comprehensive Capabilities:**
-        
-        When greeting users, provide detailed information about ALL your capabilities:
-        
-        1. **Real-Time Weather Intelligence:**
-           - 7-day weather forecasts for any location in the US
-           - Hourly forecasts for the next 48 hours
-           - Current weather conditions from live NWS stations
-           - Active weather alerts (hurricanes, tornadoes, floods, heat warnings)
-           - Hurricane tracking with projected paths and intensity
-           - Severe weather monitoring (real-time updates)
-        
-        2. **Location & Navigation Services:**
-           - Geocode any address to precise coordinates
-           - Calculate evacuation routes with travel times
-           - Find alternative routes for emergency planning
-           - Search for nearby emergency shelters within any radius
-           - Locate hospitals, pharmacies, and medical facilities
-           - Generate interactive maps with markers for affected areas
-           - Visualize emergency zones and resource locations
-        
-        3. **Risk Analysis & Assessment:**
-           - Simple events (rip currents, beach hazards): Immediate common-sense analysis
-           - Complex events (hurricanes, floods, heat waves): Data-driven analysis with historical context
-           - Identify vulnerable populations (elderly, low-income, mobility-impaired)
-           - Calculate risk scores based on multiple factors
-           - Prioritize evacuation zones by risk level
-           - Compare current events to historical worst-case scenarios
-        
-        4. **Historical Weather Data & Demographics:**
-           - Query NOAA GSOD historical weather data for ANY past date
-           - Access census demographic data by census tract
-           - Analyze historical extreme weather events
-           - Identify patterns from past incidents
-           - Find weather stations near specific locations
-           - Query monthly temperature averages for long-term trends
-           - **CRITICAL**: Historical weather = bigquery_data_agent, NOT nws_forecast_agent
-        
-        5. **Emergency Response Planning:**
-           - Evacuation priority lists with population counts
-           - Resource allocation recommendations (shelters, medical transport, first responders)
-           - Cooling center placement during heat waves
-           - Emergency shelter capacity planning
-           - Timeline-based action plans (0-6 hours, 6-12 hours, etc.)
-           - Special needs identification (medical transport requirements)
-        
-        6. **Image Analysis (Future):**
-           - Assess flood depth and severity from images
-           - Identify hazards in weather event photos
-           - Recommend immediate actions based on visual assessment
-        
-        **Example Queries I Can Handle:**
-        - "Give me the 7-day forecast for Miami, FL" → nws_forecast_agent
-        - "What are the current weather alerts in California?" → nws_forecast_agent
-        - "Get me historical weather data for San Ramon, CA for March 2023" → bigquery_data_agent
-        - "What was the weather like in Phoenix in July 2022?" → bigquery_data_agent
-        - "Find the nearest emergency shelters to downtown Houston" → location_services_agent
-        - "Calculate the fastest evacuation route from Tampa to Orlando" → location_services_agent
-        - "Show me a map of the flood warning areas in Astor, FL" → location_services_agent
-        - "Perform risk analysis for the hurricane approaching Miami-Dade County" → correlation_insights_agent
-        - "Which census tracts have high elderly populations in flood zones?" → bigquery_data_agent
-        - "Compare this heat wave to the worst heat wave on record for Phoenix" → bigquery_data_agent
-        - "Find historical extreme temperature events in Del Norte County" → bigquery_data_agent
-        - "What's the weather at my current location?" (provide address or coordinates) → nws_forecast_agent
-        
-        Your workflow:
-        1. Greet the user with comprehensive capability overview (first message only)
-        2. Understand the user's query and identify what data is needed
-        3. Check state - if required data is missing, call the appropriate agent to get it first
-        4. Route to agents in the correct sequence to fulfill the request
-        5. For risk analysis, assess event complexity BEFORE routing to insights agent
-        
-        **CRITICAL - Proactive Agent Routing:**
-        - When user asks for FUTURE forecast with a location NAME (e.g., "Miami, FL"):
-          → First call location_services_agent to geocode
-          → Then call nws_forecast_agent with coordinates from state
-        - When user asks for HISTORICAL weather (past dates like "March 2023", "July 2022"):
-          → Route DIRECTLY to bigquery_data_agent (NOT nws_forecast_agent)
-          → bigquery_data_agent handles geocoding and NOAA GSOD queries automatically
-        - When user asks for forecast with coordinates already in state:
-          → Directly call nws_forecast_agent
-        - DO NOT wait for sub-agents to tell you they need data - anticipate and get it first
-        - **Key distinction**: "forecast" = future = NWS, "historical" = past = BigQuery
-        
-        **CRITICAL - NO CONFIRMATION NEEDED:**
-        - When user asks for forecast, directions, or places - execute immediately
-        - DO NOT ask "Would you like me to proceed?" - just execute
-        - For forecasts: ALWAYS geocode first, then get forecast - do both steps automatically
-        - If a sub-agent says it needs coordinates, immediately call location_services_agent to get them
-        - Only ask for clarification if information is truly missing or ambiguous
-        
-        **Risk Analysis Routing Decision:**
-        When user asks for risk analysis, YOU must decide the approach:
-        
-        SIMPLE EVENTS (common-sense analysis only):
-        - Rip currents, beach hazards, minor coastal flooding
-        - Wind advisories, small craft advisories
-        → Route to correlation_insights_agent for immediate common-sense analysis
-        → NO BigQuery data needed
-        
-        COMPLEX EVENTS (data-driven analysis required):
-        - Hurricanes, major floods, extreme heat, tornadoes
-        - Multi-day severe weather affecting large populations
-        → Route to correlation_insights_agent which will then call bigquery_data_agent
-        → Requires demographic and historical data
-        
-        Routing logic:
-        - Weather forecast for a location (e.g., "forecast for Mountain View")
-          → YOU analyze the request and see it contains a location NAME
-          → YOU immediately call location_services_agent to geocode FIRST
-          → YOU wait for coordinates to be stored in state
-          → YOU then call nws_forecast_agent which will use those coordinates
-          → IMPORTANT: You orchestrate the sequence - geocode BEFORE forecast
-        
-        - Directions/routes
-          → location_services_agent (get directions immediately)
-        
-        - Finding places/resources
-          → location_services_agent (geocode if needed, then search)
-        
-        - Image analysis
-          → image_analysis_agent
-                
-        - Historical weather data (past dates)
-          → bigquery_data_agent (handles NOAA GSOD historical weather queries)
-        
-        - Census/demographics data
-          → bigquery_data_agent
-        
-        - Risk analysis/emergency assessment/impact analysis
-          → Gather data from relevant agents → correlation_insights_agent for analysis
-          → DO NOT let location_services_agent handle risk analysis
-        
-        - Complex correlation queries
-          → Multiple agents → correlation_insights_agent
-        
-        Example queries and routing:
-        
-        1. "Give me 10 day forecast for Mountain View, CA"
-           → YOU see this is a forecast request with location NAME "Mountain View, CA"
-           → YOU recognize coordinates are needed but not in state
-           → Step 1: YOU call location_services_agent to geocode "Mountain View, CA" FIRST
-           → Step 2: YOU wait for coordinates to be stored in state
-           → Step 3: YOU call nws_forecast_agent which will use coordinates from state
-           → Step 4: YOU present 7-day forecast (NWS provides max 7 days)
-           → YOU orchestrate all steps - never ask user for coordinates
-        
-        1b. "Get me historical weather data for San Ramon, CA for March 2023"
-           → YOU see this is a HISTORICAL weather request (past date: March 2023)
-           → YOU recognize this requires BigQuery GSOD data, NOT NWS forecast data
-           → Step 1: YOU call bigquery_data_agent to get historical weather
-           → Step 2: bigquery_data_agent will geocode and query NOAA GSOD automatically
-           → Step 3: YOU present historical weather data in formatted table
-           → CRITICAL: NEVER route historical weather to nws_forecast_agent
-        
-        2. "Any risks associated with Rip Current Statement in Miami-Dade?"
-           → Coordinator assesses: SIMPLE event (rip current)
-           → correlation_insights_agent:
-              a. Checks state for alert details
-              b. Provides immediate common-sense risk analysis (NO BigQuery)
-              c. Identifies vulnerable groups (beachgoers, tourists, children)
-              d. Recommends standard coastal safety actions
-           → Present risk assessment
-        
-        3. "Risk analysis for Category 3 hurricane approaching Miami"
-           → Coordinator assesses: COMPLEX event (hurricane)
-           → correlation_insights_agent:
-              a. Checks state for alert details
-              b. Calls bigquery_data_agent for demographics + historical data
-              c. Analyzes correlation with specific numbers
-              d. Presents data-driven evacuation priorities
-           → Present detailed risk assessment
-        
-        3. "Find the nearest emergency shelters to downtown Miami"
-           → location_services_agent (geocode location, search for shelters)
-        
-        4. "What's the fastest evacuation route from Tampa to Orlando?"
-           → location_services_agent (calculate routes, travel times, alternatives)
-        
-        5. [User uploads image of flooded street] "What's the severity of this flooding?"
-           → image_analysis_agent (analyze flood depth, hazards, recommend actions)
-                
-        6. "We have a Category 3 hurricane approaching. Which census tracts in the predicted path 
-            have a history of major flooding and high elderly populations?"
-           → nws_forecast_agent (get hurricane path)
-           → bigquery_data_agent (get census tracts, flood history, elderly population)
-           → correlation_insights_agent (calculate risk scores, prioritize evacuations)
-        
-        Key principles:
-        - Be proactive and efficient in emergency situations
-        - Provide clear, actionable insights
-        - Include specific data points and recommendations
-        - Reference historical context when relevant
-        - Prioritize public safety
-        
-        Context awareness:
-        - Check what data is already in state before requesting
-        - Coordinate between agents efficiently
-        - Present final insights in clear, decision-ready format
-        
-        Current state:
-        - Forecast Data: { forecast_data? }
-        - Alerts: { alerts? }
-        - Query Results: { query_results? }
-        - Demographic Data: { demographic_data? }
-        - Historical Data: { historical_data? }
-        - Insights: { insights? }
-        - Image Analysis: { image_analysis? }
-        - Identified Hazards: { identified_hazards? }
-        - Map Data: { map_data? }
-        - Routes: { routes? }
-        - Locations: { locations? }
-        """,
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.1,
-        max_output_tokens=2048,
-    ),
-    sub_agents=[location_services_agent, image_analysis_agent, bigquery_data_agent, nws_forecast_agent, correlation_insights_agent]
-)
+@functools.cache
+def _coordinator_agent() -> Agent:
+    return Agent(
+        name="weather_advisor_coordinator",
+        model=_small_model(),
+        description="Weather Insights and Forecast Advisor that helps emergency managers make data-driven decisions during severe weather events.",
+        before_model_callback=[log_agent_entry, shrink_uploaded_images, route_single_intent],
+        after_model_callback=log_agent_exit,
+        instruction=PrecompiledTemplate(_load_instruction("coordinator")),
+        generate_content_config=COORDINATOR_CFG,
+        # Data agents are exposed as tools so independent calls issued in one turn are
+        # dispatched concurrently by the runtime instead of one transfer at a time
+        tools=[
+            BoundedAgentTool(agent=_location_services_agent()),
+            BoundedAgentTool(agent=_bigquery_data_agent()),
+            BoundedAgentTool(agent=_nws_forecast_agent()),
+            BoundedAgentTool(agent=_correlation_insights_agent()),
+        ],
+        sub_agents=[_image_analysis_agent()]
+    )
+
+
+_AGENT_FACTORIES = {
+    "location_services_agent": _location_services_agent,
+    "bigquery_data_agent": _bigquery_data_agent,
+    "nws_forecast_agent": _nws_forecast_agent,
+    "image_analysis_agent": _image_analysis_agent,
+    "correlation_insights_agent": _correlation_insights_agent,
+}
+
 
+def __getattr__(name: str):
+    """Build agents on first access (PEP 562) instead of at import time"""
+    if name == "root_agent":
+        return _coordinator_agent()
+    if name in _AGENT_FACTORIES:
+        return _AGENT_FACTORIES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
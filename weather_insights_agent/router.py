@@ -0,0 +1,124 @@
+"""Deterministic routing for the weather advisor coordinator.
+
+Keyword tables are compiled once at import; the coordinator's before-model
+callback uses them to skip its LLM routing turn when a query's target agents
+are unambiguous.
+"""
+
+import re
+import logging
+from typing import List, Literal, Optional, Tuple
+
+from google.genai import types
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmResponse, LlmRequest
+
+logger = logging.getLogger(__name__)
+
+# Deterministic router for single-intent queries. When exactly one data agent
+# matches, the coordinator's routing turn is skipped and that agent tool is
+# called directly; ambiguous and complex multi-step queries still go to the LLM.
+ROUTES = (
+    ("location_services_agent", re.compile(
+        r"\b(shelters?|cooling cent(er|re)s?|hospitals?|pharmac(y|ies)|evacuation routes?|directions?|maps?)\b", re.I)),
+    ("bigquery_data_agent", re.compile(
+        r"\b(census|demographics?|flood zones?|historical|elderly|on record|(19|20)\d{2})\b", re.I)),
+    ("nws_forecast_agent", re.compile(
+        r"\b(forecast|weather|hurricanes?|alerts?|temperatures?|conditions)\b", re.I)),
+)
+MULTI_STEP_PATTERN = re.compile(
+    r"\b(risks?|analy[sz]\w*|impacts?|priorit\w*|compare|recommend\w*|allocat\w*|correlat\w*)", re.I)
+NEEDS_COORDINATES_PATTERN = re.compile(r"\b(forecast|conditions|temperatures?)\b", re.I)
+# Agents with no data dependency on each other - dispatched together in one turn
+PARALLEL_TARGETS = frozenset({"bigquery_data_agent", "nws_forecast_agent"})
+
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile a keyword list into one alternation (longest phrases first)"""
+    alternatives = sorted((re.escape(k).replace(r"\ ", r"\s+") for k in keywords), key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")s?\b", re.I)
+
+
+# Event complexity, mirroring the SIMPLE/COMPLEX rules in the coordinator and
+# correlation instructions; each table is matched in a single regex pass
+EVENT_COMPLEXITY = (
+    ("COMPLEX", _keyword_pattern((
+        "hurricane", "tropical storm", "major flood", "flash flood", "extreme heat", "heat wave",
+        "tornado", "tornado outbreak"))),
+    ("SIMPLE", _keyword_pattern((
+        "rip current", "beach hazard", "minor coastal flooding", "coastal flood advisory",
+        "wind advisory", "small craft advisory", "small craft"))),
+)
+
+
+def classify(user_msg: str) -> Optional[Literal["SIMPLE", "COMPLEX"]]:
+    """Classify the weather event in a query (COMPLEX wins when both match)"""
+    for complexity, pattern in EVENT_COMPLEXITY:
+        if pattern.search(user_msg):
+            return complexity
+    return None
+
+
+def route(user_msg: str) -> List[str]:
+    """Return the agents a query maps to (empty when the LLM should plan it)"""
+    if MULTI_STEP_PATTERN.search(user_msg):
+        # Simple hazards are analyzed straight from the alert; complex events need data first
+        return ["correlation_insights_agent"] if classify(user_msg) == "SIMPLE" else []
+    return [name for name, pattern in ROUTES if pattern.search(user_msg)]
+
+
+def names_geocoded_place(user_msg: str, geocode: object) -> bool:
+    """Whether the query names the place of the geocode saved in state"""
+    if not isinstance(geocode, dict):
+        return False
+    for address in (geocode.get("address"), geocode.get("formatted_address")):
+        place = (address or "").split(",")[0].strip()
+        if place and re.search(rf"\b{re.escape(place)}\b", user_msg, re.I):
+            return True
+    return False
+
+
+def route_single_intent(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """Call the matching agent tool(s) directly when the router is confident.
+    
+    A single match is called directly; live NWS data plus BigQuery history are
+    requested together so the runtime runs both agents concurrently.
+    """
+    if not llm_request.contents:
+        return None
+    last = llm_request.contents[-1]
+    # Only route fresh user text; tool results and images go to the LLM
+    if last.role != "user" or not last.parts:
+        return None
+    if any(part.function_response or part.inline_data for part in last.parts):
+        return None
+    
+    user_msg = " ".join(part.text for part in last.parts if part.text).strip()
+    targets = route(user_msg) if user_msg else []
+    
+    # Forecast for a known city: start fetching at its centroid while geocoding runs
+    if "nws_forecast_agent" in targets and NEEDS_COORDINATES_PATTERN.search(user_msg):
+        from .weather_tools.tools import find_city_centroid, prefetch_forecast
+        centroid = find_city_centroid(user_msg)
+        if centroid:
+            prefetch_forecast(*centroid, period="hourly" if "hourly" in user_msg.casefold() else "7day")
+    
+    if not targets or (len(targets) > 1 and not PARALLEL_TARGETS.issuperset(targets)):
+        return None
+    
+    # Forecasts need coordinates for this query's place; unless the saved
+    # geocode is for the place named here, let the LLM geocode first
+    if ("nws_forecast_agent" in targets and NEEDS_COORDINATES_PATTERN.search(user_msg)
+            and not names_geocoded_place(user_msg, callback_context.state.get("geocode_result"))):
+        return None
+    
+    logger.info(f"🧭 ROUTED: {callback_context.agent_name} → {', '.join(targets)}")
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[
+                types.Part(function_call=types.FunctionCall(name=target, args={"request": user_msg}))
+                for target in targets
+            ]
+        )
+    )
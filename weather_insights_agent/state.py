@@ -0,0 +1,190 @@
+"""Typed views of the session state written by the weather tools.
+
+Tools keep storing plain dicts in session state (ADK persists state as JSON),
+but instructions render these models' compact summaries instead of the full
+payloads, so large forecast/alert/census blobs are not re-sent to the model on
+every turn. Other keys go through summarize(), which keeps small values intact
+and reduces large lists/dicts to their shape. Tools that need the full data
+read it from state directly.
+"""
+
+import functools
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+class StateModel(BaseModel):
+    """Base for state views - tolerant of extra keys written by the tools"""
+    model_config = ConfigDict(extra="ignore")
+
+    def summary(self) -> str:
+        """Compact rendering of the fields; subclasses describe their data instead"""
+        return summarize(self.model_dump(exclude_none=True))
+
+
+class ForecastPeriod(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    name: Optional[str] = None
+    temperature: Optional[float] = None
+    temperature_unit: Optional[str] = None
+    short_forecast: Optional[str] = None
+
+
+class ForecastData(StateModel):
+    location: Optional[str] = None
+    periods: List[ForecastPeriod] = []
+    updated: Optional[str] = None
+
+    def summary(self) -> str:
+        head = "; ".join(
+            f"{p.name}: {p.temperature}°{p.temperature_unit or ''} {p.short_forecast or ''}".strip()
+            for p in self.periods[:4]
+        )
+        return f"Forecast for {self.location} ({len(self.periods)} periods, updated {self.updated}): {head}"
+
+
+class Alert(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    event: Optional[str] = None
+    severity: Optional[str] = None
+    headline: Optional[str] = None
+
+
+class AlertsData(StateModel):
+    alerts: List[Alert] = []
+    count: int = 0
+    severity_breakdown: Dict[str, int] = {}
+    limited: bool = False
+
+    def summary(self) -> str:
+        breakdown = ", ".join(f"{k}: {v}" for k, v in self.severity_breakdown.items() if v)
+        top = "; ".join(f"{a.event} ({a.severity}) - {a.headline}" for a in self.alerts[:5])
+        return f"{self.count} active alerts ({breakdown}). Top: {top}"
+
+
+class CensusDemographics(StateModel):
+    city: Optional[str] = None
+    state: Optional[str] = None
+    total_population: Optional[int] = None
+    total_households: Optional[int] = None
+    avg_median_age: Optional[float] = None
+    avg_median_income: Optional[float] = None
+    census_tracts: Optional[int] = None
+    message: Optional[str] = None
+
+    def summary(self) -> str:
+        if self.message:
+            return self.message
+        return (
+            f"{self.city}, {self.state}: population {self.total_population}, "
+            f"{self.total_households} households, median age {self.avg_median_age}, "
+            f"median income ${self.avg_median_income} across {self.census_tracts} census tracts"
+        )
+
+
+class HistoricalRecord(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    date: Optional[str] = None
+    max_temp: Optional[float] = None
+    min_temp: Optional[float] = None
+    precipitation: Optional[float] = None
+
+
+class HistoricalWeather(StateModel):
+    usaf_id: Optional[str] = None
+    records: List[HistoricalRecord] = []
+    count: int = 0
+
+    def summary(self) -> str:
+        dates = sorted(r.date for r in self.records if r.date)
+        highs = [r.max_temp for r in self.records if r.max_temp is not None]
+        lows = [r.min_temp for r in self.records if r.min_temp is not None]
+        span = f"{dates[0]} to {dates[-1]}" if dates else "no dates"
+        extremes = f", high {max(highs)}°F, low {min(lows)}°F" if highs and lows else ""
+        return f"{self.count} daily records from station {self.usaf_id} ({span}{extremes})"
+
+
+class RiskScores(StateModel):
+    ranked_tracts: List[Dict[str, Any]] = []
+
+    def summary(self) -> str:
+        top = "; ".join(
+            f"{t.get('geo_id') or t.get('name')}: {t.get('risk_score')}"
+            for t in self.ranked_tracts[:5]
+        )
+        return f"{len(self.ranked_tracts)} tracts scored. Highest risk: {top}"
+
+
+class SessionState(BaseModel):
+    """Typed schema of the state keys the weather agents read and write"""
+    model_config = ConfigDict(extra="allow")
+
+    forecast_data: Optional[ForecastData] = None
+    alerts: Optional[AlertsData] = None
+    census_demographics: Optional[CensusDemographics] = None
+    historical_weather: Optional[HistoricalWeather] = None
+    risk_scores: Optional[RiskScores] = None
+
+
+# State keys rendered as summaries in instructions
+STATE_MODELS = {
+    "forecast_data": ForecastData,
+    "alerts": AlertsData,
+    "census_demographics": CensusDemographics,
+    "historical_weather": HistoricalWeather,
+    "risk_scores": RiskScores,
+}
+
+
+# Limits for rendering untyped state values: long text is cut, and containers
+# beyond a couple of levels or a handful of items collapse to their shape
+MAX_TEXT_CHARS = 2000
+MAX_INLINE_ITEMS = 5
+MAX_DEPTH = 3
+
+
+@functools.singledispatch
+def summarize(value: Any, depth: int = 0) -> str:
+    """Compact rendering of an untyped state value (scalars render as-is)"""
+    return str(value)
+
+
+@summarize.register
+def _summarize_text(value: str, depth: int = 0) -> str:
+    if len(value) <= MAX_TEXT_CHARS:
+        return value
+    return f"{value[:MAX_TEXT_CHARS]}… ({len(value)} chars)"
+
+
+@summarize.register
+def _summarize_mapping(value: dict, depth: int = 0) -> str:
+    if depth >= MAX_DEPTH:
+        return f"{{{len(value)} keys}}"
+    return "{" + ", ".join(f"{key}: {summarize(item, depth + 1)}" for key, item in value.items()) + "}"
+
+
+@summarize.register(list)
+@summarize.register(tuple)
+def _summarize_sequence(value: Sequence[Any], depth: int = 0) -> str:
+    if not value:
+        return "[]"
+    if depth >= MAX_DEPTH:
+        return f"[{len(value)} items]"
+    if len(value) <= MAX_INLINE_ITEMS:
+        return "[" + ", ".join(summarize(item, depth + 1) for item in value) + "]"
+    return f"[{len(value)} items, first: {summarize(value[0], depth + 1)}]"
+
+
+def render_state_value(key: str, value: Any) -> str:
+    """Render a state value for an instruction slot (summary for typed keys)"""
+    model = STATE_MODELS.get(key)
+    if model is not None and isinstance(value, dict):
+        try:
+            return model.model_validate(value).summary()
+        except ValidationError:
+            pass
+    return summarize(value)
@@ -5,6 +5,7 @@ from .tools import (
     get_nws_alerts,
     get_current_conditions,
     get_hourly_forecast,
+    get_forecasts_for_locations,
     get_hurricane_track,
     geocode_address,
     get_directions,
@@ -19,6 +20,7 @@ __all__ = [
     "get_nws_alerts",
     "get_current_conditions",
     "get_hourly_forecast",
+    "get_forecasts_for_locations",
     "get_hurricane_track",
     "geocode_address",
     "get_directions",
@@ -0,0 +1,53 @@
+"""In-process TTL + LRU cache used by the weather tools"""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire after a TTL.
+
+    Lookups refresh recency and the least recently used entry is evicted once
+    maxsize is exceeded. ttl=None keeps entries until they are evicted; set()
+    can override the TTL per entry.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_entries")
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key (refreshing its recency) or default"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value, evicting the least recently used entries over maxsize"""
+        ttl = self.ttl if ttl is None else ttl
+        expires = math.inf if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
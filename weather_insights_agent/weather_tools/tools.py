@@ -1,15 +1,38 @@
 import os
 import json
+import asyncio
+import math
+import time
 import logging
-import requests
+import heapq
+import operator
+import reprlib
+import httpx
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from itertools import repeat
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
 from functools import wraps
 from google.adk.tools.tool_context import ToolContext
 from google.cloud import bigquery
 import google.auth
 from dotenv import load_dotenv
 
+from .cache import TTLCache
+
+try:
+    import numpy as np
+except ImportError:  # Optional - risk scoring falls back to pure-Python column math
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional - stdlib json is used without it
+    orjson = None
+
+# NWS alert and forecast GeoJSON can be several MB; decode with orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Configure detailed logging for tools
 logging.basicConfig(
     level=logging.INFO,
@@ -17,49 +40,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bounded repr for logging tool parameters - large lists/dicts are truncated
+# while being formatted instead of being fully serialized and then sliced
+_param_repr = reprlib.Repr()
+_param_repr.maxstring = 100
+_param_repr.maxother = 100
+_param_repr.maxlist = _param_repr.maxtuple = _param_repr.maxdict = 10
+_param_repr.maxlevel = 3
+
+
 # Tool call tracking decorator
 def track_tool_call(tool_name):
-    """Decorator to track tool calls with detailed logging"""
+    """Decorator to track tool calls with detailed logging (sync and async tools)"""
+    def log_call(func, args, kwargs):
+        logger.info(f"{'='*80}")
+        logger.info(f"🔧 TOOL CALL: {tool_name}")
+        logger.info(f"   Function: {func.__name__}")
+        
+        # Log parameters (skip tool_context)
+        params = {}
+        if len(args) > 1:
+            params['args'] = _param_repr.repr(args[1:])[:200]  # Truncate long args
+        if kwargs:
+            params['kwargs'] = {k: _param_repr.repr(v) for k, v in kwargs.items() if k != 'tool_context'}
+        
+        if params:
+            logger.info(f"   Parameters: {params}")
+        
+        logger.info(f"{'='*80}")
+    
+    def log_success(result):
+        logger.info(f"{'='*80}")
+        logger.info(f"✅ TOOL SUCCESS: {tool_name}")
+        if isinstance(result, dict):
+            if 'status' in result:
+                logger.info(f"   Status: {result.get('status')}")
+            if 'count' in result:
+                logger.info(f"   Count: {result.get('count')}")
+            if 'alerts' in result:
+                logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
+        logger.info(f"{'='*80}")
+    
+    def log_error(e):
+        logger.error(f"{'='*80}")
+        logger.error(f"❌ TOOL ERROR: {tool_name}")
+        logger.error(f"   Error: {str(e)}")
+        logger.error(f"{'='*80}")
+    
     def decorator(func):
+        # Async tools must stay coroutine functions so ADK awaits them
+        # on the event loop instead of calling them synchronously
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                log_call(func, args, kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+                    log_success(result)
+                    return result
+                except Exception as e:
+                    log_error(e)
+                    raise
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info(f"{'='*80}")
-            logger.info(f"🔧 TOOL CALL: {tool_name}")
-            logger.info(f"   Function: {func.__name__}")
-            
-            # Log parameters (skip tool_context)
-            params = {}
-            if len(args) > 1:
-                params['args'] = str(args[1:])[:200]  # Truncate long args
-            if kwargs:
-                params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
-            
-            if params:
-                logger.info(f"   Parameters: {params}")
-            
-            logger.info(f"{'='*80}")
-            
+            log_call(func, args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                
-                # Log result summary
-                logger.info(f"{'='*80}")
-                logger.info(f"✅ TOOL SUCCESS: {tool_name}")
-                if isinstance(result, dict):
-                    if 'status' in result:
-                        logger.info(f"   Status: {result.get('status')}")
-                    if 'count' in result:
-                        logger.info(f"   Count: {result.get('count')}")
-                    if 'alerts' in result:
-                        logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
-                logger.info(f"{'='*80}")
-                
+                log_success(result)
                 return result
             except Exception as e:
-                logger.error(f"{'='*80}")
-                logger.error(f"❌ TOOL ERROR: {tool_name}")
-                logger.error(f"   Error: {str(e)}")
-                logger.error(f"{'='*80}")
+                log_error(e)
                 raise
         return wrapper
     return decorator
@@ -72,12 +124,127 @@ application_default_credentials, project_id = google.auth.default()
 if not project_id:
     project_id = os.getenv("GCP_PROJECT") or os.getenv("GOOGLE_CLOUD_PROJECT")
 
-# Create BigQuery client
+# Create BigQuery client. Short read-only queries don't need a job resource, so
+# let BigQuery answer them statelessly in the jobs.query round trip itself
 bq_client = bigquery.Client(
     credentials=application_default_credentials,
-    project=project_id
+    project=project_id,
+    default_job_creation_mode="JOB_CREATION_OPTIONAL"
 )
 
+# BigQuery jobs run on worker threads so the event loop (and concurrent
+# model decoding / NWS calls) keeps going while a query executes
+_bq_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bq")
+
+
+def _normalize_sql(query: str) -> str:
+    """Collapse whitespace so equivalent queries are byte-identical text.
+    
+    BigQuery only serves its (free, 24h) result cache for exactly matching SQL.
+    """
+    return " ".join(query.split())
+
+
+def _execute_query(query: str, job_config: bigquery.QueryJobConfig) -> List[Any]:
+    """Run a query to completion, logging whether BigQuery's result cache answered it"""
+    rows = bq_client.query_and_wait(query, job_config=job_config)
+    cache_note = " (cache hit)" if rows.total_bytes_processed == 0 else ""
+    logger.info(f"BigQuery query {rows.query_id or rows.job_id}: {rows.total_bytes_processed} bytes processed{cache_note}")
+    return list(rows)
+
+
+def _submit_query(query: str, job_config: Optional[bigquery.QueryJobConfig] = None) -> Future:
+    """Start a BigQuery job in the background and return a future of its rows"""
+    job_config = job_config or bigquery.QueryJobConfig()
+    job_config.use_query_cache = True
+    return _bq_executor.submit(_execute_query, query, job_config)
+
+
+async def _run_query(query: str, job_config: Optional[bigquery.QueryJobConfig] = None) -> List[Any]:
+    """Run a BigQuery job without blocking the event loop"""
+    return await asyncio.wrap_future(_submit_query(query, job_config))
+
+
+# Parameterized query templates - the SQL shape is fixed, only values vary per call.
+# Whitespace is normalized once here so every submission of a template is identical.
+CENSUS_DEMOGRAPHICS_SQL = _normalize_sql("""
+SELECT 
+    geo_id,
+    total_pop,
+    median_age,
+    median_income,
+    housing_units,
+    households,
+    male_pop,
+    female_pop,
+    white_pop,
+    black_pop,
+    asian_pop,
+    hispanic_pop,
+    bachelors_degree,
+    median_rent,
+    owner_occupied_housing_units,
+    housing_units_renter_occupied
+FROM `bigquery-public-data.census_bureau_acs.censustract_2018_5yr` 
+WHERE SUBSTR(geo_id, 1, 2) = @state_fips
+LIMIT 100
+""")
+
+# Top 3 nearest stations using Euclidean distance
+NEAREST_STATIONS_SQL = _normalize_sql("""
+SELECT
+    usaf,
+    wban,
+    name,
+    state,
+    lat,
+    lon,
+    SQRT(POW((lat - @latitude), 2) + POW((lon - @longitude), 2)) as distance
+FROM
+    `bigquery-public-data.noaa_gsod.stations`
+WHERE
+    state = @state
+    AND lat IS NOT NULL
+    AND lon IS NOT NULL
+ORDER BY
+    distance
+LIMIT 3
+""")
+
+# Daily records for one station (USAF as stn field); wildcard table covers multiple years
+HISTORICAL_WEATHER_SQL = _normalize_sql("""
+SELECT 
+    CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') as date,
+    temp,
+    max,
+    min,
+    prcp,
+    sndp,
+    wdsp,
+    mxpsd
+FROM `bigquery-public-data.noaa_gsod.gsod*`
+WHERE stn = @usaf_id
+    AND CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') 
+        BETWEEN @start_date AND @end_date
+ORDER BY year DESC, mo DESC, da DESC
+LIMIT 100
+""")
+
+WEATHER_STATISTICS_SQL = _normalize_sql("""
+SELECT 
+    AVG(temp) as avg_temp,
+    MAX(max) as highest_temp,
+    MIN(min) as lowest_temp,
+    AVG(prcp) as avg_precipitation,
+    SUM(prcp) as total_precipitation,
+    AVG(wdsp) as avg_wind_speed,
+    MAX(mxspd) as max_wind_speed,
+    COUNT(*) as days_recorded
+FROM `bigquery-public-data.noaa_gsod.gsod{year}`
+WHERE stn = @station_id
+    AND (@month IS NULL OR EXTRACT(MONTH FROM date) = @month)
+""")
+
 # NWS API Configuration
 NWS_API_BASE = "https://api.weather.gov"
 NWS_USER_AGENT = os.getenv("NWS_USER_AGENT", "(WeatherAdvisor, contact@example.com)")
@@ -86,10 +253,152 @@ NWS_HEADERS = {
     "Accept": "application/geo+json"
 }
 
+# One async HTTP client (and connection pool) shared by every NWS, NHC and
+# Google Maps call, created lazily on first use
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared async client, recreating it if it was closed"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=64)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)"""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+# Freshness windows (seconds) for NWS/NHC responses, matching how often each feed updates
+NWS_CACHE_TTL = {
+    "alerts": 30,
+    "conditions": 300,
+    "forecast": 3600,
+    "hurricane": 10800,
+}
+NWS_CACHE_SIZE = 1024
+_nws_cache = TTLCache(maxsize=NWS_CACHE_SIZE)
+
+
+NWS_MAX_RETRIES = 2
+NWS_MAX_RETRY_WAIT = 5.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Seconds to wait from a Retry-After header (capped), defaulting to 1s"""
+    try:
+        wait = float(response.headers.get("Retry-After", 1))
+    except ValueError:
+        wait = 1.0
+    return min(max(wait, 0.0), NWS_MAX_RETRY_WAIT)
+
+
+# Requests currently on the wire, keyed by what they fetch
+_inflight: Dict[Hashable, "asyncio.Future"] = {}
+
+
+async def _single_flight(key: Hashable, make_request: Callable[[], Awaitable[Any]]) -> Any:
+    """Run make_request() once per key at a time; concurrent callers share its result.
+    
+    During bursts (several users asking about the same storm or city) outbound
+    calls scale with unique keys rather than with concurrent callers.
+    """
+    inflight = _inflight.get(key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(make_request())
+        _inflight[key] = inflight
+        inflight.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.info(f"Joining in-flight request: {key}")
+    # Shield so one caller's cancellation doesn't cancel the shared request
+    return await asyncio.shield(inflight)
+
+
+async def _get_json(url: str, **kwargs) -> Dict[str, Any]:
+    """GET a URL with the shared client, retrying NWS rate limits"""
+    kwargs["headers"] = {**NWS_HEADERS, **kwargs.get("headers", {})}
+    response = await _get_http_client().get(url, **kwargs)
+    # NWS rate limits with 429/503; honor Retry-After before giving up
+    for _ in range(NWS_MAX_RETRIES):
+        if response.status_code not in (429, 503):
+            break
+        await asyncio.sleep(_retry_after_seconds(response))
+        response = await _get_http_client().get(url, **kwargs)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
+async def _fetch_json(url: str, ttl: Optional[float] = None, **kwargs) -> Dict[str, Any]:
+    """GET a URL and return the decoded JSON body.
+    
+    Concurrent requests for the same URL share one upstream call. When ttl is
+    given, responses are also cached per URL for that many seconds.
+    """
+    if ttl:
+        cached = _nws_cache.get(url)
+        if cached is not None:
+            logger.info(f"NWS cache hit: {url}")
+            return cached
+    
+    data = await _single_flight(url, lambda: _get_json(url, **kwargs))
+    
+    if ttl:
+        _nws_cache.set(url, data, ttl=ttl)
+    return data
+
+
+# Map state abbreviations to FIPS codes
+STATE_FIPS = {
+    'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
+    'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
+    'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
+    'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
+    'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
+    'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
+    'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
+    'WI': '55', 'WY': '56'
+}
+
+# Census rows only change with each ACS release; keep per-state results for 24h
+# (BigQuery's own result cache window) and warm the states of the most-queried metros
+CENSUS_CACHE_TTL = 24 * 3600
+WARM_CENSUS_STATES = ("FL", "AZ", "TX", "LA", "NY")  # Miami, Phoenix, Houston, New Orleans, NYC
+_census_cache = TTLCache(maxsize=len(STATE_FIPS), ttl=CENSUS_CACHE_TTL)
+
+
+def _census_rows(state_code: str) -> Future:
+    """Future of the census tract rows for a state FIPS code (cached, shared by callers)"""
+    future = _census_cache.get(state_code)
+    if future is not None and not (future.done() and future.exception()):
+        return future
+    
+    job_config = bigquery.QueryJobConfig(query_parameters=[
+        bigquery.ScalarQueryParameter("state_fips", "STRING", state_code)
+    ])
+    future = _submit_query(CENSUS_DEMOGRAPHICS_SQL, job_config)
+    _census_cache.set(state_code, future)
+    return future
+
+
+def warm_bigquery_cache(states: Sequence[str] = WARM_CENSUS_STATES) -> None:
+    """Start census queries for common metros in the background (non-blocking)"""
+    for state in states:
+        _census_rows(STATE_FIPS[state])
+    logger.info(f"Warming census cache for {', '.join(states)}")
+
 
 # BigQuery Helper Functions for Historical Weather Data and Census Demographics
 @track_tool_call("get_census_demographics")
-def get_census_demographics(
+async def get_census_demographics(
     tool_context: ToolContext,
     city: str,
     state: str
@@ -105,51 +414,15 @@ def get_census_demographics(
     """
     try:
         # Query BigQuery census_bureau_acs dataset for city demographics
-        # Map state abbreviations to FIPS codes
-        state_fips = {
-            'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
-            'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
-            'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
-            'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
-            'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
-            'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
-            'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
-            'WI': '55', 'WY': '56'
-        }
-        
-        state_code = state_fips.get(state.upper())
+        state_code = STATE_FIPS.get(state.upper())
         if not state_code:
             return {
                 "status": "error",
                 "message": f"Invalid state abbreviation: {state}. Please use 2-letter state code (e.g., CA, TX, NY)"
             }
         
-        query = f"""
-        SELECT 
-            geo_id,
-            total_pop,
-            median_age,
-            median_income,
-            housing_units,
-            households,
-            male_pop,
-            female_pop,
-            white_pop,
-            black_pop,
-            asian_pop,
-            hispanic_pop,
-            bachelors_degree,
-            median_rent,
-            owner_occupied_housing_units,
-            housing_units_renter_occupied
-        FROM `bigquery-public-data.census_bureau_acs.censustract_2018_5yr` 
-        WHERE SUBSTR(geo_id, 1, 2) = '{state_code}'
-        LIMIT 100
-        """
-        
         logger.info(f"Querying census demographics for {city}, {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        results = await asyncio.wrap_future(_census_rows(state_code))
         
         demographics = []
         total_population = 0
@@ -224,7 +497,7 @@ def get_census_demographics(
 
 
 @track_tool_call("find_nearest_weather_station")
-def find_nearest_weather_station(
+async def find_nearest_weather_station(
     tool_context: ToolContext,
     latitude: float,
     longitude: float,
@@ -241,30 +514,13 @@ def find_nearest_weather_station(
         dict: Top 3 nearest weather stations with IDs, names, and distances
     """
     try:
-        # Query to find top 3 nearest stations using Euclidean distance
-        query = f"""
-        SELECT
-            usaf,
-            wban,
-            name,
-            state,
-            lat,
-            lon,
-            SQRT(POW((lat - {latitude}), 2) + POW((lon - ({longitude})), 2)) as distance
-        FROM
-            `bigquery-public-data.noaa_gsod.stations`
-        WHERE
-            state = '{state}'
-            AND lat IS NOT NULL
-            AND lon IS NOT NULL
-        ORDER BY
-            distance
-        LIMIT 3
-        """
-        
         logger.info(f"Finding top 3 nearest weather stations for coordinates ({latitude}, {longitude}) in {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("latitude", "FLOAT64", latitude),
+            bigquery.ScalarQueryParameter("longitude", "FLOAT64", longitude),
+            bigquery.ScalarQueryParameter("state", "STRING", state)
+        ])
+        results = await _run_query(NEAREST_STATIONS_SQL, job_config)
         
         stations = []
         for row in results:
@@ -304,7 +560,7 @@ def find_nearest_weather_station(
 
 
 @track_tool_call("query_historical_weather")
-def query_historical_weather(
+async def query_historical_weather(
     tool_context: ToolContext,
     usaf_ids: list,
     start_date: str,
@@ -320,37 +576,22 @@ def query_historical_weather(
     Returns:
         dict: Historical weather observations from the first station with data
     """
-    # Extract year from start_date for table suffix
-    start_year = start_date.split('-')[0]
-    end_year = end_date.split('-')[0]
-    table_suffix = "*"  # Use wildcard to cover multiple years
+    # Start every station query up front, then consume them in priority order
+    pending = {}
+    for usaf_id in usaf_ids:
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("usaf_id", "STRING", usaf_id),
+            bigquery.ScalarQueryParameter("start_date", "STRING", start_date),
+            bigquery.ScalarQueryParameter("end_date", "STRING", end_date)
+        ])
+        pending[usaf_id] = _submit_query(HISTORICAL_WEATHER_SQL, job_config)
     
     # Try each station in order until we get data
     for idx, usaf_id in enumerate(usaf_ids):
         try:
             logger.info(f"Attempting to query station #{idx+1}: {usaf_id}")
             
-            # Build query using USAF as stn field
-            query = f"""
-            SELECT 
-                CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') as date,
-                temp,
-                max,
-                min,
-                prcp,
-                sndp,
-                wdsp,
-                mxpsd
-            FROM `bigquery-public-data.noaa_gsod.gsod{table_suffix}`
-            WHERE stn = '{usaf_id}'
-                AND CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') 
-                    BETWEEN '{start_date}' AND '{end_date}'
-            ORDER BY year DESC, mo DESC, da DESC
-            LIMIT 100
-            """
-            
-            query_job = bq_client.query(query)
-            results = query_job.result()
+            results = await asyncio.wrap_future(pending[usaf_id])
             
             records = []
             for row in results:
@@ -374,6 +615,10 @@ def query_historical_weather(
                 
                 logger.info(f"Successfully retrieved {len(records)} records from station {usaf_id}")
                 
+                # Lower-priority stations are no longer needed
+                for future in pending.values():
+                    future.cancel()
+                
                 return {
                     "status": "success",
                     "usaf_id": usaf_id,
@@ -399,7 +644,7 @@ def query_historical_weather(
 
 
 @track_tool_call("get_weather_statistics")
-def get_weather_statistics(
+async def get_weather_statistics(
     tool_context: ToolContext,
     station_id: str,
     year: int,
@@ -416,32 +661,16 @@ def get_weather_statistics(
         dict: Weather statistics including averages and extremes
     """
     try:
-        if month:
-            date_filter = f"AND EXTRACT(MONTH FROM date) = {month}"
-            period = f"{year}-{month:02d}"
-        else:
-            date_filter = ""
-            period = str(year)
-        
-        query = f"""
-        SELECT 
-            AVG(temp) as avg_temp,
-            MAX(max) as highest_temp,
-            MIN(min) as lowest_temp,
-            AVG(prcp) as avg_precipitation,
-            SUM(prcp) as total_precipitation,
-            AVG(wdsp) as avg_wind_speed,
-            MAX(mxspd) as max_wind_speed,
-            COUNT(*) as days_recorded
-        FROM `bigquery-public-data.noaa_gsod.gsod{year}`
-        WHERE stn = '{station_id}'
-            {date_filter}
-        """
-        
-        query_job = bq_client.query(query)
-        results = query_job.result()
-        
-        row = next(results)
+        period = f"{year}-{month:02d}" if month else str(year)
+        
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("station_id", "STRING", station_id),
+            bigquery.ScalarQueryParameter("month", "INT64", month or None)
+        ])
+        # The yearly table name cannot be a query parameter; year is coerced to int
+        results = await _run_query(WEATHER_STATISTICS_SQL.format(year=int(year)), job_config)
+        
+        row = results[0]
         stats = {
             "station_id": station_id,
             "period": period,
@@ -472,8 +701,108 @@ def get_weather_statistics(
         }
 
 
+async def _fetch_forecast_url(latitude: float, longitude: float, period: str = "7day") -> str:
+    """NWS forecast URL of the grid cell containing a point (points lookup)"""
+    # Round to ~100 m so nearby requests share cache entries
+    points_url = f"{NWS_API_BASE}/points/{round(latitude, 3)},{round(longitude, 3)}"
+    points_data = await _fetch_json(points_url, ttl=NWS_CACHE_TTL["forecast"])
+    
+    if period == "hourly":
+        return points_data["properties"]["forecastHourly"]
+    return points_data["properties"]["forecast"]
+
+
+async def _fetch_forecast_json(latitude: float, longitude: float, period: str = "7day") -> Dict[str, Any]:
+    """Fetch the raw NWS forecast document for a point (points lookup + forecast)"""
+    forecast_url = await _fetch_forecast_url(latitude, longitude, period)
+    return await _fetch_json(forecast_url, ttl=NWS_CACHE_TTL["forecast"])
+
+
+async def _fetch_speculative_forecast(latitude: float, longitude: float, period: str) -> Tuple[str, Dict[str, Any]]:
+    """Forecast document for a point along with the grid cell's forecast URL it came from"""
+    forecast_url = await _fetch_forecast_url(latitude, longitude, period)
+    return forecast_url, await _fetch_json(forecast_url, ttl=NWS_CACHE_TTL["forecast"])
+
+
+# Approximate centroids of frequently queried cities, used to start a forecast
+# fetch speculatively while the authoritative geocode is still running
+CITY_CENTROIDS = {
+    "new york": (40.7128, -74.0060), "los angeles": (34.0522, -118.2437),
+    "chicago": (41.8781, -87.6298), "houston": (29.7604, -95.3698),
+    "phoenix": (33.4484, -112.0740), "philadelphia": (39.9526, -75.1652),
+    "san antonio": (29.4241, -98.4936), "san diego": (32.7157, -117.1611),
+    "dallas": (32.7767, -96.7970), "austin": (30.2672, -97.7431),
+    "jacksonville": (30.3322, -81.6557), "san jose": (37.3382, -121.8863),
+    "fort worth": (32.7555, -97.3308), "columbus": (39.9612, -82.9988),
+    "charlotte": (35.2271, -80.8431), "san francisco": (37.7749, -122.4194),
+    "indianapolis": (39.7684, -86.1581), "seattle": (47.6062, -122.3321),
+    "denver": (39.7392, -104.9903), "washington": (38.9072, -77.0369),
+    "boston": (42.3601, -71.0589), "nashville": (36.1627, -86.7816),
+    "oklahoma city": (35.4676, -97.5164), "las vegas": (36.1699, -115.1398),
+    "portland": (45.5152, -122.6784), "memphis": (35.1495, -90.0490),
+    "louisville": (38.2527, -85.7585), "baltimore": (39.2904, -76.6122),
+    "atlanta": (33.7490, -84.3880), "miami": (25.7617, -80.1918),
+    "tampa": (27.9506, -82.4572), "orlando": (28.5383, -81.3792),
+    "new orleans": (29.9511, -90.0715), "sacramento": (38.5816, -121.4944),
+    "kansas city": (39.0997, -94.5786), "minneapolis": (44.9778, -93.2650),
+    "detroit": (42.3314, -83.0458), "raleigh": (35.7796, -78.6382),
+    "salt lake city": (40.7608, -111.8910), "mountain view": (37.3861, -122.0839),
+}
+SPECULATION_RADIUS_KM = 5.0
+_speculative_forecasts: Dict[Tuple[float, float, str], Tuple[float, "asyncio.Task"]] = {}
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometers"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+def find_city_centroid(text: str) -> Optional[Tuple[float, float]]:
+    """Best-guess coordinates for the first known city named in text"""
+    lowered = text.casefold()
+    for city, centroid in CITY_CENTROIDS.items():
+        if city in lowered:
+            return centroid
+    return None
+
+
+def prefetch_forecast(latitude: float, longitude: float, period: str = "7day") -> None:
+    """Start fetching a forecast in the background (must run inside the event loop)"""
+    key = (latitude, longitude, period)
+    now = time.monotonic()
+    cached = _speculative_forecasts.get(key)
+    if cached and cached[0] > now:
+        return
+    task = asyncio.get_running_loop().create_task(_fetch_speculative_forecast(latitude, longitude, period))
+    # Retrieve failures so they are not reported as unhandled; the real call will refetch
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _speculative_forecasts[key] = (now + NWS_CACHE_TTL["forecast"], task)
+    logger.info(f"Speculatively prefetching {period} forecast for {latitude},{longitude}")
+
+
+def _take_speculative_forecast(latitude: float, longitude: float, period: str) -> Optional["asyncio.Task"]:
+    """Return a speculative fetch within SPECULATION_RADIUS_KM, dropping stale ones.
+    
+    The prefetch is for a city centroid, so the caller still has to check that it
+    resolved to the same grid cell before using it.
+    """
+    now = time.monotonic()
+    for key, (expires, task) in list(_speculative_forecasts.items()):
+        if expires <= now or (task.done() and (task.cancelled() or task.exception())):
+            del _speculative_forecasts[key]
+            continue
+        spec_lat, spec_lon, spec_period = key
+        if spec_period == period and _haversine_km(latitude, longitude, spec_lat, spec_lon) < SPECULATION_RADIUS_KM:
+            return task
+    return None
+
+
 @track_tool_call("get_nws_forecast")
-def get_nws_forecast(
+async def get_nws_forecast(
     tool_context: ToolContext,
     latitude: float,
     longitude: float,
@@ -490,22 +819,21 @@ def get_nws_forecast(
         dict: Forecast data with periods, temperatures, and conditions
     """
     try:
-        # Step 1: Get grid points for the location
-        points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-        points_response = requests.get(points_url, headers=NWS_HEADERS, timeout=10)
-        points_response.raise_for_status()
-        points_data = points_response.json()
-        
-        # Extract forecast URL
-        if period == "hourly":
-            forecast_url = points_data["properties"]["forecastHourly"]
-        else:
-            forecast_url = points_data["properties"]["forecast"]
-        
-        # Step 2: Get forecast data
-        forecast_response = requests.get(forecast_url, headers=NWS_HEADERS, timeout=10)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
+        speculative = _take_speculative_forecast(latitude, longitude, period)
+        forecast_url = await _fetch_forecast_url(latitude, longitude, period)
+        forecast_data = None
+        # Reuse a speculative prefetch for a nearby point only when it is for the
+        # same NWS grid cell (2.5 km), i.e. resolved to the same forecast URL
+        if speculative is not None:
+            try:
+                speculative_url, speculative_data = await speculative
+            except Exception:
+                speculative_url = speculative_data = None
+            if speculative_url == forecast_url:
+                logger.info(f"Using speculative forecast for {latitude},{longitude} ({forecast_url})")
+                forecast_data = speculative_data
+        if forecast_data is None:
+            forecast_data = await _fetch_json(forecast_url, ttl=NWS_CACHE_TTL["forecast"])
         
         # Extract and format forecast periods
         periods = []
@@ -549,7 +877,7 @@ def get_nws_forecast(
 
 
 @track_tool_call("get_hourly_forecast")
-def get_hourly_forecast(
+async def get_hourly_forecast(
     tool_context: ToolContext,
     latitude: float,
     longitude: float
@@ -563,11 +891,106 @@ def get_hourly_forecast(
     Returns:
         dict: Hourly forecast data
     """
-    return get_nws_forecast(tool_context, latitude, longitude, period="hourly")
+    return await get_nws_forecast(tool_context, latitude, longitude, period="hourly")
+
+
+# Cap on concurrent upstream requests issued by one batch tool call
+BATCH_CONCURRENCY = 16
+
+
+async def _batch(calls: Sequence[Awaitable[Any]], limit: int = BATCH_CONCURRENCY) -> List[Any]:
+    """Await many calls as one wave (at most `limit` in flight at a time).
+    
+    Completions are drained as they arrive; results come back in input order,
+    with failures returned as the exception instead of failing the batch.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def bounded(index: int, call: Awaitable[Any]) -> Tuple[int, Any]:
+        async with semaphore:
+            try:
+                return index, await call
+            except Exception as e:
+                return index, e
+    
+    results: List[Any] = [None] * len(calls)
+    for completed in asyncio.as_completed([bounded(i, call) for i, call in enumerate(calls)]):
+        index, result = await completed
+        results[index] = result
+    return results
+
+
+@track_tool_call("get_forecasts_for_locations")
+async def get_forecasts_for_locations(
+    tool_context: ToolContext,
+    locations: List[Dict[str, Any]],
+    period: str = "7day"
+) -> Dict[str, Any]:
+    """Get NWS forecasts for many points at once (e.g. towns or tracts along a storm path).
+    
+    Args:
+        locations (list): Dicts with 'latitude', 'longitude' and an optional 'name'
+        period (str): Forecast period - "7day" or "hourly"
+        
+    Returns:
+        dict: The next few forecast periods for each location, in input order
+    """
+    try:
+        responses = await _batch([
+            _fetch_forecast_json(float(loc["latitude"]), float(loc["longitude"]), period)
+            for loc in locations
+        ])
+        
+        forecasts = []
+        for loc, forecast_data in zip(locations, responses):
+            entry = {
+                "name": loc.get("name"),
+                "location": f"{loc['latitude']},{loc['longitude']}"
+            }
+            if isinstance(forecast_data, Exception):
+                entry["error"] = str(forecast_data)
+            else:
+                entry["periods"] = [
+                    {
+                        "name": period_data.get("name"),
+                        "temperature": period_data.get("temperature"),
+                        "temperature_unit": period_data.get("temperatureUnit"),
+                        "wind_speed": period_data.get("windSpeed"),
+                        "short_forecast": period_data.get("shortForecast"),
+                        "precipitation_probability": period_data.get("probabilityOfPrecipitation", {}).get("value")
+                    }
+                    for period_data in forecast_data["properties"]["periods"][:4]
+                ]
+            forecasts.append(entry)
+        
+        failed = sum(1 for entry in forecasts if "error" in entry)
+        
+        # Save to state
+        tool_context.state["forecasts_by_location"] = {
+            "forecasts": forecasts,
+            "count": len(forecasts),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        logger.info(f"Retrieved forecasts for {len(forecasts) - failed}/{len(forecasts)} locations")
+        
+        return {
+            "status": "success",
+            "forecasts": forecasts,
+            "count": len(forecasts),
+            "failed": failed
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting batch forecasts: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get forecasts: {str(e)}"
+        }
 
 
 @track_tool_call("get_nws_alerts")
-def get_nws_alerts(
+async def get_nws_alerts(
     tool_context: ToolContext,
     state: Optional[str] = None,
     latitude: Optional[float] = None,
@@ -588,16 +1011,14 @@ def get_nws_alerts(
     try:
         # Build alerts URL
         if latitude and longitude:
-            alerts_url = f"{NWS_API_BASE}/alerts/active?point={latitude},{longitude}"
+            alerts_url = f"{NWS_API_BASE}/alerts/active?point={round(latitude, 3)},{round(longitude, 3)}"
         elif state:
             alerts_url = f"{NWS_API_BASE}/alerts/active?area={state}"
         else:
             alerts_url = f"{NWS_API_BASE}/alerts/active"
         
         # Get alerts
-        alerts_response = requests.get(alerts_url, headers=NWS_HEADERS, timeout=10)
-        alerts_response.raise_for_status()
-        alerts_data = alerts_response.json()
+        alerts_data = await _fetch_json(alerts_url, ttl=NWS_CACHE_TTL["alerts"])
         
         # Extract and format alerts
         alerts = []
@@ -668,7 +1089,7 @@ def get_nws_alerts(
 
 
 @track_tool_call("get_current_conditions")
-def get_current_conditions(
+async def get_current_conditions(
     tool_context: ToolContext,
     station_id: str
 ) -> Dict[str, Any]:
@@ -683,9 +1104,7 @@ def get_current_conditions(
     try:
         # Get latest observation
         obs_url = f"{NWS_API_BASE}/stations/{station_id}/observations/latest"
-        obs_response = requests.get(obs_url, headers=NWS_HEADERS, timeout=10)
-        obs_response.raise_for_status()
-        obs_data = obs_response.json()
+        obs_data = await _fetch_json(obs_url, ttl=NWS_CACHE_TTL["conditions"])
         
         props = obs_data.get("properties", {})
         
@@ -724,7 +1143,7 @@ def get_current_conditions(
 
 
 @track_tool_call("get_hurricane_track")
-def get_hurricane_track(
+async def get_hurricane_track(
     tool_context: ToolContext,
     storm_id: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -741,9 +1160,12 @@ def get_hurricane_track(
         # Get active tropical cyclones
         active_storms_url = "https://www.nhc.noaa.gov/CurrentStorms.json"
         
-        response = requests.get(active_storms_url, timeout=15)
-        response.raise_for_status()
-        storms_data = response.json()
+        storms_data = await _fetch_json(
+            active_storms_url,
+            ttl=NWS_CACHE_TTL["hurricane"],
+            headers={"Accept": "application/json"},
+            timeout=15
+        )
         
         active_storms = []
         
@@ -852,9 +1274,31 @@ def get_hurricane_track(
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 GOOGLE_MAPS_BASE = "https://maps.googleapis.com/maps/api"
 
+# Geocoding results are effectively immutable, so successful lookups are kept
+# in a bounded in-process LRU keyed by the normalized address
+GEOCODE_CACHE_SIZE = 4096
+_geocode_cache = TTLCache(maxsize=GEOCODE_CACHE_SIZE)
+
+
+async def _get_maps_json(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """GET a Maps web service endpoint, sharing identical in-flight requests"""
+    async def request() -> Dict[str, Any]:
+        response = await _get_http_client().get(f"{GOOGLE_MAPS_BASE}/{endpoint}", params=params)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    # The API key is the same for every request - keep it out of the key (and logs)
+    key = (endpoint, tuple(sorted((k, v) for k, v in params.items() if k != "key")))
+    return await _single_flight(key, request)
+
+
+def _normalize_location(address: str) -> str:
+    """Normalize a free-text location for cache lookups"""
+    return " ".join(address.split()).casefold()
+
 
 @track_tool_call("geocode_address")
-def geocode_address(
+async def geocode_address(
     tool_context: ToolContext,
     address: str
 ) -> Dict[str, Any]:
@@ -873,16 +1317,24 @@ def geocode_address(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
+        cache_key = _normalize_location(address)
+        cached = _geocode_cache.get(cache_key)
+        if cached is not None:
+            geocode_result = {**cached, "address": address}
+            tool_context.state["geocode_result"] = geocode_result
+            logger.info(f"Geocode cache hit: {address} -> {cached['latitude']},{cached['longitude']}")
+            return {
+                "status": "success",
+                "result": geocode_result
+            }
+        
         # Call Google Maps Geocoding API
-        geocode_url = f"{GOOGLE_MAPS_BASE}/geocode/json"
         params = {
             "address": address,
             "key": GOOGLE_MAPS_API_KEY
         }
         
-        response = requests.get(geocode_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_maps_json("geocode/json", params)
         
         if data["status"] != "OK":
             return {
@@ -903,6 +1355,8 @@ def geocode_address(
             "types": result.get("types", [])
         }
         
+        _geocode_cache.set(cache_key, geocode_result)
+        
         # Save to state
         tool_context.state["geocode_result"] = geocode_result
         
@@ -922,7 +1376,7 @@ def geocode_address(
 
 
 @track_tool_call("get_directions")
-def get_directions(
+async def get_directions(
     tool_context: ToolContext,
     origin: str,
     destination: str,
@@ -948,7 +1402,6 @@ def get_directions(
             }
         
         # Call Google Maps Directions API
-        directions_url = f"{GOOGLE_MAPS_BASE}/directions/json"
         params = {
             "origin": origin,
             "destination": destination,
@@ -957,9 +1410,7 @@ def get_directions(
             "key": GOOGLE_MAPS_API_KEY
         }
         
-        response = requests.get(directions_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_maps_json("directions/json", params)
         
         if data["status"] != "OK":
             return {
@@ -1014,13 +1465,53 @@ def get_directions(
         }
 
 
+# Nearby-place results are bucketed by geohash cell (precision 6 is ~1.2 x 0.6 km),
+# so "shelters near X" for points a few blocks apart share one Places API call
+PLACES_GEOHASH_PRECISION = 6
+PLACES_CACHE_TTL = 3600
+_places_cache = TTLCache(maxsize=1024, ttl=PLACES_CACHE_TTL)
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def _geohash(latitude: float, longitude: float, precision: int) -> str:
+    """Encode a point as a geohash (interleaved lon/lat bisection, base32)"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    value, bits, even = 0, 0, True
+    while len(chars) < precision:
+        interval, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= mid:
+            value |= 1
+            interval[0] = mid
+        else:
+            interval[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            value, bits = 0, 0
+    return "".join(chars)
+
+
+def _places_cache_key(location: str, place_type: str, radius: int, keyword: Optional[str]) -> Optional[Tuple]:
+    """Cache key for a nearby search (None when location is not a "lat,lng" pair)"""
+    try:
+        latitude, longitude = (float(value) for value in location.split(","))
+    except ValueError:
+        return None
+    return (_geohash(latitude, longitude, PLACES_GEOHASH_PRECISION), place_type.casefold(), radius, keyword)
+
+
 @track_tool_call("search_nearby_places")
-def search_nearby_places(
+async def search_nearby_places(
     tool_context: ToolContext,
     location: str,
     place_type: str,
     radius: int = 5000,
-    keyword: Optional[str] = None
+    keyword: Optional[str] = None,
+    fresh: bool = False
 ) -> Dict[str, Any]:
     """Search for nearby places using Google Maps Places API.
     
@@ -1029,6 +1520,7 @@ def search_nearby_places(
         place_type (str): Type of place (e.g., "hospital", "shelter", "pharmacy", "gas_station")
         radius (int): Search radius in meters (default 5000m = 5km)
         keyword (str): Optional keyword to refine search (e.g., "emergency")
+        fresh (bool): Bypass cached results from the last hour (e.g. to re-check open shelters)
         
     Returns:
         dict: List of nearby places with details
@@ -1040,40 +1532,45 @@ def search_nearby_places(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Call Google Maps Places Nearby Search API
-        places_url = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
-        params = {
-            "location": location,
-            "radius": radius,
-            "type": place_type,
-            "key": GOOGLE_MAPS_API_KEY
-        }
-        
-        if keyword:
-            params["keyword"] = keyword
-        
-        response = requests.get(places_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] not in ["OK", "ZERO_RESULTS"]:
-            return {
-                "status": "error",
-                "message": f"Places search failed: {data.get('status')}"
+        cache_key = _places_cache_key(location, place_type, radius, keyword)
+        places = None if fresh or cache_key is None else _places_cache.get(cache_key)
+        if places is not None:
+            logger.info(f"Places cache hit: {place_type} near {location} (cell {cache_key[0]})")
+        else:
+            # Call Google Maps Places Nearby Search API
+            params = {
+                "location": location,
+                "radius": radius,
+                "type": place_type,
+                "key": GOOGLE_MAPS_API_KEY
             }
-        
-        # Extract places
-        places = []
-        for place in data.get("results", [])[:10]:  # Limit to 10 results
-            places.append({
-                "name": place.get("name"),
-                "address": place.get("vicinity"),
-                "location": place["geometry"]["location"],
-                "place_id": place.get("place_id"),
-                "types": place.get("types", []),
-                "rating": place.get("rating"),
-                "open_now": place.get("opening_hours", {}).get("open_now")
-            })
+            
+            if keyword:
+                params["keyword"] = keyword
+            
+            data = await _get_maps_json("place/nearbysearch/json", params)
+            
+            if data["status"] not in ["OK", "ZERO_RESULTS"]:
+                return {
+                    "status": "error",
+                    "message": f"Places search failed: {data.get('status')}"
+                }
+            
+            # Extract places
+            places = []
+            for place in data.get("results", [])[:10]:  # Limit to 10 results
+                places.append({
+                    "name": place.get("name"),
+                    "address": place.get("vicinity"),
+                    "location": place["geometry"]["location"],
+                    "place_id": place.get("place_id"),
+                    "types": place.get("types", []),
+                    "rating": place.get("rating"),
+                    "open_now": place.get("opening_hours", {}).get("open_now")
+                })
+            
+            if cache_key is not None:
+                _places_cache.set(cache_key, places)
         
         search_result = {
             "location": location,
@@ -1200,3 +1697,103 @@ def generate_map(
             "status": "error",
             "message": f"Failed to generate map: {str(e)}"
         }
+
+
+# Default weights for the hurricane evacuation priority score
+RISK_WEIGHTS = {"elderly_pct": 0.3, "flood_history": 0.4, "in_path": 0.3}
+
+
+def compute_risk_scores(columns: Sequence[Sequence[float]], weights: Sequence[float]) -> List[float]:
+    """Weighted sum of feature columns (SoA layout: one sequence per feature).
+    
+    With NumPy installed this is a single weights @ columns product; otherwise
+    it works a whole column at a time with C-level map() instead of a Python
+    loop per tract and feature.
+    """
+    if np is not None and columns:
+        return (np.asarray(weights, dtype=np.float64) @ np.asarray(columns, dtype=np.float64)).tolist()
+    scores = [0.0] * len(columns[0]) if columns else []
+    for column, weight in zip(columns, weights):
+        scores = list(map(operator.add, scores, map(operator.mul, column, repeat(weight))))
+    return scores
+
+
+def rank_by_score(scores: Sequence[float], top_k: Optional[int] = None) -> List[int]:
+    """Indices ordered by score, highest first (ties keep input order), optionally only top_k"""
+    count = len(scores) if top_k is None else max(0, min(top_k, len(scores)))
+    if np is not None and count:
+        negated = -np.asarray(scores, dtype=np.float64)
+        if count < len(scores):
+            # Partial selection of the top_k; ties at the cut go to the earliest
+            # indices, and sorting the candidates by index keeps ties in input order
+            threshold = np.partition(negated, count - 1)[count - 1]
+            above = np.flatnonzero(negated < threshold)
+            tied = np.flatnonzero(negated == threshold)[:count - len(above)]
+            candidates = np.sort(np.concatenate((above, tied)))
+            return candidates[np.argsort(negated[candidates], kind="stable")].tolist()
+        return np.argsort(negated, kind="stable").tolist()
+    return heapq.nsmallest(count, range(len(scores)), key=lambda i: -scores[i])
+
+
+@track_tool_call("score_tracts")
+def score_tracts(
+    tool_context: ToolContext,
+    tracts: List[Dict[str, Any]],
+    weights: Optional[Dict[str, float]] = None,
+    top_k: Optional[int] = None
+) -> Dict[str, Any]:
+    """Score and rank census tracts by evacuation risk in a single call.
+    
+    risk_score = elderly_pct × 0.3 + flood_history × 0.4 + in_path × 0.3 by default.
+    
+    Args:
+        tracts (list): Tracts to score, each with "geo_id" (or "name") and numeric
+            "elderly_pct", "flood_history" and "in_path" values (missing values count as 0)
+        weights (dict): Optional override of the feature weights
+        top_k (int): Optionally return only the top_k highest-risk tracts
+        
+    Returns:
+        dict: Tracts ranked by risk_score (highest first)
+    """
+    try:
+        if not tracts:
+            return {
+                "status": "error",
+                "message": "No tracts provided. Gather census and flood data first."
+            }
+        
+        weights = {**RISK_WEIGHTS, **(weights or {})}
+        
+        # Transpose tract records (AoS) into one column per feature (SoA)
+        columns = [
+            [float(tract.get(feature) or 0) for tract in tracts]
+            for feature in weights
+        ]
+        scores = compute_risk_scores(columns, list(weights.values()))
+        
+        ranked = [
+            {**tracts[i], "risk_score": round(scores[i], 3)}
+            for i in rank_by_score(scores, top_k)
+        ]
+        
+        tool_context.state["risk_scores"] = {
+            "ranked_tracts": ranked,
+            "weights": weights,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        logger.info(f"Scored {len(tracts)} census tracts")
+        
+        return {
+            "status": "success",
+            "ranked_tracts": ranked,
+            "count": len(ranked),
+            "weights": weights
+        }
+    
+    except Exception as e:
+        logger.error(f"Error scoring tracts: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to score tracts: {str(e)}"
+        }